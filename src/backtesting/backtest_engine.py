@@ -54,6 +54,7 @@ class BacktestEngine:
         self.trades = []
         self.portfolio_history = []
         self.performance_metrics = {}
+        self._backtest_period = {}
         
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
@@ -106,21 +107,64 @@ class BacktestEngine:
             
             self.logger.info("Backtest completed successfully")
             
-            return {
-                'trades': self.trades,
-                'portfolio_history': self.portfolio_history,
-                'performance_metrics': self.performance_metrics,
-                'backtest_period': {
-                    'start_date': backtest_data.iloc[0]['date'].strftime('%Y-%m-%d'),
+            self._backtest_period = {
+                'start_date': backtest_data.iloc[0]['date'].strftime('%Y-%m-%d'),
+                'end_date': backtest_data.iloc[-1]['date'].strftime('%Y-%m-%d'),
+                'total_days': len(backtest_data)
+            }
+            
+            return self._backtest_result()
+            
+        except Exception as e:
+            self.logger.error(f"Error in backtest: {str(e)}")
+            return {}
+    
+    def continue_backtest(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        직전 run_backtest의 상태(포트폴리오·포지션·거래 기록)에 이어서 다음 구간 백테스트
+        
+        앞 구간과 이어 붙인 데이터로 run_backtest를 실행한 것과 같은 결과를 반환
+        (초기 구간만 먼저 평가한 뒤 필요할 때만 나머지 구간을 이어서 평가할 때 사용)
+        
+        Args:
+            data: 직전 백테스트 마지막 날 다음부터의 통합 신호 데이터
+            
+        Returns:
+            전체 구간 백테스트 결과 딕셔너리
+        """
+        try:
+            if not self.portfolio_history:
+                return self.run_backtest(data)
+            
+            backtest_data = self._filter_date_range(data, None, None)
+            
+            if not backtest_data.empty:
+                for idx, row in backtest_data.iterrows():
+                    self._process_day(row, idx)
+                
+                self.performance_metrics = self._calculate_performance_metrics()
+                
+                self._backtest_period = {
+                    **self._backtest_period,
                     'end_date': backtest_data.iloc[-1]['date'].strftime('%Y-%m-%d'),
-                    'total_days': len(backtest_data)
+                    'total_days': self._backtest_period['total_days'] + len(backtest_data)
                 }
-            }
+            
+            return self._backtest_result()
             
         except Exception as e:
             self.logger.error(f"Error in backtest: {str(e)}")
             return {}
     
+    def _backtest_result(self) -> Dict[str, Any]:
+        """현재 상태로 백테스트 결과 딕셔너리 생성"""
+        return {
+            'trades': self.trades,
+            'portfolio_history': self.portfolio_history,
+            'performance_metrics': self.performance_metrics,
+            'backtest_period': dict(self._backtest_period)
+        }
+    
     def _filter_date_range(self, data: pd.DataFrame,
                           start_date: Optional[str],
                           end_date: Optional[str]) -> pd.DataFrame:
@@ -157,6 +201,10 @@ class BacktestEngine:
         self.trades = []
         self.portfolio_history = []
         
+        # 이전 실행에서 남은 포지션 제거 (같은 엔진으로 여러 번 백테스트할 때)
+        if self.risk_manager is not None:
+            self.risk_manager.close_position('BACKTEST')
+        
         # 초기 포트폴리오 상태
         initial_portfolio = {
             'date': data.iloc[0]['date'],
@@ -130,9 +130,9 @@ class IntegratedMacroAnalyzer:
             
             return {
                 'status': 'success',
-                'regime': regime_analysis.get('regime', EconomicRegime.NEUTRAL).value,
+                'regime': regime_analysis.get('regime', EconomicRegime.NEUTRAL).name,
                 'regime_confidence': regime_analysis.get('confidence', 0.0),
-                'risk_level': risk_analysis.get('risk_level', MarketRisk.MODERATE).value,
+                'risk_level': risk_analysis.get('risk_level', MarketRisk.MODERATE).name,
                 'risk_confidence': risk_analysis.get('confidence', 0.0),
                 'equity_signal': signals.get('equity_signal', 0),
                 'signal_strength': signals.get('signal_strength', 0.0),
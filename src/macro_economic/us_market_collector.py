@@ -10,16 +10,563 @@ import logging
 from datetime import datetime, timedelta
 import sys
 import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터 대체 (순수 파이썬 실행)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+
+def _init_logger() -> logging.Logger:
+    """모듈 로거 설정 (import 시 한 번만 핸들러 등록)"""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    return logger
+
+
+_LOGGER = _init_logger()
+
+# 메모리 캐시 최대 항목 수 (심볼, 기간, 간격 조합)
+_MEM_CACHE_SIZE = 128
+
+# 심볼별 개별 수집 시 최대 스레드 수
+_MAX_FETCH_WORKERS = 16
+
+# float32로 저장할 가격/거래량 컬럼 (지표 계산은 float64로 누적)
+_FLOAT32_COLUMNS = ('open', 'high', 'low', 'close', 'adj_close', 'volume')
+
+@njit(cache=True)
+def _rsi_wilder(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder 평활 RSI (단일 패스, O(n))
+    
+    첫 window개 가격 변화의 단순 평균으로 시작해 이후 (avg*(w-1)+x)/w로 갱신.
+    NaN 가격 변화는 상승/하락 0으로 처리. float32 입력도 float64로 누적.
+    """
+    n = prices.shape[0]
+    out = np.full(n, np.nan)
+    if n <= window:
+        return out
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        d = np.float64(prices[i]) - np.float64(prices[i - 1])
+        if d > 0:
+            avg_gain += d
+        elif d < 0:
+            avg_loss -= d
+    avg_gain /= window
+    avg_loss /= window
+    
+    for i in range(window, n):
+        if i > window:
+            d = np.float64(prices[i]) - np.float64(prices[i - 1])
+            gain = d if d > 0 else 0.0
+            loss = -d if d < 0 else 0.0
+            avg_gain = (avg_gain * (window - 1) + gain) / window
+            avg_loss = (avg_loss * (window - 1) + loss) / window
+        
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    
+    return out
+
+
+# 통합 커널 출력 지표 순서 (out[:, 컬럼, 지표])
+_KERNEL_INDICATORS = (
+    'daily_return', 'cumulative_return', 'ma5', 'ma20', 'ma60',
+    'volatility', 'momentum_20', 'momentum_60', 'rsi', 'up_days_ratio'
+)
+
+
+# 지표별 최소 데이터 행 수 (미만이면 값이 전부 NaN이므로 계산 생략)
+_INDICATOR_MIN_ROWS = {
+    'daily_return': 1,
+    'cumulative_return': 1,
+    'ma5': 5,
+    'ma20': 20,
+    'ma60': 60,
+    'volatility': 21,
+    'momentum_20': 21,
+    'momentum_60': 61,
+    'rsi': 15,
+    'up_days_ratio': 20,
+}
+
+# S&P 500 / 나스닥 상관관계 창 길이
+_CORRELATION_WINDOW = 60
+
+
+@njit(cache=True)
+def _sliding_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    이동평균 (슬라이딩 합계, O(n))
+    창 안에 NaN이 있거나 데이터가 부족하면 NaN (pandas rolling과 동일)
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    valid = 0
+    for i in range(n):
+        v = x[i]
+        if v == v:
+            total += v
+            valid += 1
+        if i >= window:
+            old = x[i - window]
+            if old == old:
+                total -= old
+                valid -= 1
+        if i >= window - 1 and valid == window:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def _sliding_std(x: np.ndarray, window: int) -> np.ndarray:
+    """이동 표본 표준편차 (ddof=1, 합계·제곱합 슬라이딩 갱신, O(n))"""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    s1 = 0.0
+    s2 = 0.0
+    valid = 0
+    for i in range(n):
+        v = x[i]
+        if v == v:
+            s1 += v
+            s2 += v * v
+            valid += 1
+        if i >= window:
+            old = x[i - window]
+            if old == old:
+                s1 -= old
+                s2 -= old * old
+                valid -= 1
+        if i >= window - 1 and valid == window and window > 1:
+            var = (s2 - s1 * s1 / window) / (window - 1)
+            out[i] = np.sqrt(var) if var > 0 else 0.0
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def _sliding_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """이동 상관계수 (두 값이 모두 있는 쌍만 사용, 슬라이딩 합계, O(n))"""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    sx = 0.0
+    sy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    valid = 0
+    for i in range(n):
+        a = x[i]
+        b = y[i]
+        if a == a and b == b:
+            sx += a
+            sy += b
+            sxx += a * a
+            syy += b * b
+            sxy += a * b
+            valid += 1
+        if i >= window:
+            a = x[i - window]
+            b = y[i - window]
+            if a == a and b == b:
+                sx -= a
+                sy -= b
+                sxx -= a * a
+                syy -= b * b
+                sxy -= a * b
+                valid -= 1
+        if i >= window - 1 and valid == window:
+            cov = sxy - sx * sy / window
+            var_x = sxx - sx * sx / window
+            var_y = syy - sy * sy / window
+            if var_x > 0 and var_y > 0:
+                out[i] = min(1.0, max(-1.0, cov / np.sqrt(var_x * var_y)))
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def _compute_indicators(prices: np.ndarray, out: np.ndarray) -> None:
+    """
+    가격 컬럼별 지표를 한 번에 계산
+    
+    Args:
+        prices: (n, k) 가격 배열 (float32/float64)
+        out: (n, k, len(_KERNEL_INDICATORS)) float64 출력 배열
+    """
+    n, k = prices.shape
+    for c in range(k):
+        # 컬럼 단위로 float64 변환 후 누적 (입력은 float32로 읽어 메모리 대역폭 절감)
+        p = prices[:, c].astype(np.float64)
+        ret = np.full(n, np.nan)
+        up = np.zeros(n)
+        
+        for i in range(1, n):
+            ret[i] = (p[i] / p[i - 1] - 1.0) * 100
+            if ret[i] > 0:
+                up[i] = 1.0
+        
+        ma5 = _sliding_mean(p, 5)
+        ma20 = _sliding_mean(p, 20)
+        ma60 = _sliding_mean(p, 60)
+        volatility = _sliding_std(ret, 20)
+        up_ratio = _sliding_mean(up, 20)
+        rsi = _rsi_wilder(p, 14)
+        
+        for i in range(n):
+            out[i, c, 0] = ret[i]
+            out[i, c, 1] = (p[i] / p[0] - 1.0) * 100
+            out[i, c, 2] = ma5[i]
+            out[i, c, 3] = ma20[i]
+            out[i, c, 4] = ma60[i]
+            out[i, c, 5] = volatility[i]
+            out[i, c, 6] = (p[i] / p[i - 20] - 1.0) * 100 if i >= 20 else np.nan
+            out[i, c, 7] = (p[i] / p[i - 60] - 1.0) * 100 if i >= 60 else np.nan
+            out[i, c, 8] = rsi[i]
+            out[i, c, 9] = up_ratio[i] * 100
+
+
+def _indicators_polars(prices: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Polars lazy 표현식으로 가격 컬럼별 지표 계산 (RSI 제외)
+    
+    Args:
+        prices: 기준 이름을 컬럼으로 하는 가격 DataFrame
+        
+    Returns:
+        {지표명: DataFrame} (컬럼은 prices와 동일)
+    """
+    exprs = []
+    for c in prices.columns:
+        price = pl.col(c).cast(pl.Float64)
+        daily_return = price.pct_change() * 100
+        exprs.extend([
+            daily_return.alias(f'{c}\tdaily_return'),
+            ((price / price.first() - 1) * 100).alias(f'{c}\tcumulative_return'),
+            price.rolling_mean(window_size=5).alias(f'{c}\tma5'),
+            price.rolling_mean(window_size=20).alias(f'{c}\tma20'),
+            price.rolling_mean(window_size=60).alias(f'{c}\tma60'),
+            daily_return.rolling_std(window_size=20).alias(f'{c}\tvolatility'),
+            (price.pct_change(20) * 100).alias(f'{c}\tmomentum_20'),
+            (price.pct_change(60) * 100).alias(f'{c}\tmomentum_60'),
+            ((daily_return > 0).fill_null(False).cast(pl.Float64)
+             .rolling_sum(window_size=20) / 20 * 100).alias(f'{c}\tup_days_ratio'),
+        ])
+    
+    computed = (
+        pl.from_pandas(prices.reset_index(drop=True))
+        .lazy()
+        .select(exprs)
+        .collect()
+    )
+    computed = pd.DataFrame(
+        computed.to_numpy().astype(np.float64, copy=False),
+        index=prices.index, columns=computed.columns
+    )
+    
+    indicators = {}
+    for name in _KERNEL_INDICATORS:
+        columns = [f'{c}\t{name}' for c in prices.columns]
+        if columns[0] in computed.columns:
+            indicators[name] = computed[columns].set_axis(list(prices.columns), axis=1)
+    return indicators
+
+
+def _rolling_mean(frame: pd.DataFrame, window: int) -> pd.DataFrame:
+    """이동평균 (bottleneck 사용 가능 시 move_sum / window, 결과는 pandas rolling과 동일)"""
+    if not BOTTLENECK_AVAILABLE:
+        return frame.rolling(window=window).mean()
+    
+    values = frame.to_numpy(dtype=np.float64)
+    if window > len(values):
+        return pd.DataFrame(np.nan, index=frame.index, columns=frame.columns)
+    return pd.DataFrame(
+        bn.move_sum(values, window=window, min_count=window, axis=0) / window,
+        index=frame.index, columns=frame.columns
+    )
+
+
+def _rolling_std(frame: pd.DataFrame, window: int) -> pd.DataFrame:
+    """이동 표준편차 (ddof=1, bottleneck 사용 가능 시 move_std)"""
+    if not BOTTLENECK_AVAILABLE:
+        return frame.rolling(window=window).std()
+    
+    values = frame.to_numpy(dtype=np.float64)
+    if window > len(values):
+        return pd.DataFrame(np.nan, index=frame.index, columns=frame.columns)
+    return pd.DataFrame(
+        bn.move_std(values, window=window, min_count=window, ddof=1, axis=0),
+        index=frame.index, columns=frame.columns
+    )
+
+
+def _rolling_corr(x: pd.Series, y: pd.Series, window: int) -> pd.Series:
+    """이동 상관계수 (두 값이 모두 있는 구간만 사용, numba/bottleneck 사용 가능 시 이동 합계로 계산)"""
+    if NUMBA_AVAILABLE:
+        return pd.Series(
+            _sliding_corr(x.to_numpy(dtype=np.float64), y.to_numpy(dtype=np.float64), window),
+            index=x.index
+        )
+    
+    if not BOTTLENECK_AVAILABLE:
+        return x.rolling(window=window).corr(y)
+    
+    xv = x.to_numpy(dtype=np.float64)
+    yv = y.to_numpy(dtype=np.float64)
+    if window > len(xv):
+        return pd.Series(np.nan, index=x.index)
+    
+    valid = ~(np.isnan(xv) | np.isnan(yv))
+    xv = np.where(valid, xv, np.nan)
+    yv = np.where(valid, yv, np.nan)
+    
+    mean_x = bn.move_mean(xv, window=window, min_count=window)
+    mean_y = bn.move_mean(yv, window=window, min_count=window)
+    cov = bn.move_mean(xv * yv, window=window, min_count=window) - mean_x * mean_y
+    var_x = bn.move_mean(xv * xv, window=window, min_count=window) - mean_x * mean_x
+    var_y = bn.move_mean(yv * yv, window=window, min_count=window) - mean_y * mean_y
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.sqrt(var_x * var_y)
+    return pd.Series(np.clip(corr, -1.0, 1.0), index=x.index)
+
+
+# 시장 체제 이름 (동점 시 앞선 체제 선택)
+_REGIME_NAMES = ('BULL_MARKET', 'BEAR_MARKET', 'SIDEWAYS', 'HIGH_VOLATILITY', 'TECH_LED')
+
+# 체제 분석 신호 → 체제 매핑 (None: 집계에서 제외)
+_SIGNAL_TO_REGIME = {
+    'bull_market': 'BULL_MARKET',
+    'uptrend': 'BULL_MARKET',
+    'strong_market': 'BULL_MARKET',
+    'bear_market': 'BEAR_MARKET',
+    'downtrend': 'BEAR_MARKET',
+    'weak_market': 'BEAR_MARKET',
+    'sideways': 'SIDEWAYS',
+    'high_volatility': 'HIGH_VOLATILITY',
+    'medium_volatility': 'HIGH_VOLATILITY',
+    'tech_leadership': 'TECH_LED',
+    'low_volatility': None,
+    'broad_market_leadership': None,
+}
+
+_SIGNAL_NAMES = tuple(_SIGNAL_TO_REGIME)
+_SIGNAL_INDEX = {name: i for i, name in enumerate(_SIGNAL_NAMES)}
+
+
+def _build_signal_regime_matrix() -> np.ndarray:
+    """(신호 수, 체제 수) 0/1 매핑 행렬 생성"""
+    matrix = np.zeros((len(_SIGNAL_NAMES), len(_REGIME_NAMES)))
+    for name, regime in _SIGNAL_TO_REGIME.items():
+        if regime is not None:
+            matrix[_SIGNAL_INDEX[name], _REGIME_NAMES.index(regime)] = 1.0
+    return matrix
+
+
+_SIGNAL_REGIME_MATRIX = _build_signal_regime_matrix()
+
+
+def _price_values(prices) -> np.ndarray:
+    """가격 배열 추출 (전부 float32면 그대로, 아니면 float64로 변환)"""
+    dtypes = [prices.dtype] if isinstance(prices, pd.Series) else list(prices.dtypes)
+    if dtypes and all(dtype == np.float32 for dtype in dtypes):
+        return prices.to_numpy()
+    return prices.to_numpy(dtype=np.float64)
+
+
+# 시장 체제 분석 임계값
+_MOMENTUM_TREND_THRESHOLD = 10.0      # S&P 500 60일 모멘텀 강세/약세 기준 (%)
+_VIX_HIGH_THRESHOLD = 30.0            # VIX 고변동성 기준
+_VIX_MEDIUM_THRESHOLD = 20.0          # VIX 중간 변동성 기준
+_LEADERSHIP_GAP_THRESHOLD = 5.0       # 나스닥/S&P 500 모멘텀 격차 기준 (%p)
+_UP_RATIO_STRONG_THRESHOLD = 60.0     # 상승일 비율 강세 기준 (%)
+_UP_RATIO_WEAK_THRESHOLD = 40.0       # 상승일 비율 약세 기준 (%)
+
+# 시장 체제 분석 신호 가중치
+_MOMENTUM_TREND_WEIGHT = 0.8
+_MOMENTUM_SIDEWAYS_WEIGHT = 0.5
+_VIX_HIGH_WEIGHT = 0.7
+_VIX_MEDIUM_WEIGHT = 0.5
+_VIX_LOW_WEIGHT = 0.6
+_LEADERSHIP_WEIGHT = 0.6
+_MA_TREND_WEIGHT = 0.7
+_MA_SIDEWAYS_WEIGHT = 0.4
+_UP_RATIO_WEIGHT = 0.6
+
+# 신호 인덱스 (numba 커널에서 상수로 사용)
+_SIG_BULL_MARKET = _SIGNAL_INDEX['bull_market']
+_SIG_BEAR_MARKET = _SIGNAL_INDEX['bear_market']
+_SIG_SIDEWAYS = _SIGNAL_INDEX['sideways']
+_SIG_HIGH_VOLATILITY = _SIGNAL_INDEX['high_volatility']
+_SIG_MEDIUM_VOLATILITY = _SIGNAL_INDEX['medium_volatility']
+_SIG_LOW_VOLATILITY = _SIGNAL_INDEX['low_volatility']
+_SIG_TECH_LEADERSHIP = _SIGNAL_INDEX['tech_leadership']
+_SIG_BROAD_LEADERSHIP = _SIGNAL_INDEX['broad_market_leadership']
+_SIG_UPTREND = _SIGNAL_INDEX['uptrend']
+_SIG_DOWNTREND = _SIGNAL_INDEX['downtrend']
+_SIG_STRONG_MARKET = _SIGNAL_INDEX['strong_market']
+_SIG_WEAK_MARKET = _SIGNAL_INDEX['weak_market']
+
+# 체제 분석 단계 수 (단계별 최대 1개 신호)
+_REGIME_CHECKS = 5
+
+
+@njit(cache=True)
+def _analyze_regime_core(sp500_momentum: float,
+                         vix_level: float,
+                         nasdaq_momentum: float,
+                         price: float,
+                         ma20: float,
+                         ma60: float,
+                         up_ratio: float,
+                         has_ma: bool,
+                         regime_matrix: np.ndarray):
+    """
+    시장 체제 스칼라 판정 (NaN은 해당 지표 없음으로 처리)
+    
+    Args:
+        sp500_momentum ~ up_ratio: 최신 지표 값 (없으면 NaN)
+        has_ma: 이동평균 트렌드 컬럼 존재 여부 (값이 NaN이면 횡보)
+        regime_matrix: (신호 수, 체제 수) 신호 → 체제 매핑 행렬
+        
+    Returns:
+        (체제 인덱스, 신뢰도, 체제 점수, 신호 인덱스(-1: 없음), 신호 가중치)
+    """
+    codes = np.full(_REGIME_CHECKS, -1, dtype=np.int64)
+    weights = np.zeros(_REGIME_CHECKS)
+    
+    # 1. S&P 500 트렌드 분석
+    if sp500_momentum == sp500_momentum:
+        if sp500_momentum > _MOMENTUM_TREND_THRESHOLD:
+            codes[0] = _SIG_BULL_MARKET
+            weights[0] = _MOMENTUM_TREND_WEIGHT
+        elif sp500_momentum < -_MOMENTUM_TREND_THRESHOLD:
+            codes[0] = _SIG_BEAR_MARKET
+            weights[0] = _MOMENTUM_TREND_WEIGHT
+        else:
+            codes[0] = _SIG_SIDEWAYS
+            weights[0] = _MOMENTUM_SIDEWAYS_WEIGHT
+    
+    # 2. VIX 분석 (공포 지수)
+    if vix_level == vix_level:
+        if vix_level > _VIX_HIGH_THRESHOLD:
+            codes[1] = _SIG_HIGH_VOLATILITY
+            weights[1] = _VIX_HIGH_WEIGHT
+        elif vix_level > _VIX_MEDIUM_THRESHOLD:
+            codes[1] = _SIG_MEDIUM_VOLATILITY
+            weights[1] = _VIX_MEDIUM_WEIGHT
+        else:
+            codes[1] = _SIG_LOW_VOLATILITY
+            weights[1] = _VIX_LOW_WEIGHT
+    
+    # 3. 시장 폭 분석 (나스닥 vs S&P 500)
+    if nasdaq_momentum == nasdaq_momentum and sp500_momentum == sp500_momentum:
+        if nasdaq_momentum > sp500_momentum + _LEADERSHIP_GAP_THRESHOLD:
+            codes[2] = _SIG_TECH_LEADERSHIP
+            weights[2] = _LEADERSHIP_WEIGHT
+        elif sp500_momentum > nasdaq_momentum + _LEADERSHIP_GAP_THRESHOLD:
+            codes[2] = _SIG_BROAD_LEADERSHIP
+            weights[2] = _LEADERSHIP_WEIGHT
+    
+    # 4. 이동평균 트렌드 (NaN은 비교 결과가 거짓이므로 횡보로 처리)
+    if has_ma:
+        if price > ma20 and ma20 > ma60:
+            codes[3] = _SIG_UPTREND
+            weights[3] = _MA_TREND_WEIGHT
+        elif price < ma20 and ma20 < ma60:
+            codes[3] = _SIG_DOWNTREND
+            weights[3] = _MA_TREND_WEIGHT
+        else:
+            codes[3] = _SIG_SIDEWAYS
+            weights[3] = _MA_SIDEWAYS_WEIGHT
+    
+    # 5. 시장 강도 (상승일 비율)
+    if up_ratio == up_ratio:
+        if up_ratio > _UP_RATIO_STRONG_THRESHOLD:
+            codes[4] = _SIG_STRONG_MARKET
+            weights[4] = _UP_RATIO_WEIGHT
+        elif up_ratio < _UP_RATIO_WEAK_THRESHOLD:
+            codes[4] = _SIG_WEAK_MARKET
+            weights[4] = _UP_RATIO_WEIGHT
+    
+    # 신호 집계 (매핑되지 않은 신호는 행렬 행이 0)
+    scores = np.zeros(regime_matrix.shape[1])
+    total_weight = 0.0
+    for i in range(_REGIME_CHECKS):
+        if codes[i] >= 0:
+            row = regime_matrix[codes[i]]
+            scores += row * weights[i]
+            total_weight += row.sum() * weights[i]
+    
+    # 정규화
+    if total_weight > 0:
+        scores /= total_weight
+    
+    # 최고 점수 체제 선택 (동점 시 앞선 체제)
+    best = int(np.argmax(scores))
+    return best, scores[best], scores, codes, weights
+
+
 class USMarketCollector:
     """미국 시장 데이터 수집기"""
     
-    def __init__(self):
-        """초기화"""
-        self.logger = self._setup_logger()
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 cache_ttl: float = 86400):
+        """
+        초기화
+        
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (기본: ~/.cache/us_market)
+            cache_ttl: 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
+        """
+        self.logger = _LOGGER
+        
+        # 수집 데이터 캐시 {(symbol, period, interval): (수집 시각, DataFrame)}
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'us_market')
+        self.cache_ttl = cache_ttl
+        self._mem_cache: 'OrderedDict[Tuple[str, str, str], Tuple[float, pd.DataFrame]]' = OrderedDict()
         
         # 주요 미국 지수 및 지표 심볼
         self.symbols = {
@@ -58,27 +605,104 @@ class USMarketCollector:
             'tsla': 'TSLA',          # Tesla
         }
         
+        # 심볼 → 심볼 키 역방향 조회
+        self._symbol_to_key = {symbol: symbol_key for symbol_key, symbol in self.symbols.items()}
+        
+        # Yahoo Finance 컬럼명 → 소문자 컬럼명 (고정 스키마)
+        self._column_rename_map = {
+            'Date': 'date',
+            'Datetime': 'datetime',
+            'Open': 'open',
+            'High': 'high',
+            'Low': 'low',
+            'Close': 'close',
+            'Adj Close': 'adj_close',
+            'Volume': 'volume',
+            'Dividends': 'dividends',
+            'Stock Splits': 'stock_splits',
+            'Capital Gains': 'capital_gains',
+        }
+        
         self.logger.info("미국 시장 데이터 수집기 초기화 완료")
     
-    def _setup_logger(self) -> logging.Logger:
-        """로거 설정"""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
+    def _cache_path(self, symbol: str, period: str, interval: str) -> str:
+        """디스크 캐시 파일 경로"""
+        safe_symbol = re.sub(r'[^A-Za-z0-9_.-]', '_', symbol)
+        return os.path.join(self.cache_dir, f"{safe_symbol}_{period}_{interval}.pkl")
+    
+    def _get_cached(self, symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """유효한 캐시 데이터 조회 (메모리 → 디스크 순)"""
+        if self.cache_ttl <= 0:
+            return None
         
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        key = (symbol, period, interval)
+        now = time.time()
         
-        return logger
+        cached = self._mem_cache.get(key)
+        if cached is not None:
+            fetched_at, data = cached
+            if now - fetched_at < self.cache_ttl:
+                self._mem_cache.move_to_end(key)
+                return data.copy()
+            del self._mem_cache[key]
+        
+        path = self._cache_path(symbol, period, interval)
+        try:
+            fetched_at = os.path.getmtime(path)
+        except OSError:
+            # 디스크 캐시 없음
+            return None
+        
+        if now - fetched_at >= self.cache_ttl:
+            return None
+        
+        try:
+            data = pd.read_pickle(path)
+        except Exception as e:
+            # 손상된 캐시(잘린 파일 등)는 삭제하고 다시 다운로드
+            self.logger.debug(f"캐시 로드 실패 {path}: {str(e)}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        
+        self._remember(key, fetched_at, data)
+        return data.copy()
+    
+    def _remember(self, key: Tuple[str, str, str], fetched_at: float, data: pd.DataFrame) -> None:
+        """메모리 캐시 저장 (LRU)"""
+        self._mem_cache[key] = (fetched_at, data)
+        self._mem_cache.move_to_end(key)
+        while len(self._mem_cache) > _MEM_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+    
+    def _store_cached(self, symbol: str, period: str, interval: str, data: pd.DataFrame) -> None:
+        """수집 데이터 캐시 저장 (메모리 + 디스크)"""
+        if self.cache_ttl <= 0:
+            return
+        
+        self._remember((symbol, period, interval), time.time(), data.copy())
+        
+        # 같은 디렉토리 임시 파일에 기록 후 교체 (중단·동시 실행 시 잘린 캐시 파일 방지)
+        path = self._cache_path(symbol, period, interval)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            data.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.debug(f"캐시 저장 실패 {symbol}: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
     
     def get_market_data(self, 
                        symbol_keys: List[str],
                        period: str = "1y",
-                       interval: str = "1d") -> Dict[str, pd.DataFrame]:
+                       interval: str = "1d",
+                       columns: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
         """
         미국 시장 데이터 수집
         
@@ -86,6 +710,7 @@ class USMarketCollector:
             symbol_keys: 수집할 심볼 키 리스트 (self.symbols의 키)
             period: 데이터 기간 ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
             interval: 데이터 간격 ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo")
+            columns: 반환할 가격 컬럼 (예: ['close'], 기본: 전체 OHLCV)
             
         Returns:
             {symbol_key: DataFrame} 형태의 딕셔너리
@@ -93,36 +718,42 @@ class USMarketCollector:
         try:
             results = {}
             
+            # 심볼 키 → 심볼 매핑 (지원하지 않는 키 제외)
+            key_by_symbol = {}
             for symbol_key in symbol_keys:
                 if symbol_key not in self.symbols:
                     self.logger.warning(f"지원하지 않는 심볼 키: {symbol_key}")
                     continue
-                
-                symbol = self.symbols[symbol_key]
-                
-                try:
-                    self.logger.info(f"미국 시장 데이터 수집: {symbol_key} ({symbol})")
-                    
-                    ticker = yf.Ticker(symbol)
-                    data = ticker.history(period=period, interval=interval)
-                    
-                    if not data.empty:
-                        # 인덱스를 date 컬럼으로 변환
-                        data = data.reset_index()
-                        data['symbol_key'] = symbol_key
-                        data['symbol'] = symbol
-                        
-                        # 컬럼명 소문자로 통일
-                        data.columns = [col.lower().replace(' ', '_') for col in data.columns]
-                        
-                        results[symbol_key] = data
-                        self.logger.info(f"데이터 수집 완료: {symbol_key} ({len(data)}개 레코드)")
-                    else:
-                        self.logger.warning(f"데이터 없음: {symbol_key}")
-                        
-                except Exception as e:
-                    self.logger.error(f"데이터 수집 오류 {symbol_key}: {str(e)}")
-                    continue
+                key_by_symbol[self.symbols[symbol_key]] = symbol_key
+            
+            if not key_by_symbol:
+                return results
+            
+            # 캐시에 있는 심볼은 재수집하지 않음
+            cached_data = {}
+            for symbol in key_by_symbol:
+                data = self._get_cached(symbol, period, interval)
+                if data is not None:
+                    cached_data[symbol] = data
+            
+            to_download = {symbol: symbol_key for symbol, symbol_key in key_by_symbol.items()
+                           if symbol not in cached_data}
+            downloaded_data = self._download(to_download, period, interval) if to_download else {}
+            
+            for symbol, symbol_key in key_by_symbol.items():
+                if symbol in cached_data:
+                    results[symbol_key] = cached_data[symbol]
+                elif symbol in downloaded_data:
+                    results[symbol_key] = downloaded_data[symbol]
+                    self._store_cached(symbol, period, interval, downloaded_data[symbol])
+            
+            if cached_data:
+                self.logger.info(f"캐시 사용: {len(cached_data)}개 심볼")
+            
+            # 캐시에는 전체 컬럼을 저장하고 반환 시에만 필요한 컬럼으로 축소
+            if columns is not None:
+                results = {symbol_key: self._select_columns(data, columns)
+                           for symbol_key, data in results.items()}
             
             self.logger.info(f"미국 시장 데이터 수집 완료: {len(results)}개 심볼")
             return results
@@ -131,6 +762,168 @@ class USMarketCollector:
             self.logger.error(f"미국 시장 데이터 수집 오류: {str(e)}")
             return {}
     
+    def _download(self,
+                  key_by_symbol: Dict[str, str],
+                  period: str,
+                  interval: str) -> Dict[str, pd.DataFrame]:
+        """
+        심볼 일괄 다운로드
+        
+        Args:
+            key_by_symbol: {symbol: symbol_key} 수집 대상
+            period: 데이터 기간
+            interval: 데이터 간격
+            
+        Returns:
+            {symbol: DataFrame} 형태의 딕셔너리 (수집 실패 심볼 제외)
+        """
+        # 분봉/시간봉은 심볼별 거래 시각이 달라 일괄 수집 결과 정렬이 번거로우므로 개별 수집
+        if self._is_intraday(interval):
+            return self._download_per_symbol(key_by_symbol, period, interval)
+        
+        results = {}
+        symbols = list(key_by_symbol)
+        self.logger.info(f"미국 시장 데이터 일괄 수집: {len(symbols)}개 심볼 ({' '.join(symbols)})")
+        
+        # 전체 심볼을 한 번의 요청으로 수집 (yfinance 내부 스레드 사용)
+        # auto_adjust=True: 배당/분할 수정주가 유지 (False면 close가 미수정 가격으로 바뀌어 수익률 지표 왜곡)
+        # actions=False: 배당/분할 컬럼은 사용하지 않으므로 수집하지 않음
+        raw_data = yf.download(
+            tickers=' '.join(symbols),
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            auto_adjust=True,
+            actions=False,
+            threads=True,
+            progress=False
+        )
+        
+        if raw_data is None or raw_data.empty:
+            self.logger.warning("미국 시장 데이터 없음")
+            return results
+        
+        is_multi = isinstance(raw_data.columns, pd.MultiIndex)
+        downloaded = set(raw_data.columns.get_level_values(0)) if is_multi else set(symbols)
+        
+        for symbol, symbol_key in key_by_symbol.items():
+            try:
+                if symbol not in downloaded:
+                    self.logger.warning(f"데이터 없음: {symbol_key}")
+                    continue
+                
+                # 심볼별로 분리 (다른 심볼의 거래일로 생긴 빈 행이 있을 때만 제거)
+                data = raw_data[symbol] if is_multi else raw_data
+                has_values = data.notna().any(axis=1)
+                if not has_values.all():
+                    data = data[has_values]
+                
+                if not data.empty:
+                    results[symbol] = self._format_symbol_data(data, symbol)
+                    self.logger.info(f"데이터 수집 완료: {symbol_key} ({len(data)}개 레코드)")
+                else:
+                    self.logger.warning(f"데이터 없음: {symbol_key}")
+                    
+            except Exception as e:
+                self.logger.error(f"데이터 수집 오류 {symbol_key}: {str(e)}")
+                continue
+        
+        return results
+    
+    def _download_per_symbol(self,
+                             key_by_symbol: Dict[str, str],
+                             period: str,
+                             interval: str) -> Dict[str, pd.DataFrame]:
+        """
+        심볼별 병렬 수집 (yfinance는 HTTP 대기 중 GIL을 해제하므로 스레드로 충분)
+        
+        Args:
+            key_by_symbol: {symbol: symbol_key} 수집 대상
+            period: 데이터 기간
+            interval: 데이터 간격
+            
+        Returns:
+            {symbol: DataFrame} 형태의 딕셔너리 (수집 실패 심볼 제외)
+        """
+        results = {}
+        self.logger.info(f"미국 시장 데이터 개별 수집: {len(key_by_symbol)}개 심볼 ({interval})")
+        
+        max_workers = min(_MAX_FETCH_WORKERS, len(key_by_symbol))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_one, symbol_key, period, interval): symbol
+                for symbol, symbol_key in key_by_symbol.items()
+            }
+            for future in as_completed(futures):
+                _, data = future.result()
+                if data is not None:
+                    results[futures[future]] = data
+        
+        return results
+    
+    def _fetch_one(self,
+                   symbol_key: str,
+                   period: str,
+                   interval: str) -> Tuple[str, Optional[pd.DataFrame]]:
+        """
+        단일 심볼 수집 (Ticker.history)
+        
+        Args:
+            symbol_key: 심볼 키
+            period: 데이터 기간
+            interval: 데이터 간격
+            
+        Returns:
+            (symbol_key, DataFrame) 튜플 (수집 실패 시 DataFrame은 None)
+        """
+        symbol = self.symbols[symbol_key]
+        try:
+            data = yf.Ticker(symbol).history(period=period, interval=interval, actions=False)
+            
+            if data is None or data.empty:
+                self.logger.warning(f"데이터 없음: {symbol_key}")
+                return symbol_key, None
+            
+            data = self._format_symbol_data(data, symbol)
+            self.logger.info(f"데이터 수집 완료: {symbol_key} ({len(data)}개 레코드)")
+            return symbol_key, data
+            
+        except Exception as e:
+            self.logger.error(f"데이터 수집 오류 {symbol_key}: {str(e)}")
+            return symbol_key, None
+    
+    def _format_symbol_data(self, data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """수집 데이터를 공통 형식으로 변환 (date 컬럼, 심볼 정보, 소문자 컬럼명)"""
+        # 인덱스를 date 컬럼으로 변환 (이후 변경은 모두 제자리에서 수행)
+        data = data.reset_index()
+        data.columns.name = None
+        
+        # 컬럼명 소문자로 통일 (미리 만든 매핑 사용)
+        data.rename(columns=self._column_rename_map, inplace=True)
+        
+        # 가격/거래량은 float32로 저장 (메모리·캐시 크기 절반, 지표 계산은 float64 누적)
+        for col in _FLOAT32_COLUMNS:
+            if col in data.columns:
+                data[col] = data[col].astype(np.float32)
+        
+        # 심볼 정보는 단일 범주 Categorical로 저장 (행마다 문자열 객체를 두지 않음)
+        codes = np.zeros(len(data), dtype=np.int8)
+        data['symbol_key'] = pd.Categorical.from_codes(codes, categories=[self._symbol_to_key[symbol]])
+        data['symbol'] = pd.Categorical.from_codes(codes, categories=[symbol])
+        return data
+    
+    @staticmethod
+    def _select_columns(data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """날짜/심볼 정보 컬럼과 요청한 가격 컬럼만 선택"""
+        keep = [col for col in data.columns
+                if col in ('date', 'datetime', 'symbol_key', 'symbol') or col in columns]
+        return data[keep]
+    
+    @staticmethod
+    def _is_intraday(interval: str) -> bool:
+        """분봉/시간봉 간격 여부 ("1m", "60m", "1h" 등, "1mo"/"3mo" 제외)"""
+        return interval.endswith(('m', 'h'))
+    
     def get_key_indices(self, period: str = "1y") -> pd.DataFrame:
         """
         주요 미국 지수 수집 및 통합
@@ -143,30 +936,23 @@ class USMarketCollector:
         """
         try:
             key_indices = ['sp500', 'nasdaq', 'dow', 'vix']
-            market_data = self.get_market_data(key_indices, period)
+            market_data = self.get_market_data(key_indices, period, columns=['close'])
             
             if not market_data:
                 return pd.DataFrame()
             
-            # 데이터 통합
-            combined_data = []
-            
-            for symbol_key, data in market_data.items():
-                if not data.empty:
-                    # 필요한 컬럼만 선택
-                    subset = data[['date', 'close', 'symbol_key']].copy()
-                    subset.rename(columns={'close': f'{symbol_key}_close'}, inplace=True)
-                    combined_data.append(subset[['date', f'{symbol_key}_close']])
+            # 날짜 인덱스 종가 시리즈 수집
+            close_series = {
+                f'{symbol_key}_close': data.set_index('date')['close']
+                for symbol_key, data in market_data.items()
+                if not data.empty
+            }
             
-            if not combined_data:
+            if not close_series:
                 return pd.DataFrame()
             
-            # 날짜 기준으로 병합
-            result = combined_data[0]
-            for df in combined_data[1:]:
-                result = pd.merge(result, df, on='date', how='outer')
-            
-            result = result.sort_values('date').reset_index(drop=True)
+            # 날짜 기준으로 한 번에 정렬 병합 (outer join)
+            result = pd.concat(close_series, axis=1, join='outer').sort_index().reset_index()
             
             self.logger.info(f"주요 지수 통합 완료: {len(result)}일, {len(result.columns)-1}개 지수")
             return result
@@ -176,12 +962,14 @@ class USMarketCollector:
             return pd.DataFrame()
     
     def calculate_market_indicators(self, 
-                                  market_data: pd.DataFrame) -> pd.DataFrame:
+                                  market_data: pd.DataFrame,
+                                  use_polars: bool = False) -> pd.DataFrame:
         """
         시장 지표 계산 (변화율, 변동성, 상관관계 등)
         
         Args:
             market_data: 시장 데이터 DataFrame
+            use_polars: Polars lazy 표현식으로 계산 (polars 설치 시)
             
         Returns:
             지표가 추가된 DataFrame
@@ -190,49 +978,97 @@ class USMarketCollector:
             if market_data.empty:
                 return market_data
             
-            result = market_data.copy()
-            
-            # 가격 컬럼들 찾기
-            price_columns = [col for col in result.columns if col.endswith('_close')]
+            # 가격 컬럼들 찾기 (없으면 계산할 지표 없음)
+            price_columns = [col for col in market_data.columns if col.endswith('_close')]
+            if not price_columns:
+                return market_data
+            base_names = [col.replace('_close', '') for col in price_columns]
             
-            for col in price_columns:
-                base_name = col.replace('_close', '')
-                
-                # 1. 일간 수익률
-                result[f'{base_name}_daily_return'] = result[col].pct_change() * 100
+            result = market_data.copy()
+            n = len(result)
+            
+            # 전체 가격 컬럼에 대해 한 번에 계산 (컬럼명은 기준 이름으로 통일)
+            prices = result[price_columns].set_axis(base_names, axis=1)
+            
+            if use_polars and POLARS_AVAILABLE:
+                # Polars lazy 표현식으로 계산 (RSI는 Wilder 커널 사용)
+                computed = _indicators_polars(prices)
+                up_days_ratio = computed.pop('up_days_ratio')
+                computed.pop('rsi', None)
+                indicators = dict(computed)
+                if n >= _INDICATOR_MIN_ROWS['rsi']:
+                    indicators['rsi'] = self._calculate_rsi(prices, window=14)
+                daily_return = indicators['daily_return']
+            elif NUMBA_AVAILABLE:
+                # numba 사용 가능 시 전체 지표를 하나의 커널로 계산
+                values = np.ascontiguousarray(_price_values(prices))
+                out = np.empty(values.shape + (len(_KERNEL_INDICATORS),))
+                _compute_indicators(values, out)
                 
-                # 2. 누적 수익률 (기간 시작 대비)
-                result[f'{base_name}_cumulative_return'] = (result[col] / result[col].iloc[0] - 1) * 100
+                indicators = {
+                    name: pd.DataFrame(out[:, :, m], index=prices.index, columns=base_names)
+                    for m, name in enumerate(_KERNEL_INDICATORS)
+                }
+                up_days_ratio = indicators.pop('up_days_ratio')
+                daily_return = indicators['daily_return']
+            else:
+                prices = prices.astype(np.float64)
                 
-                # 3. 이동평균 (5일, 20일, 60일)
-                result[f'{base_name}_ma5'] = result[col].rolling(window=5).mean()
-                result[f'{base_name}_ma20'] = result[col].rolling(window=20).mean()
-                result[f'{base_name}_ma60'] = result[col].rolling(window=60).mean()
+                # 1. 일간 수익률
+                daily_return = prices.pct_change() * 100
                 
-                # 4. 변동성 (20일 롤링)
-                result[f'{base_name}_volatility'] = result[f'{base_name}_daily_return'].rolling(window=20).std()
+                indicators = {
+                    'daily_return': daily_return,
+                    # 2. 누적 수익률 (기간 시작 대비)
+                    'cumulative_return': (prices / prices.iloc[0] - 1) * 100,
+                }
                 
-                # 5. 모멘텀 (20일, 60일)
-                result[f'{base_name}_momentum_20'] = result[col].pct_change(periods=20) * 100
-                result[f'{base_name}_momentum_60'] = result[col].pct_change(periods=60) * 100
+                windowed = (
+                    # 3. 이동평균 (5일, 20일, 60일)
+                    ('ma5', lambda: _rolling_mean(prices, 5)),
+                    ('ma20', lambda: _rolling_mean(prices, 20)),
+                    ('ma60', lambda: _rolling_mean(prices, 60)),
+                    # 4. 변동성 (20일 롤링)
+                    ('volatility', lambda: _rolling_std(daily_return, 20)),
+                    # 5. 모멘텀 (20일, 60일)
+                    ('momentum_20', lambda: prices.pct_change(periods=20) * 100),
+                    ('momentum_60', lambda: prices.pct_change(periods=60) * 100),
+                    # 6. RSI (14일)
+                    ('rsi', lambda: self._calculate_rsi(prices, window=14)),
+                )
+                for name, compute in windowed:
+                    if n >= _INDICATOR_MIN_ROWS[name]:
+                        indicators[name] = compute()
                 
-                # 6. RSI (14일)
-                result[f'{base_name}_rsi'] = self._calculate_rsi(result[col], window=14)
+                # 8. 시장 강도 지표 (상승일 비율 - 20일 롤링)
+                up_days_ratio = (
+                    _rolling_mean((daily_return > 0).astype(np.float64), 20) * 100
+                    if n >= _INDICATOR_MIN_ROWS['up_days_ratio'] else None
+                )
+            
+            # 데이터가 창 길이보다 짧아 전부 NaN인 지표는 컬럼을 만들지 않음
+            indicators = {name: frame for name, frame in indicators.items()
+                          if n >= _INDICATOR_MIN_ROWS[name]}
             
-            # 7. 시장 간 상관관계 (60일 롤링)
-            if 'sp500_close' in result.columns and 'nasdaq_close' in result.columns:
-                result['sp500_nasdaq_corr'] = result['sp500_daily_return'].rolling(window=60).corr(
-                    result['nasdaq_daily_return']
+            new_columns = {
+                f'{base_name}_{suffix}': frame[base_name]
+                for base_name in base_names
+                for suffix, frame in indicators.items()
+            }
+            
+            # 7. 시장 간 상관관계 (60일 롤링, 수익률 60개 이상일 때만)
+            if (n > _CORRELATION_WINDOW and
+                    'sp500' in daily_return.columns and 'nasdaq' in daily_return.columns):
+                new_columns['sp500_nasdaq_corr'] = _rolling_corr(
+                    daily_return['sp500'], daily_return['nasdaq'], _CORRELATION_WINDOW
                 )
             
-            # 8. 시장 강도 지표 (상승일 비율 - 20일 롤링)
-            for col in price_columns:
-                base_name = col.replace('_close', '')
-                return_col = f'{base_name}_daily_return'
-                if return_col in result.columns:
-                    result[f'{base_name}_up_days_ratio'] = (
-                        result[return_col] > 0
-                    ).rolling(window=20).mean() * 100
+            # 8. 시장 강도 지표
+            if up_days_ratio is not None and n >= _INDICATOR_MIN_ROWS['up_days_ratio']:
+                for base_name in base_names:
+                    new_columns[f'{base_name}_up_days_ratio'] = up_days_ratio[base_name]
+            
+            result = pd.concat([result, pd.DataFrame(new_columns, index=result.index)], axis=1)
             
             self.logger.info(f"시장 지표 계산 완료: {len(result.columns)}개 컬럼")
             return result
@@ -241,18 +1077,23 @@ class USMarketCollector:
             self.logger.error(f"시장 지표 계산 오류: {str(e)}")
             return market_data
     
-    def _calculate_rsi(self, prices: pd.Series, window: int = 14) -> pd.Series:
-        """RSI 계산"""
+    def _calculate_rsi(self, prices, window: int = 14):
+        """RSI 계산 (Wilder 평활, Series 또는 가격 컬럼별 DataFrame)"""
         try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+            values = _price_values(prices)
             
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi
+            if values.ndim == 1:
+                return pd.Series(_rsi_wilder(values, window), index=prices.index, name=prices.name)
+            
+            rsi = np.column_stack([
+                _rsi_wilder(np.ascontiguousarray(values[:, j]), window)
+                for j in range(values.shape[1])
+            ]) if values.shape[1] else np.empty(values.shape)
+            return pd.DataFrame(rsi, index=prices.index, columns=prices.columns)
             
         except Exception:
+            if isinstance(prices, pd.DataFrame):
+                return pd.DataFrame(index=prices.index, columns=prices.columns, dtype=float)
             return pd.Series(index=prices.index, dtype=float)
     
     def analyze_market_regime(self, market_data: pd.DataFrame) -> Dict[str, Any]:
@@ -269,102 +1110,30 @@ class USMarketCollector:
             if market_data.empty or len(market_data) < 60:
                 return {'regime': 'INSUFFICIENT_DATA', 'confidence': 0.0}
             
-            latest = market_data.iloc[-1]
-            recent_data = market_data.tail(60)  # 최근 60일
-            
-            signals = []
-            
-            # 1. S&P 500 트렌드 분석
-            if 'sp500_momentum_60' in latest.index and not pd.isna(latest['sp500_momentum_60']):
-                sp500_momentum = latest['sp500_momentum_60']
-                if sp500_momentum > 10:
-                    signals.append(('bull_market', 0.8))
-                elif sp500_momentum < -10:
-                    signals.append(('bear_market', 0.8))
-                else:
-                    signals.append(('sideways', 0.5))
-            
-            # 2. VIX 분석 (공포 지수)
-            if 'vix_close' in latest.index and not pd.isna(latest['vix_close']):
-                vix_level = latest['vix_close']
-                if vix_level > 30:
-                    signals.append(('high_volatility', 0.7))
-                elif vix_level > 20:
-                    signals.append(('medium_volatility', 0.5))
-                else:
-                    signals.append(('low_volatility', 0.6))
-            
-            # 3. 시장 폭 분석 (나스닥 vs S&P 500)
-            if ('nasdaq_momentum_60' in latest.index and 'sp500_momentum_60' in latest.index and
-                not pd.isna(latest['nasdaq_momentum_60']) and not pd.isna(latest['sp500_momentum_60'])):
-                
-                nasdaq_momentum = latest['nasdaq_momentum_60']
-                sp500_momentum = latest['sp500_momentum_60']
-                
-                if nasdaq_momentum > sp500_momentum + 5:
-                    signals.append(('tech_leadership', 0.6))
-                elif sp500_momentum > nasdaq_momentum + 5:
-                    signals.append(('broad_market_leadership', 0.6))
-            
-            # 4. 이동평균 트렌드
-            if ('sp500_close' in latest.index and 'sp500_ma20' in latest.index and 
-                'sp500_ma60' in latest.index):
-                
-                price = latest['sp500_close']
-                ma20 = latest['sp500_ma20']
-                ma60 = latest['sp500_ma60']
-                
-                if price > ma20 > ma60:
-                    signals.append(('uptrend', 0.7))
-                elif price < ma20 < ma60:
-                    signals.append(('downtrend', 0.7))
-                else:
-                    signals.append(('sideways', 0.4))
-            
-            # 5. 시장 강도 (상승일 비율)
-            if 'sp500_up_days_ratio' in latest.index and not pd.isna(latest['sp500_up_days_ratio']):
-                up_ratio = latest['sp500_up_days_ratio']
-                if up_ratio > 60:
-                    signals.append(('strong_market', 0.6))
-                elif up_ratio < 40:
-                    signals.append(('weak_market', 0.6))
-            
-            # 신호 집계
-            regime_scores = {
-                'BULL_MARKET': 0.0,
-                'BEAR_MARKET': 0.0,
-                'SIDEWAYS': 0.0,
-                'HIGH_VOLATILITY': 0.0,
-                'TECH_LED': 0.0
-            }
-            
-            signal_mapping = {
-                'bull_market': 'BULL_MARKET',
-                'uptrend': 'BULL_MARKET',
-                'strong_market': 'BULL_MARKET',
-                'bear_market': 'BEAR_MARKET',
-                'downtrend': 'BEAR_MARKET',
-                'weak_market': 'BEAR_MARKET',
-                'sideways': 'SIDEWAYS',
-                'high_volatility': 'HIGH_VOLATILITY',
-                'medium_volatility': 'HIGH_VOLATILITY',
-                'tech_leadership': 'TECH_LED'
-            }
-            
-            total_weight = 0.0
-            for signal_type, weight in signals:
-                if signal_type in signal_mapping:
-                    regime = signal_mapping[signal_type]
-                    regime_scores[regime] += weight
-                    total_weight += weight
-            
-            # 정규화
-            if total_weight > 0:
-                for regime in regime_scores:
-                    regime_scores[regime] /= total_weight
+            # 마지막 행을 dict로 한 번만 변환 (Series 인덱싱 반복 방지)
+            latest = market_data.iloc[-1].to_dict()
+            
+            def value(key: str) -> float:
+                v = latest.get(key)
+                return np.nan if v is None else float(v)
+            
+            has_ma = 'sp500_close' in latest and 'sp500_ma20' in latest and 'sp500_ma60' in latest
+            best, confidence, scores, codes, weights = _analyze_regime_core(
+                value('sp500_momentum_60'),
+                value('vix_close'),
+                value('nasdaq_momentum_60'),
+                value('sp500_close'),
+                value('sp500_ma20'),
+                value('sp500_ma60'),
+                value('sp500_up_days_ratio'),
+                has_ma,
+                _SIGNAL_REGIME_MATRIX
+            )
             
-            # 최고 점수 체제 선택
-            best_regime = max(regime_scores.items(), key=lambda x: x[1])
+            signals = [(_SIGNAL_NAMES[code], weight)
+                       for code, weight in zip(codes.tolist(), weights.tolist()) if code >= 0]
+            regime_scores = dict(zip(_REGIME_NAMES, scores.tolist()))
+            best_regime = (_REGIME_NAMES[best], float(confidence))
             
             return {
                 'regime': best_regime[0],
@@ -379,12 +1148,15 @@ class USMarketCollector:
             self.logger.error(f"시장 체제 분석 오류: {str(e)}")
             return {'regime': 'ERROR', 'confidence': 0.0}
     
-    def get_market_sentiment_indicators(self, period: str = "3mo") -> Dict[str, Any]:
+    def get_market_sentiment_indicators(self,
+                                        period: str = "3mo",
+                                        market_data: Optional[Dict[str, pd.DataFrame]] = None) -> Dict[str, Any]:
         """
         시장 심리 지표 수집 및 분석
         
         Args:
             period: 분석 기간
+            market_data: 이미 수집한 {symbol_key: DataFrame} (없는 심볼만 추가 수집)
             
         Returns:
             시장 심리 분석 결과
@@ -393,52 +1165,58 @@ class USMarketCollector:
             # 심리 관련 지표들
             sentiment_symbols = ['vix', 'sp500', 'nasdaq', 'gold', 'dxy']
             
-            market_data = self.get_market_data(sentiment_symbols, period)
+            market_data = {key: data for key, data in (market_data or {}).items()
+                           if key in sentiment_symbols}
+            missing_symbols = [key for key in sentiment_symbols if key not in market_data]
+            if missing_symbols:
+                # 수집 캐시에 있는 심볼은 get_market_data에서 재다운로드하지 않음
+                market_data.update(self.get_market_data(missing_symbols, period, columns=['close']))
             
             if not market_data:
                 return {'sentiment': 'NEUTRAL', 'confidence': 0.0}
             
             sentiment_scores = []
             
+            # 종가 배열 (스칼라 조회 시 pandas 인덱서 오버헤드 제거, float64로 계산)
+            closes = {key: data['close'].to_numpy(dtype=np.float64)
+                      for key, data in market_data.items() if 'close' in data}
+            
             # VIX 분석
-            if 'vix' in market_data:
-                vix_data = market_data['vix']
-                if not vix_data.empty:
-                    latest_vix = vix_data['close'].iloc[-1]
-                    avg_vix = vix_data['close'].mean()
-                    
-                    if latest_vix > avg_vix * 1.5:
-                        sentiment_scores.append(('fearful', 0.8))
-                    elif latest_vix < avg_vix * 0.7:
-                        sentiment_scores.append(('greedy', 0.7))
-                    else:
-                        sentiment_scores.append(('neutral', 0.5))
+            vix_close = closes.get('vix')
+            if vix_close is not None and vix_close.size:
+                latest_vix = vix_close[-1]
+                avg_vix = np.nanmean(vix_close)
+                
+                if latest_vix > avg_vix * 1.5:
+                    sentiment_scores.append(('fearful', 0.8))
+                elif latest_vix < avg_vix * 0.7:
+                    sentiment_scores.append(('greedy', 0.7))
+                else:
+                    sentiment_scores.append(('neutral', 0.5))
             
             # 주식 모멘텀 분석
             for index in ['sp500', 'nasdaq']:
-                if index in market_data:
-                    data = market_data[index]
-                    if not data.empty and len(data) > 20:
-                        recent_return = (data['close'].iloc[-1] / data['close'].iloc[-20] - 1) * 100
-                        
-                        if recent_return > 5:
-                            sentiment_scores.append(('bullish', 0.6))
-                        elif recent_return < -5:
-                            sentiment_scores.append(('bearish', 0.6))
+                close = closes.get(index)
+                if close is not None and close.size > 20:
+                    recent_return = (close[-1] / close[-20] - 1) * 100
+                    
+                    if recent_return > 5:
+                        sentiment_scores.append(('bullish', 0.6))
+                    elif recent_return < -5:
+                        sentiment_scores.append(('bearish', 0.6))
             
             # 안전자산 선호도 (금 vs 주식)
-            if 'gold' in market_data and 'sp500' in market_data:
-                gold_data = market_data['gold']
-                sp500_data = market_data['sp500']
+            gold_close = closes.get('gold')
+            sp500_close = closes.get('sp500')
+            if (gold_close is not None and sp500_close is not None and
+                    gold_close.size > 20 and sp500_close.size):
+                gold_return = (gold_close[-1] / gold_close[-20] - 1) * 100
+                sp500_return = (sp500_close[-1] / sp500_close[-20] - 1) * 100
                 
-                if not gold_data.empty and not sp500_data.empty and len(gold_data) > 20:
-                    gold_return = (gold_data['close'].iloc[-1] / gold_data['close'].iloc[-20] - 1) * 100
-                    sp500_return = (sp500_data['close'].iloc[-1] / sp500_data['close'].iloc[-20] - 1) * 100
-                    
-                    if gold_return > sp500_return + 3:
-                        sentiment_scores.append(('risk_averse', 0.6))
-                    elif sp500_return > gold_return + 3:
-                        sentiment_scores.append(('risk_seeking', 0.6))
+                if gold_return > sp500_return + 3:
+                    sentiment_scores.append(('risk_averse', 0.6))
+                elif sp500_return > gold_return + 3:
+                    sentiment_scores.append(('risk_seeking', 0.6))
             
             # 심리 점수 집계
             if not sentiment_scores:
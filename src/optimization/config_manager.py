@@ -3,17 +3,140 @@
 매개변수 최적화 결과를 저장하고 관리하는 시스템
 """
 import json
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import logging
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
-import sys
+import shutil
+import hashlib
+import copy
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# 요약 통계용 성과 지표 필드 (수익률, 샤프비율, 승률)
+_PERFORMANCE_FIELDS = ('total_return', 'sharpe_ratio', 'win_rate')
+
+# 최적화 매개변수 기본 스키마 (압축 형식 2.0에서 값 배열의 순서)
+_PARAMETER_SCHEMA = (
+    'confidence_threshold', 'min_indicators', 'institutional_weight',
+    'ma_weight', 'rsi_weight', 'macd_weight', 'bb_weight', 'volume_weight', 'stoch_weight'
+)
+
+# 매개변수를 값 배열로 저장하는 압축 설정 버전
+_COMPACT_CONFIG_VERSION = '2.0'
+
+# 종목별 설정 파일 이름 접미사 ({symbol}_config.json)
+_CONFIG_SUFFIX = '_config.json'
+
+# 최적화 요약 캐시 파일 (요약 결과, 종목 파일 상태 키)
+_SUMMARY_FILE = 'summary.json'
+_SUMMARY_KEY_FILE = '.summary_key'
+
+# 오래된 설정 파일 삭제 동시 작업 수
+_CLEANUP_WORKERS = 16
+
+# 내보내기 스트리밍 버퍼 크기 (64KB, 기본 8KB 대비 시스템 콜 감소)
+_IO_BUFFER_SIZE = 65536
+
+
+def _json_default(obj: Any) -> Any:
+    """표준 json 직렬화 보조 (numpy 타입 변환)"""
+    if type(obj).__module__ == 'numpy':
+        # numpy 스칼라는 item(), 배열은 tolist()로 파이썬 기본 타입 변환
+        return obj.tolist()
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj).__name__}")
+
+
+# JSON 직렬화·역직렬화 함수 (import 시 한 번 선택·옵션 고정해 호출마다 분기·kwargs 구성 생략)
+if ORJSON_AVAILABLE:
+    # orjson C 확장 (들여쓰기 2칸, UTF-8 그대로, numpy 타입 직접 직렬화)
+    _dumps = functools.partial(
+        orjson.dumps,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    _loads = orjson.loads
+else:
+    _json_encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+    
+    def _dumps(obj: Any) -> bytes:
+        """JSON 직렬화 (표준 json, 들여쓰기 2칸·UTF-8 그대로)"""
+        return _json_encoder.encode(obj).encode('utf-8')
+    
+    _loads = json.loads
+
+
+def _content_hash(buf: bytes) -> Any:
+    """파일 내용 해시 (xxhash 사용 가능 시 xxh3, 아니면 blake2b 8바이트)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(buf)
+    return hashlib.blake2b(buf, digest_size=8).digest()
+
+
+if MSGSPEC_AVAILABLE:
+    class _SummaryView(msgspec.Struct):
+        """
+        요약용 부분 스키마 (나머지 필드는 파싱하지 않고 건너뜀)
+        
+        값 타입은 검사하지 않고 파일에 없는 필드는 UNSET으로 남겨,
+        load_symbol_config와 같은 _validate_config 기준으로 판정
+        """
+        symbol: Any = msgspec.UNSET
+        optimization_date: Any = msgspec.UNSET
+        best_parameters: Any = msgspec.UNSET
+        best_parameters_values: Any = msgspec.UNSET
+        optimization_metric: Any = msgspec.UNSET
+        best_performance: Any = msgspec.UNSET
+    
+    _SUMMARY_VIEW_DECODER = msgspec.json.Decoder(_SummaryView)
+
+
+def _compact_parameters(config_data: Dict[str, Any], schema: List[str]) -> Dict[str, Any]:
+    """
+    매개변수 이름이 스키마와 같으면 값 배열 형식(2.0)으로 변환한 사본 반환
+    
+    Args:
+        config_data: 종목 설정 (best_parameters 딕셔너리 형식)
+        schema: 매개변수 이름 순서
+        
+    Returns:
+        압축된 설정 (스키마와 다르면 원본 그대로)
+    """
+    params = config_data.get('best_parameters')
+    if not isinstance(params, dict) or len(params) != len(schema) or set(params) != set(schema):
+        return config_data
+    
+    compact = {key: value for key, value in config_data.items() if key != 'best_parameters'}
+    compact['best_parameters_values'] = [params[name] for name in schema]
+    compact['metadata'] = {**config_data.get('metadata', {}), 'config_version': _COMPACT_CONFIG_VERSION}
+    return compact
+
+
+def _expand_parameters(config_data: Dict[str, Any], schema: List[str]) -> None:
+    """값 배열 형식(2.0) 매개변수를 best_parameters 딕셔너리로 복원 (제자리 변환)"""
+    values = config_data.pop('best_parameters_values', None)
+    if values is not None and not config_data.get('best_parameters') and len(values) == len(schema):
+        config_data['best_parameters'] = dict(zip(schema, values))
 
-# 상위 디렉토리 경로 추가  
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 class ConfigManager:
     """최적화된 설정 관리자"""
@@ -35,6 +158,12 @@ class ConfigManager:
         self.symbol_configs_dir = self.config_dir / "symbol_specific"
         self.symbol_configs_dir.mkdir(exist_ok=True)
         
+        # 종목별 설정 캐시 {symbol: ((st_mtime_ns, st_size), 설정)}
+        self._config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
+        # 마지막으로 기록한 파일 내용 {path: (내용 해시, (st_mtime_ns, st_size))}
+        self._last_hash: Dict[Path, Tuple[Any, Tuple[int, int]]] = {}
+        
         # 기본 설정 로드
         self.global_config = self._load_global_config()
         
@@ -55,6 +184,10 @@ class ConfigManager:
         
         return logger
     
+    def clear_cache(self) -> None:
+        """종목별 설정 메모리 캐시 비우기"""
+        self._config_cache.clear()
+    
     def save_optimization_result(self, 
                                 symbol: str,
                                 optimization_result: Dict[str, Any],
@@ -72,17 +205,20 @@ class ConfigManager:
         """
         try:
             # 종목별 설정 파일 경로
-            symbol_config_path = self.symbol_configs_dir / f"{symbol}_config.json"
+            symbol_config_path = self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}"
             
             # 기존 파일 존재 체크
             if symbol_config_path.exists() and not overwrite:
                 self.logger.warning(f"설정 파일이 이미 존재합니다: {symbol}")
                 return False
             
+            # 저장 시각 (기본 최적화 일자와 메타데이터에 공통 사용)
+            now_iso = datetime.now().isoformat()
+            
             # 저장할 데이터 구성
             config_data = {
                 'symbol': symbol,
-                'optimization_date': optimization_result.get('optimization_date', datetime.now().isoformat()),
+                'optimization_date': optimization_result.get('optimization_date', now_iso),
                 'optimization_metric': optimization_result.get('optimization_metric', 'sharpe_ratio'),
                 'best_parameters': optimization_result.get('best_parameters', {}),
                 'best_performance': optimization_result.get('best_performance', {}),
@@ -90,14 +226,13 @@ class ConfigManager:
                 'total_combinations_tested': optimization_result.get('total_combinations_tested', 0),
                 'sensitivity_analysis': optimization_result.get('sensitivity_analysis', {}),
                 'metadata': {
-                    'saved_at': datetime.now().isoformat(),
+                    'saved_at': now_iso,
                     'config_version': '1.0'
                 }
             }
             
             # JSON 파일로 저장
-            with open(symbol_config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            self._write_symbol_config(symbol, config_data)
             
             self.logger.info(f"최적화 결과 저장 완료: {symbol}")
             return True
@@ -106,10 +241,58 @@ class ConfigManager:
             self.logger.error(f"최적화 결과 저장 오류 ({symbol}): {str(e)}")  
             return False
     
+    def _parameter_schema(self) -> List[str]:
+        """압축 형식 매개변수 이름 순서 (전역 설정 우선, 없으면 기본 스키마)"""
+        global_config = getattr(self, 'global_config', None) or {}
+        return list(global_config.get('best_parameters_schema', _PARAMETER_SCHEMA))
+    
+    def _write_symbol_config(self, symbol: str, config_data: Dict[str, Any]) -> None:
+        """종목 설정 파일 기록 및 캐시 무효화"""
+        buf = _dumps(_compact_parameters(config_data, self._parameter_schema()))
+        if self._atomic_write(self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}", buf):
+            self._config_cache.pop(symbol, None)
+    
+    def _atomic_write(self, path: Path, buf: bytes) -> bool:
+        """
+        임시 파일에 기록 후 os.replace로 교체 (중단 시에도 기존 파일 유지)
+        
+        직전에 기록한 내용과 같고 이후 파일이 바뀌지 않았으면 기록 생략
+        
+        Args:
+            path: 대상 파일 경로
+            buf: 기록할 내용
+            
+        Returns:
+            실제 기록 여부
+        """
+        content_hash = _content_hash(buf)
+        last = self._last_hash.get(path)
+        if last is not None and last[0] == content_hash:
+            try:
+                stat = path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == last[1]:
+                    return False
+            except FileNotFoundError:
+                pass
+        
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(buf)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        stat = path.stat()
+        self._last_hash[path] = (content_hash, (stat.st_mtime_ns, stat.st_size))
+        return True
+    
     def load_symbol_config(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         종목별 최적화된 설정 로드
         
+        파일 수정 시각·크기가 그대로면 메모리 캐시에서 반환 (호출자가 수정해도 캐시가 바뀌지 않도록 복사본 반환)
+        
         Args:
             symbol: 종목 코드
             
@@ -117,18 +300,31 @@ class ConfigManager:
             최적화된 설정 딕셔너리
         """
         try:
-            symbol_config_path = self.symbol_configs_dir / f"{symbol}_config.json"
+            symbol_config_path = self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}"
             
-            if not symbol_config_path.exists():
+            try:
+                stat = symbol_config_path.stat()
+            except FileNotFoundError:
+                self._config_cache.pop(symbol, None)
                 self.logger.warning(f"종목 설정 파일이 없습니다: {symbol}")
                 return None
             
-            with open(symbol_config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._config_cache.get(symbol)
+            if cached is not None and cached[0] == file_key:
+                return copy.deepcopy(cached[1])
+            
+            buf = symbol_config_path.read_bytes()
             
-            # 설정 유효성 검사
-            if self._validate_config(config_data):
-                return config_data
+            # 설정 파싱 및 유효성 검사 (파일의 모든 키를 그대로 보존)
+            config_data = _loads(buf)
+            _expand_parameters(config_data, self._parameter_schema())
+            if not self._validate_config(config_data):
+                config_data = None
+            
+            if config_data is not None:
+                self._config_cache[symbol] = (file_key, config_data)
+                return copy.deepcopy(config_data)
             else:
                 self.logger.warning(f"유효하지 않은 설정 파일: {symbol}")
                 return None
@@ -137,6 +333,57 @@ class ConfigManager:
             self.logger.error(f"종목 설정 로드 오류 ({symbol}): {str(e)}")
             return None
     
+    def _load_summary_view(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        요약에 필요한 필드(성과, 최적화 일시, 최적화 지표)만 로드
+        
+        msgspec이 없거나 전체 설정이 캐시돼 있으면 load_symbol_config 결과 사용
+        
+        Args:
+            symbol: 종목 코드
+            
+        Returns:
+            요약용 설정 딕셔너리 (유효하지 않으면 None)
+        """
+        if not MSGSPEC_AVAILABLE:
+            return self.load_symbol_config(symbol)
+        
+        try:
+            symbol_config_path = self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}"
+            
+            try:
+                stat = symbol_config_path.stat()
+            except FileNotFoundError:
+                self.logger.warning(f"종목 설정 파일이 없습니다: {symbol}")
+                return None
+            
+            cached = self._config_cache.get(symbol)
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return cached[1]
+            
+            try:
+                view = _SUMMARY_VIEW_DECODER.decode(symbol_config_path.read_bytes())
+            except msgspec.ValidationError:
+                # 최상위가 객체가 아닌 파일
+                view = None
+            
+            # 파일에 있는 필드만 딕셔너리로 복원해 load_symbol_config와 같은 기준으로 검사
+            config_data = {} if view is None else {
+                name: value for name, value in msgspec.structs.asdict(view).items()
+                if value is not msgspec.UNSET
+            }
+            _expand_parameters(config_data, self._parameter_schema())
+            if not self._validate_config(config_data):
+                self.logger.warning(f"유효하지 않은 설정 파일: {symbol}")
+                return None
+            
+            return {key: config_data[key] for key in ('best_performance', 'optimization_date', 'optimization_metric')
+                    if key in config_data}
+            
+        except Exception as e:
+            self.logger.error(f"종목 설정 로드 오류 ({symbol}): {str(e)}")
+            return None
+    
     def get_optimized_parameters(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         종목의 최적화된 매개변수만 반환
@@ -169,8 +416,7 @@ class ConfigManager:
                 **config_data
             }
             
-            with open(self.global_config_path, 'w', encoding='utf-8') as f:
-                json.dump(global_data, f, indent=2, ensure_ascii=False)
+            self._atomic_write(self.global_config_path, _dumps(global_data))
             
             # 메모리의 전역 설정도 업데이트
             self.global_config = global_data
@@ -186,16 +432,16 @@ class ConfigManager:
         """전역 설정 로드"""
         try:
             if self.global_config_path.exists():
-                with open(self.global_config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _loads(self.global_config_path.read_bytes())
             else:
                 # 기본 전역 설정
                 default_config = {
                     'created_at': datetime.now().isoformat(),
-                    'config_version': '1.0',
+                    'config_version': _COMPACT_CONFIG_VERSION,
                     'default_optimization_metric': 'sharpe_ratio',
                     'default_backtest_period': '2y',
-                    'max_optimization_workers': 8
+                    'max_optimization_workers': 8,
+                    'best_parameters_schema': list(_PARAMETER_SCHEMA)
                 }
                 
                 # 기본 설정 저장
@@ -228,11 +474,10 @@ class ConfigManager:
     def list_optimized_symbols(self) -> List[str]:
         """최적화된 종목 목록 반환"""
         try:
-            symbols = []
-            
-            for config_file in self.symbol_configs_dir.glob("*_config.json"):
-                symbol = config_file.stem.replace('_config', '')
-                symbols.append(symbol)
+            # os.scandir: Path 객체 생성 없이 디렉토리 항목 이름만 사용
+            with os.scandir(self.symbol_configs_dir) as it:
+                symbols = [entry.name[:-len(_CONFIG_SUFFIX)] for entry in it
+                           if entry.name.endswith(_CONFIG_SUFFIX)]
             
             return sorted(symbols)
             
@@ -240,11 +485,57 @@ class ConfigManager:
             self.logger.error(f"종목 목록 조회 오류: {str(e)}")
             return []
     
+    def _load_all_symbol_configs(self, symbols: List[str],
+                                 loader: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+                                 ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 설정 병렬 로드 (파일 I/O 대기 중첩)
+        
+        Args:
+            symbols: 종목 코드 리스트
+            loader: 종목별 로드 함수 (None이면 load_symbol_config)
+            
+        Returns:
+            {symbol: 설정} 딕셔너리 (입력 순서 유지, 로드 실패 종목 제외)
+        """
+        if not symbols:
+            return {}
+        
+        max_workers = min(self.global_config.get('max_optimization_workers', 8), len(symbols))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            configs = executor.map(loader or self.load_symbol_config, symbols)
+            return {symbol: config for symbol, config in zip(symbols, configs) if config}
+    
+    def _summary_key(self, symbols: List[str]) -> str:
+        """종목 파일 (이름, 수정 시각, 크기)로 만든 요약 캐시 키"""
+        digest = hashlib.blake2b(digest_size=16)
+        for symbol in symbols:
+            try:
+                stat = os.stat(self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}")
+                digest.update(f"{symbol}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+            except FileNotFoundError:
+                digest.update(f"{symbol}:-\n".encode())
+        return digest.hexdigest()
+    
+    def _load_cached_summary(self, summary_key: str) -> Optional[Dict[str, Any]]:
+        """저장된 요약의 키가 일치하면 요약 반환"""
+        try:
+            if (self.config_dir / _SUMMARY_KEY_FILE).read_text() != summary_key:
+                return None
+            return _loads((self.config_dir / _SUMMARY_FILE).read_bytes())
+        except (OSError, ValueError):
+            return None
+    
     def get_optimization_summary(self) -> Dict[str, Any]:
-        """전체 최적화 요약 정보"""
+        """전체 최적화 요약 정보 (종목 파일이 바뀌지 않았으면 저장된 요약 반환)"""
         try:
             symbols = self.list_optimized_symbols()
             
+            summary_key = self._summary_key(symbols)
+            cached_summary = self._load_cached_summary(summary_key)
+            if cached_summary is not None:
+                return cached_summary
+            
             summary = {
                 'total_optimized_symbols': len(symbols),
                 'optimized_symbols': symbols,
@@ -254,15 +545,17 @@ class ConfigManager:
             if symbols:
                 # 종목별 성과 수집
                 performances = []
+                performance_symbols = []
                 optimization_dates = []
                 metrics_used = []
                 
-                for symbol in symbols:
-                    config = self.load_symbol_config(symbol)
+                # 요약에 쓰는 필드만 부분 디코딩
+                for symbol, config in self._load_all_symbol_configs(symbols, self._load_summary_view).items():
                     if config:
                         perf = config.get('best_performance', {})
                         if perf:
                             performances.append(perf)
+                            performance_symbols.append(symbol)
                         
                         opt_date = config.get('optimization_date')
                         if opt_date:
@@ -274,18 +567,31 @@ class ConfigManager:
                 
                 # 성과 통계
                 if performances:
-                    returns = [p.get('total_return', 0) for p in performances]
-                    sharpe_ratios = [p.get('sharpe_ratio', 0) for p in performances]
-                    win_rates = [p.get('win_rate', 0) for p in performances]
+                    # numpy는 요약 통계에서만 사용하므로 지연 import (모듈 로드 시간 절감)
+                    import numpy as np
+                    
+                    # 종목별 (수익률, 샤프비율, 승률)을 중간 리스트 없이 채운 연속 (N, 3) 배열
+                    values = np.fromiter(
+                        (p.get(name, 0) for p in performances for name in _PERFORMANCE_FIELDS),
+                        dtype=np.float64,
+                        count=len(performances) * len(_PERFORMANCE_FIELDS)
+                    ).reshape(-1, len(_PERFORMANCE_FIELDS))
                     
+                    # 열 단위 벡터 축약 (평균, 표준편차, 중앙값, 최댓값 위치)
+                    means = values.mean(axis=0)
+                    stds = values.std(axis=0)
+                    medians = np.median(values, axis=0)
+                    best = values.argmax(axis=0)
+                    
+                    # np.float64는 float 하위 타입이므로 그대로 직렬화 가능
                     summary['performance_statistics'] = {
-                        'average_return': float(np.mean(returns)),
-                        'median_return': float(np.median(returns)),
-                        'std_return': float(np.std(returns)),
-                        'average_sharpe_ratio': float(np.mean(sharpe_ratios)),
-                        'average_win_rate': float(np.mean(win_rates)),
-                        'best_performing_symbol': symbols[np.argmax(returns)],
-                        'highest_sharpe_symbol': symbols[np.argmax(sharpe_ratios)]
+                        'average_return': means[0],
+                        'median_return': medians[0],
+                        'std_return': stds[0],
+                        'average_sharpe_ratio': means[1],
+                        'average_win_rate': means[2],
+                        'best_performing_symbol': performance_symbols[best[0]],
+                        'highest_sharpe_symbol': performance_symbols[best[1]]
                     }
                 
                 # 최적화 메타데이터
@@ -293,9 +599,16 @@ class ConfigManager:
                     summary['optimization_metadata'] = {
                         'latest_optimization': max(optimization_dates),
                         'oldest_optimization': min(optimization_dates),
-                        'most_common_metric': max(set(metrics_used), key=metrics_used.count) if metrics_used else 'unknown'
+                        'most_common_metric': Counter(metrics_used).most_common(1)[0][0] if metrics_used else 'unknown'
                     }
             
+            # 요약 저장 (요약 파일을 먼저 기록해 키만 갱신된 상태가 생기지 않도록 함)
+            try:
+                self._atomic_write(self.config_dir / _SUMMARY_FILE, _dumps(summary))
+                self._atomic_write(self.config_dir / _SUMMARY_KEY_FILE, summary_key.encode())
+            except OSError as e:
+                self.logger.warning(f"최적화 요약 캐시 저장 실패: {str(e)}")
+            
             return summary
             
         except Exception as e:
@@ -313,26 +626,32 @@ class ConfigManager:
             내보내기 성공 여부
         """
         try:
+            now = datetime.now()
             if output_file is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 output_file = self.config_dir / f"all_configurations_{timestamp}.json"
             
-            # 모든 설정 수집
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'global_config': self.global_config,
-                'symbol_configs': {}
-            }
-            
+            # 유효한 종목 설정 확인 (mtime 캐시 사용)
             symbols = self.list_optimized_symbols()
-            for symbol in symbols:
-                config = self.load_symbol_config(symbol)
-                if config:
-                    export_data['symbol_configs'][symbol] = config
-            
-            # 파일로 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            valid_symbols = list(self._load_all_symbol_configs(symbols))
+            
+            # 파일로 저장 (전체 딕셔너리를 만들지 않고 종목 파일 원본 바이트를 순차 기록)
+            with open(output_file, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(b'{\n  "export_date": ')
+                f.write(_dumps(now.isoformat()))
+                f.write(b',\n  "global_config": ')
+                f.write(_dumps(self.global_config))
+                f.write(b',\n  "symbol_configs": {')
+                
+                for i, symbol in enumerate(valid_symbols):
+                    f.write(b',\n    ' if i else b'\n    ')
+                    f.write(_dumps(symbol))
+                    f.write(b': ')
+                    with open(self.symbol_configs_dir / f"{symbol}{_CONFIG_SUFFIX}", 'rb',
+                              buffering=_IO_BUFFER_SIZE) as src:
+                        shutil.copyfileobj(src, f, _IO_BUFFER_SIZE)
+                
+                f.write(b'\n  }\n}' if valid_symbols else b'}\n}')
             
             self.logger.info(f"설정 내보내기 완료: {output_file}")
             return True
@@ -352,8 +671,11 @@ class ConfigManager:
             가져오기 성공 여부
         """
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = _loads(Path(import_file).read_bytes())
+            
+            # 압축 형식(2.0) 종목 설정 복원용 스키마 (가져오는 파일 기준)
+            import_schema = list(import_data.get('global_config', {}).get(
+                'best_parameters_schema', _PARAMETER_SCHEMA))
             
             # 전역 설정 가져오기
             if 'global_config' in import_data:
@@ -363,6 +685,14 @@ class ConfigManager:
             imported_count = 0
             if 'symbol_configs' in import_data:
                 for symbol, config in import_data['symbol_configs'].items():
+                    _expand_parameters(config, import_schema)
+                    
+                    # 저장 형식 그대로인 설정은 재구성 없이 바로 기록
+                    if config.get('symbol') == symbol and self._validate_config(config):
+                        self._write_symbol_config(symbol, config)
+                        imported_count += 1
+                        continue
+                    
                     # 최적화 결과 형태로 변환
                     optimization_result = {
                         'best_parameters': config.get('best_parameters', {}),
@@ -395,23 +725,37 @@ class ConfigManager:
             정리된 파일 수
         """
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_old)
+            # 기준 시각을 타임스탬프로 한 번만 계산해 파일별 datetime 생성 생략
+            cutoff_ts = (datetime.now() - timedelta(days=days_old)).timestamp()
             cleaned_count = 0
             
-            for config_file in self.symbol_configs_dir.glob("*_config.json"):
-                try:
-                    # 파일 수정 시간 확인
-                    file_mtime = datetime.fromtimestamp(config_file.stat().st_mtime)
-                    
-                    if file_mtime < cutoff_date:
-                        config_file.unlink()  # 파일 삭제
+            # 삭제 대상 선별 (파일 수정 시간은 DirEntry의 stat 결과 재사용)
+            expired = []
+            with os.scandir(self.symbol_configs_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(_CONFIG_SUFFIX):
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                            expired.append(entry)
+                    except OSError as e:
+                        self.logger.warning(f"파일 정리 실패 ({entry.name}): {str(e)}")
+            
+            # 파일 삭제를 스레드 풀에서 병렬 실행 (네트워크 파일시스템 왕복 지연 중첩)
+            if expired:
+                with ThreadPoolExecutor(max_workers=min(_CLEANUP_WORKERS, len(expired))) as executor:
+                    futures = {executor.submit(os.unlink, entry.path): entry for entry in expired}
+                    for future in as_completed(futures):
+                        entry = futures[future]
+                        try:
+                            future.result()
+                        except OSError as e:
+                            self.logger.warning(f"파일 정리 실패 ({entry.name}): {str(e)}")
+                            continue
+                        self._config_cache.pop(entry.name[:-len(_CONFIG_SUFFIX)], None)
                         cleaned_count += 1
-                        self.logger.info(f"오래된 설정 파일 삭제: {config_file.name}")
-                        
-                except Exception as e:
-                    self.logger.warning(f"파일 정리 실패 ({config_file.name}): {str(e)}")
-                    continue
             
+            # 파일별 로그 대신 한 줄로 집계
             self.logger.info(f"설정 파일 정리 완료: {cleaned_count}개 파일 삭제")
             return cleaned_count
             
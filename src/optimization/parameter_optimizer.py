@@ -6,18 +6,94 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Callable
 import logging
+import functools
+from collections import Counter
 from datetime import datetime
-import itertools
-from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
+import multiprocessing.pool
+from multiprocessing import shared_memory
+from contextlib import contextmanager
+import threading
 import sys
 import os
+import glob
 
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+try:
+    from scipy.stats import qmc
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import optuna
+    OPTUNA_AVAILABLE = True
+except ImportError:
+    OPTUNA_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401 (pandas parquet 엔진)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from src.backtesting.backtest_engine import BacktestEngine
 from src.trading_signals.enhanced_signal_integrator import EnhancedSignalIntegrator
+from src.data_collection.yahoo_finance_collector import YahooFinanceCollector
+
+# 워커 프로세스당 최대 작업 수 (초과 시 워커 재생성으로 pandas·백테스터 메모리 누적 해제)
+_MAX_TASKS_PER_CHILD = 20
+
+# 워커당 동시에 제출해 두는 최대 청크 수 (미완료 작업·결과가 메모리에 쌓이지 않도록 제한)
+_IN_FLIGHT_PER_WORKER = 2
+
+# 중간 결과 체크포인트 저장 간격 (유효 결과 수 기준)
+_CHECKPOINT_INTERVAL = 50
+
+# 작업 1건에 묶는 조합 수 (피클링·파이프 왕복 횟수 감소, 지표 분석·가중 강도 계산을 묶음 단위로 공유)
+_EVAL_BATCH_SIZE = 8
+
+# 조기 중단 기준: 워밍업 이후 초기 구간 백테스트에서 거래 수가 이보다 적거나 샤프 비율이 음수면 전체 구간 생략
+_EARLY_STOP_MIN_TRADES = 3
+
+# 조합별 평가 결과 열과 자료형 (결과를 딕셔너리 목록 대신 열 배열로 수집)
+# 성과 지표 비교에는 float32 정밀도로 충분 (메모리·집계 대역폭 절반)
+_RESULT_COLUMNS = {
+    'optimization_score': np.float32,
+    'total_return': np.float32,
+    'sharpe_ratio': np.float32,
+    'max_drawdown': np.float32,
+    'win_rate': np.float32,
+    'profit_factor': np.float32,
+    'total_trades': np.int64,
+    'calmar_ratio': np.float32,
+    'pruned': np.bool_
+}
+
+# 워커와 공유하는 주가 데이터 컬럼 (공유 메모리에 float64로 적재)
+_OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# 기술적 지표 가중치 매개변수 (합이 1이 되어야 유효한 조합)
+_TECHNICAL_WEIGHT_KEYS = ('ma_weight', 'rsi_weight', 'macd_weight', 'bb_weight', 'volume_weight', 'stoch_weight')
+
+# 매개변수 공간에 없는 가중치의 기본값
+_WEIGHT_DEFAULTS = {
+    'ma_weight': 0.2,
+    'rsi_weight': 0.15,
+    'macd_weight': 0.2,
+    'bb_weight': 0.15,
+    'volume_weight': 0.15,
+    'stoch_weight': 0.15,
+    'institutional_weight': 0.25
+}
 
 class ParameterOptimizer:
     """매개변수 최적화기 - 그리드 서치 기반"""
@@ -25,19 +101,25 @@ class ParameterOptimizer:
     def __init__(self, 
                  optimization_metric: str = 'sharpe_ratio',
                  max_workers: Optional[int] = None,
-                 verbose: bool = True):
+                 verbose: bool = True,
+                 expected_worker_mem_mb: int = 500,
+                 early_stop_days: Optional[int] = 60):
         """
         초기화
         
         Args:
             optimization_metric: 최적화 목표 지표 ('sharpe_ratio', 'total_return', 'win_rate', 'profit_factor')
-            max_workers: 병렬 처리 워커 수 (None이면 CPU 코어 수)
+            max_workers: 병렬 처리 워커 수 (None이면 CPU 코어 수·가용 메모리 기준 자동 결정)
             verbose: 상세 로그 출력 여부
+            expected_worker_mem_mb: 워커 1개당 예상 메모리 사용량 (MB, 자동 워커 수 결정에 사용)
+            early_stop_days: 조기 중단 판정용 초기 백테스트 일수, 지표 워밍업 이후부터 계산 (None 또는 0이면 항상 전체 구간 평가)
         """
         self.optimization_metric = optimization_metric
-        self.max_workers = max_workers or min(multiprocessing.cpu_count(), 8)
         self.verbose = verbose
         self.logger = self._setup_logger()
+        self.max_workers = max_workers or self._default_max_workers(expected_worker_mem_mb)
+        self.logger.info(f"병렬 처리 워커 수: {self.max_workers}")
+        self.early_stop_days = early_stop_days
         
         # 최적화 가능한 지표 목록
         self.available_metrics = {
@@ -69,10 +151,30 @@ class ParameterOptimizer:
         
         return logger
     
+    def _default_max_workers(self, expected_worker_mem_mb: int) -> int:
+        """
+        기본 워커 수 결정 (CPU 코어 수, 8, 가용 메모리 / 워커당 예상 메모리 중 최솟값)
+        
+        PYTHON_CPU_COUNT 환경 변수가 있으면 CPU 코어 수 대신 사용
+        """
+        cpu_count = os.environ.get('PYTHON_CPU_COUNT', '')
+        cpu_count = int(cpu_count) if cpu_count.isdigit() and int(cpu_count) > 0 else multiprocessing.cpu_count()
+        
+        max_workers = min(cpu_count, 8)
+        
+        # 가용 메모리 기준 상한 (워커가 많아 스왑이 발생하면 처리량이 오히려 감소)
+        if PSUTIL_AVAILABLE:
+            per_worker_bytes = max(1, expected_worker_mem_mb) * 1024 * 1024
+            memory_cap = max(1, int(psutil.virtual_memory().available // per_worker_bytes))
+            max_workers = min(max_workers, memory_cap)
+        
+        return max_workers
+    
     def optimize_signal_integrator(self, 
                                  symbol: str,
                                  period: str = "2y",
-                                 parameter_space: Optional[Dict[str, List]] = None) -> Dict[str, Any]:
+                                 parameter_space: Optional[Dict[str, List]] = None,
+                                 checkpoint_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         신호 통합기 매개변수 최적화
         
@@ -80,6 +182,7 @@ class ParameterOptimizer:
             symbol: 최적화 대상 종목
             period: 백테스팅 기간
             parameter_space: 매개변수 공간 정의
+            checkpoint_dir: 중간 결과 저장 디렉토리 (지정 시 중단 후 재실행하면 평가한 조합은 건너뜀)
             
         Returns:
             최적화 결과
@@ -96,12 +199,14 @@ class ParameterOptimizer:
             
             self.logger.info(f"총 {len(param_combinations)}개 매개변수 조합 테스트")
             
-            # 병렬 최적화 실행
-            results = self._run_parallel_optimization(
-                symbol, period, param_combinations
-            )
+            # 병렬 최적화 실행 (주가 데이터는 한 번만 수집해 워커와 공유)
+            with self._shared_price_data(symbol, period) as price_handle:
+                results = self._run_parallel_optimization(
+                    symbol, period, param_combinations, price_handle,
+                    os.path.join(checkpoint_dir, f"{symbol}_{period}") if checkpoint_dir else None
+                )
             
-            if not results:
+            if len(results) == 0:
                 raise ValueError("최적화 결과가 없습니다.")
             
             # 결과 분석 및 최적 매개변수 선택
@@ -117,6 +222,249 @@ class ParameterOptimizer:
             self.logger.error(f"매개변수 최적화 오류: {str(e)}")
             return {'error': str(e)}
     
+    def optimize_signal_integrator_bayesian(self,
+                                          symbol: str,
+                                          period: str = "2y",
+                                          parameter_space: Optional[Dict[str, List]] = None,
+                                          n_trials: int = 200) -> Dict[str, Any]:
+        """
+        신호 통합기 매개변수 베이지안 최적화 (Optuna TPE)
+        
+        이전 평가 점수를 바탕으로 다음 매개변수를 제안해 그리드 서치보다 적은 백테스트로 탐색.
+        워커 수만큼 매개변수를 한 번에 제안받아 프로세스 풀에서 병렬 평가
+        
+        Args:
+            symbol: 최적화 대상 종목
+            period: 백테스팅 기간
+            parameter_space: 매개변수 공간 정의
+            n_trials: 최대 평가 횟수
+            
+        Returns:
+            최적화 결과 (optimize_signal_integrator와 같은 형식)
+        """
+        if not OPTUNA_AVAILABLE:
+            self.logger.warning("optuna가 설치되지 않아 그리드 서치로 대체합니다. pip install optuna로 설치해주세요.")
+            return self.optimize_signal_integrator(symbol, period, parameter_space)
+        
+        try:
+            self.logger.info(f"신호 통합기 베이지안 최적화 시작: {symbol} ({n_trials}회)")
+            
+            if parameter_space is None:
+                parameter_space = self._get_default_parameter_space()
+            
+            optuna.logging.set_verbosity(optuna.logging.WARNING)
+            
+            # max_drawdown은 최소화, 나머지 지표는 최대화
+            # constant_liar: 평가 중인 매개변수 주변을 피해 병렬 제안이 한곳에 몰리지 않도록 함
+            study = optuna.create_study(
+                direction='minimize' if self.optimization_metric == 'max_drawdown' else 'maximize',
+                sampler=optuna.samplers.TPESampler(seed=42, constant_liar=True)
+            )
+            
+            results = []
+            remaining = n_trials
+            
+            with self._shared_price_data(symbol, period) as price_handle, self._create_process_pool(price_handle) as pool:
+                while remaining > 0:
+                    # 워커 수만큼 매개변수 제안 (가중치 합이 맞지 않는 조합은 평가 없이 제외)
+                    trials = []
+                    for _ in range(min(self.max_workers, remaining)):
+                        trial = study.ask()
+                        params = {name: trial.suggest_categorical(name, values)
+                                  for name, values in parameter_space.items()}
+                        
+                        if self._is_valid_weight_combination(params):
+                            trials.append((trial, params))
+                        else:
+                            study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+                    
+                    remaining -= self.max_workers
+                    
+                    if not trials:
+                        continue
+                    
+                    tasks = [(self, symbol, period, params) for _, params in trials]
+                    
+                    for (trial, _), (params, result, error) in zip(
+                            trials, pool.map(_evaluate_combination_task, tasks)):
+                        if error is not None:
+                            self.logger.warning(f"매개변수 조합 평가 실패: {error}")
+                        
+                        if result and result.get('pruned'):
+                            study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+                            result['parameters'] = params
+                            results.append(result)
+                        elif result and 'error' not in result:
+                            study.tell(trial, result['optimization_score'])
+                            result['parameters'] = params
+                            results.append(result)
+                        else:
+                            study.tell(trial, state=optuna.trial.TrialState.FAIL)
+                    
+                    self.logger.info(f"진행률: {min(100, (n_trials - max(remaining, 0)) / n_trials * 100):.1f}% (완료: {len(results)}개)")
+            
+            if not results:
+                raise ValueError("최적화 결과가 없습니다.")
+            
+            optimization_result = self._analyze_optimization_results(results, parameter_space)
+            
+            self.logger.info(f"베이지안 최적화 완료 - 최적 {self.optimization_metric}: {optimization_result['best_score']:.4f}")
+            
+            return optimization_result
+            
+        except Exception as e:
+            self.logger.error(f"베이지안 최적화 오류: {str(e)}")
+            return {'error': str(e)}
+    
+    def optimize_ga(self,
+                    symbol: str,
+                    period: str = "2y",
+                    parameter_space: Optional[Dict[str, List]] = None,
+                    generations: int = 20,
+                    pop: int = 32) -> Dict[str, Any]:
+        """
+        신호 통합기 매개변수 유전 알고리즘 최적화
+        
+        토너먼트 선택 + 가중치 산술 교차 + 소폭 변이로 세대를 거듭하며 탐색.
+        기술적 지표 가중치는 교차·변이 후 합이 1이 되도록 보정하고, 이미 평가한 개체는 재평가하지 않음
+        
+        Args:
+            symbol: 최적화 대상 종목
+            period: 백테스팅 기간
+            parameter_space: 매개변수 공간 정의 (가중치는 변이 범위로도 사용)
+            generations: 세대 수
+            pop: 세대당 개체 수
+            
+        Returns:
+            최적화 결과 (optimize_signal_integrator와 같은 형식)
+        """
+        try:
+            self.logger.info(f"신호 통합기 유전 알고리즘 최적화 시작: {symbol} ({generations}세대 x {pop}개체)")
+            
+            if parameter_space is None:
+                parameter_space = self._get_default_parameter_space()
+            
+            rng = np.random.default_rng(42)
+            weight_keys = [key for key in _TECHNICAL_WEIGHT_KEYS if key in parameter_space]
+            
+            # max_drawdown은 최소화, 나머지 지표는 최대화 (적합도는 클수록 좋도록 부호 통일)
+            sign = -1.0 if self.optimization_metric == 'max_drawdown' else 1.0
+            
+            # 초기 개체군: 매개변수 공간에서 무작위 추출 후 가중치 보정
+            population = [
+                self._repair_weights({key: values[rng.integers(len(values))]
+                                      for key, values in parameter_space.items()}, weight_keys)
+                for _ in range(pop)
+            ]
+            
+            # 매개변수 키 → 평가 결과 (실패·무효 조합은 None)
+            evaluated = {}
+            
+            with self._shared_price_data(symbol, period) as price_handle, self._create_process_pool(price_handle) as pool:
+                for generation in range(1, generations + 1):
+                    # 아직 평가하지 않은 유효 개체만 병렬 평가 (엘리트·중복 개체는 결과 재사용)
+                    pending = {}
+                    for params in population:
+                        key = _params_key(params)
+                        if key in evaluated or key in pending:
+                            continue
+                        if self._is_valid_weight_combination(params):
+                            pending[key] = params
+                        else:
+                            evaluated[key] = None
+                    
+                    tasks = [(self, symbol, period, params) for params in pending.values()]
+                    for key, (params, result, error) in zip(pending, pool.map(_evaluate_combination_task, tasks)):
+                        if error is not None:
+                            self.logger.warning(f"매개변수 조합 평가 실패: {error}")
+                        
+                        if result and 'error' not in result:
+                            result['parameters'] = params
+                            evaluated[key] = result
+                        else:
+                            evaluated[key] = None
+                    
+                    # 조기 중단된 조합은 초기 구간 성과뿐이므로 선택 대상에서 제외
+                    fitness = np.array([
+                        sign * evaluated[key]['optimization_score']
+                        if evaluated[key] and not evaluated[key].get('pruned') else -np.inf
+                        for key in map(_params_key, population)
+                    ])
+                    
+                    if np.isfinite(fitness).any():
+                        self.logger.info(f"세대 {generation}/{generations} - 최고 {self.optimization_metric}: "
+                                         f"{sign * fitness.max():.4f} (누적 평가: {len(evaluated)}개)")
+                    
+                    if generation < generations:
+                        population = self._next_generation(population, fitness, parameter_space, weight_keys, rng)
+            
+            results = [result for result in evaluated.values() if result]
+            
+            if not results:
+                raise ValueError("최적화 결과가 없습니다.")
+            
+            optimization_result = self._analyze_optimization_results(results, parameter_space)
+            
+            self.logger.info(f"유전 알고리즘 최적화 완료 - 최적 {self.optimization_metric}: {optimization_result['best_score']:.4f}")
+            
+            return optimization_result
+            
+        except Exception as e:
+            self.logger.error(f"유전 알고리즘 최적화 오류: {str(e)}")
+            return {'error': str(e)}
+    
+    def _next_generation(self,
+                         population: List[Dict[str, Any]],
+                         fitness: np.ndarray,
+                         parameter_space: Dict[str, List],
+                         weight_keys: List[str],
+                         rng: np.random.Generator,
+                         elite: int = 2,
+                         tournament_size: int = 3,
+                         mutation_rate: float = 0.1) -> List[Dict[str, Any]]:
+        """
+        다음 세대 개체군 생성
+        
+        상위 elite개 개체는 그대로 유지하고, 나머지는 토너먼트로 고른 두 부모를 교차·변이해 생성
+        (가중치: 산술 교차 + 가우시안 변이, 그 외: 균등 교차 + 값 목록에서 재추출)
+        """
+        order = np.argsort(-fitness, kind='stable')
+        next_population = [population[i] for i in order[:elite]]
+        
+        def select() -> Dict[str, Any]:
+            contenders = rng.integers(len(population), size=tournament_size)
+            return population[contenders[np.argmax(fitness[contenders])]]
+        
+        while len(next_population) < len(population):
+            parent_a, parent_b = select(), select()
+            alpha = rng.random()
+            
+            child = {}
+            for key, values in parameter_space.items():
+                if key in weight_keys:
+                    child[key] = alpha * parent_a[key] + (1 - alpha) * parent_b[key]
+                    if rng.random() < mutation_rate:
+                        low, high = min(values), max(values)
+                        child[key] = float(np.clip(child[key] + rng.normal(0, (high - low) / 2 or 0.01), low, high))
+                else:
+                    child[key] = parent_a[key] if rng.random() < 0.5 else parent_b[key]
+                    if rng.random() < mutation_rate:
+                        child[key] = values[rng.integers(len(values))]
+            
+            next_population.append(self._repair_weights(child, weight_keys))
+        
+        return next_population
+    
+    def _repair_weights(self, params: Dict[str, Any], weight_keys: List[str]) -> Dict[str, Any]:
+        """기술적 지표 가중치 합이 1이 되도록 정규화 (소수점 4자리, 제자리 수정)"""
+        if len(weight_keys) == len(_TECHNICAL_WEIGHT_KEYS):
+            total = sum(params[key] for key in weight_keys)
+            if total > 0:
+                for key in weight_keys:
+                    params[key] = round(params[key] / total, 4)
+        
+        return params
+    
     def _get_default_parameter_space(self) -> Dict[str, List]:
         """기본 매개변수 공간 정의"""
         return {
@@ -151,27 +499,34 @@ class ParameterOptimizer:
             total_combinations = np.prod([len(v) for v in values])
             
             if total_combinations > 1000:  # 1000개 초과시 샘플링
-                self.logger.warning(f"매개변수 조합이 {total_combinations}개로 많음. 랜덤 샘플링 적용")
-                
-                # 랜덤 샘플링
-                np.random.seed(42)  # 재현 가능성을 위한 시드 설정
+                n_samples = int(min(500, total_combinations))  # 최대 500개 조합
                 
-                for _ in range(min(500, total_combinations)):  # 최대 500개 조합
-                    combination = {}
-                    for key, value_list in parameter_space.items():
-                        combination[key] = np.random.choice(value_list)
+                if SCIPY_AVAILABLE:
+                    self.logger.warning(f"매개변수 조합이 {total_combinations}개로 많음. 라틴 하이퍼큐브 샘플링 적용")
                     
-                    # 가중치 정규화 체크
-                    if self._is_valid_weight_combination(combination):
-                        combinations.append(combination)
-            else:
-                # 전체 그리드 서치
-                for combination_values in itertools.product(*values):
-                    combination = dict(zip(keys, combination_values))
+                    # 라틴 하이퍼큐브: 매개변수마다 값 구간을 고르게 채우는 준난수 표본 (랜덤 샘플 쏠림 방지)
+                    sampler = qmc.LatinHypercube(d=len(keys), seed=42)  # 재현 가능성을 위한 시드 설정
+                    u = sampler.random(n=n_samples)
+                    indices = np.floor(u * np.array([len(v) for v in values])).astype(int)
+                    
+                    # 가중치 정규화 체크 (전체 표본 일괄 검사)
+                    combinations = self._valid_combinations(keys, values, indices)
+                else:
+                    self.logger.warning(f"매개변수 조합이 {total_combinations}개로 많음. 랜덤 샘플링 적용")
+                    
+                    # 랜덤 샘플링 (매개변수별 값 인덱스를 한 번에 추출)
+                    rng = np.random.default_rng(42)  # 재현 가능성을 위한 시드 설정
+                    indices = np.column_stack([rng.integers(0, len(v), size=n_samples) for v in values])
                     
-                    # 가중치 정규화 체크
-                    if self._is_valid_weight_combination(combination):
-                        combinations.append(combination)
+                    # 가중치 정규화 체크 (전체 표본 일괄 검사)
+                    combinations = self._valid_combinations(keys, values, indices)
+            else:
+                # 전체 그리드 서치 (itertools.product와 같은 순서의 값 인덱스 행렬)
+                shape = [len(v) for v in values]
+                indices = np.indices(shape).reshape(len(shape), -1).T
+                
+                # 가중치 정규화 체크 (전체 조합 일괄 검사)
+                combinations = self._valid_combinations(keys, values, indices)
             
             self.logger.info(f"유효한 매개변수 조합 생성: {len(combinations)}개")
             return combinations
@@ -180,29 +535,61 @@ class ParameterOptimizer:
             self.logger.error(f"매개변수 조합 생성 오류: {str(e)}")
             return []
     
+    def _valid_combinations(self,
+                            keys: List[str],
+                            values: List[List],
+                            indices: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        값 인덱스 행렬에서 가중치가 유효한 조합만 딕셔너리로 변환
+        
+        Args:
+            keys: 매개변수 이름
+            values: 매개변수별 값 목록
+            indices: (조합 수, 매개변수 수) 값 인덱스 행렬
+            
+        Returns:
+            유효한 매개변수 조합 리스트 (값은 원래 목록의 객체 그대로)
+        """
+        try:
+            # 가중치 매개변수만 조합 수 길이의 열 배열로 펼침
+            columns = {
+                key: np.asarray(value_list, dtype=np.float64)[indices[:, j]]
+                for j, (key, value_list) in enumerate(zip(keys, values))
+                if key in _WEIGHT_DEFAULTS
+            }
+        except (TypeError, ValueError):
+            # 수치가 아닌 가중치 값이 있으면 조합별 검사
+            candidates = ({key: value_list[i] for key, value_list, i in zip(keys, values, row)} for row in indices)
+            return [combination for combination in candidates if self._is_valid_weight_combination(combination)]
+        
+        mask = self._valid_weight_mask(columns, len(indices))
+        
+        return [{key: value_list[i] for key, value_list, i in zip(keys, values, row)} for row in indices[mask]]
+    
+    def _valid_weight_mask(self, columns: Dict[str, np.ndarray], n: int) -> np.ndarray:
+        """
+        가중치 유효성 일괄 검사 (_is_valid_weight_combination의 벡터화 버전)
+        
+        합계를 같은 순서로 누적해 조합별 검사와 경계값 판정이 동일
+        """
+        technical_sum = np.zeros(n)
+        for key in _TECHNICAL_WEIGHT_KEYS:
+            technical_sum = technical_sum + columns.get(key, _WEIGHT_DEFAULTS[key])
+        
+        institutional_weight = columns.get('institutional_weight', _WEIGHT_DEFAULTS['institutional_weight'])
+        total_weight = technical_sum * (1 - institutional_weight) + institutional_weight
+        
+        return (total_weight >= 0.95) & (total_weight <= 1.05)
+    
     def _is_valid_weight_combination(self, params: Dict[str, Any]) -> bool:
-        """가중치 조합 유효성 검사"""
+        """가중치 조합 유효성 검사 (가중치 값만으로 판정하므로 가중치 튜플 단위로 캐시)"""
         try:
             # 기술적 지표 가중치들
-            technical_weights = [
-                params.get('ma_weight', 0.2),
-                params.get('rsi_weight', 0.15),
-                params.get('macd_weight', 0.2),
-                params.get('bb_weight', 0.15),
-                params.get('volume_weight', 0.15),
-                params.get('stoch_weight', 0.15)
-            ]
-            
-            institutional_weight = params.get('institutional_weight', 0.25)
+            technical_weights = [params.get(key, _WEIGHT_DEFAULTS[key]) for key in _TECHNICAL_WEIGHT_KEYS]
             
-            # 기술적 지표 가중치 합계
-            technical_sum = sum(technical_weights)
+            institutional_weight = params.get('institutional_weight', _WEIGHT_DEFAULTS['institutional_weight'])
             
-            # 전체 가중치 = 기술적 지표 * (1 - 기관 가중치) + 기관 가중치
-            total_weight = technical_sum * (1 - institutional_weight) + institutional_weight
-            
-            # 0.95 ~ 1.05 범위 허용 (부동소수점 오차 고려)
-            return 0.95 <= total_weight <= 1.05
+            return _weights_valid(*technical_weights, institutional_weight)
             
         except Exception:
             return False
@@ -210,130 +597,403 @@ class ParameterOptimizer:
     def _run_parallel_optimization(self, 
                                  symbol: str,
                                  period: str,
-                                 param_combinations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """병렬 최적화 실행"""
-        try:
-            results = []
+                                 param_combinations: List[Dict[str, Any]],
+                                 price_handle: Optional[Dict[str, Any]] = None,
+                                 checkpoint_dir: Optional[str] = None) -> pd.DataFrame:
+        """
+        병렬 최적화 실행
+        
+        Args:
+            symbol: 최적화 대상 종목
+            period: 백테스팅 기간
+            param_combinations: 평가할 매개변수 조합
+            price_handle: 공유 메모리 주가 데이터 정보 (None이면 워커가 조합마다 직접 수집)
+            checkpoint_dir: 중간 결과 저장 디렉토리 (None이면 저장하지 않음)
             
-            # 배치 크기 설정 (메모리 효율성)
-            batch_size = min(50, len(param_combinations))
+        Returns:
+            유효 결과 DataFrame (지표 열 + 'parameters' 열, 이전 체크포인트 결과 포함)
+        """
+        try:
+            # 이전 실행의 체크포인트 결과 로드 후 이미 평가한 조합 제외
+            previous = pd.DataFrame()
+            checkpoint_index = 0
             
-            for i in range(0, len(param_combinations), batch_size):
-                batch = param_combinations[i:i+batch_size]
+            if checkpoint_dir:
+                os.makedirs(checkpoint_dir, exist_ok=True)
+                previous, checkpoint_index = self._load_checkpoints(checkpoint_dir)
                 
-                self.logger.info(f"배치 {i//batch_size + 1}/{(len(param_combinations) + batch_size - 1)//batch_size} 처리 중... ({len(batch)}개 조합)")
+                if len(previous) > 0:
+                    done = {_params_key(params) for params in previous['parameters']}
+                    param_combinations = [params for params in param_combinations if _params_key(params) not in done]
+                    self.logger.info(f"체크포인트에서 {len(previous)}개 결과 복원 - 남은 조합: {len(param_combinations)}개")
+            
+            total = len(param_combinations)
+            
+            if total == 0:
+                return previous
+            
+            # 결과 열 배열 미리 할당 (조합 수만큼, 유효 결과를 앞에서부터 채움)
+            columns = {name: np.empty(total, dtype=dtype) for name, dtype in _RESULT_COLUMNS.items()}
+            parameters = [None] * total
+            filled = 0
+            flushed = 0
+            
+            # 진행률 출력 간격 (50개 완료마다)
+            batch_size = min(50, total)
+            
+            # 동시 제출 작업 수 제한: 묶음 결과를 하나 받을 때마다 다음 묶음 한 개 제출
+            slots = threading.BoundedSemaphore(_IN_FLIGHT_PER_WORKER * self.max_workers)
+            stop = threading.Event()
+            
+            # 프로세스 풀은 한 번만 생성해 전체 조합 제출 (배치마다 프로세스 생성·모듈 import 반복 제거)
+            with self._create_process_pool(price_handle) as pool:
+                tasks = _bounded_tasks(
+                    ((self, symbol, period, param_combinations[start:start + _EVAL_BATCH_SIZE])
+                     for start in range(0, total, _EVAL_BATCH_SIZE)),
+                    slots, stop
+                )
                 
-                # 병렬 처리
-                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                    # 작업 제출
-                    future_to_params = {}
-                    for params in batch:
-                        future = executor.submit(
-                            self._evaluate_parameter_combination,
-                            symbol, period, params
-                        )
-                        future_to_params[future] = params
+                try:
+                    completed = 0
                     
-                    # 결과 수집
-                    for future in as_completed(future_to_params):
-                        params = future_to_params[future]
-                        try:
-                            result = future.result(timeout=300)  # 5분 타임아웃
-                            if result and 'error' not in result:
-                                result['parameters'] = params
-                                results.append(result)
-                        except Exception as e:
-                            self.logger.warning(f"매개변수 조합 평가 실패: {str(e)}")
-                            continue
-                
-                # 진행률 출력
-                progress = min(100, (i + batch_size) / len(param_combinations) * 100)
-                self.logger.info(f"진행률: {progress:.1f}% (완료: {len(results)}개)")
+                    # 완료 순서대로 결과 수집
+                    for batch_results in pool.imap_unordered(_evaluate_batch_task, tasks):
+                        slots.release()
+                        
+                        for params, result, error in batch_results:
+                            completed += 1
+                            
+                            if error is not None:
+                                self.logger.warning(f"매개변수 조합 평가 실패: {error}")
+                            elif result and 'error' not in result:
+                                for name, column in columns.items():
+                                    column[filled] = result[name]
+                                parameters[filled] = params
+                                filled += 1
+                            
+                            # 진행률 출력
+                            if completed % batch_size == 0 or completed == total:
+                                progress = completed / total * 100
+                                self.logger.info(f"진행률: {progress:.1f}% (완료: {filled}개)")
+                        
+                        # 중간 결과 저장
+                        if checkpoint_dir and filled - flushed >= _CHECKPOINT_INTERVAL:
+                            self._write_checkpoint(checkpoint_dir, checkpoint_index,
+                                                   _results_frame(columns, parameters, flushed, filled))
+                            checkpoint_index += 1
+                            flushed = filled
+                finally:
+                    # 중단 시 대기 중인 제출 스레드를 풀어 풀 종료가 멈추지 않도록 함
+                    stop.set()
+                    
+                    # 중단되더라도 저장하지 않은 결과는 체크포인트로 남김
+                    if checkpoint_dir and filled > flushed:
+                        self._write_checkpoint(checkpoint_dir, checkpoint_index,
+                                               _results_frame(columns, parameters, flushed, filled))
+            
+            self.logger.info(f"병렬 최적화 완료: {filled}개 유효 결과")
             
-            self.logger.info(f"병렬 최적화 완료: {len(results)}개 유효 결과")
+            results = _results_frame(columns, parameters, 0, filled)
+            if len(previous) > 0:
+                results = pd.concat([previous, results], ignore_index=True)
             return results
             
         except Exception as e:
             self.logger.error(f"병렬 최적화 실행 오류: {str(e)}")
-            return []
+            return pd.DataFrame()
+    
+    def _write_checkpoint(self, checkpoint_dir: str, index: int, frame: pd.DataFrame):
+        """중간 결과 저장 (pyarrow 설치 시 zstd 압축 parquet, 아니면 pickle)"""
+        try:
+            if PYARROW_AVAILABLE:
+                frame.to_parquet(os.path.join(checkpoint_dir, f"opt_{index:05d}.parquet"), compression='zstd')
+            else:
+                frame.to_pickle(os.path.join(checkpoint_dir, f"opt_{index:05d}.pkl"))
+        except Exception as e:
+            self.logger.warning(f"체크포인트 저장 실패: {str(e)}")
+    
+    def _load_checkpoints(self, checkpoint_dir: str) -> Tuple[pd.DataFrame, int]:
+        """
+        체크포인트 결과 로드
+        
+        Returns:
+            (저장된 결과 DataFrame, 다음 체크포인트 번호)
+        """
+        paths = sorted(glob.glob(os.path.join(checkpoint_dir, 'opt_*.parquet')) +
+                       glob.glob(os.path.join(checkpoint_dir, 'opt_*.pkl')))
+        
+        frames = []
+        next_index = 0
+        for path in paths:
+            try:
+                if path.endswith('.parquet'):
+                    frames.append(pd.read_parquet(path))
+                else:
+                    frames.append(pd.read_pickle(path))
+                
+                index = int(os.path.basename(path).split('_')[1].split('.')[0])
+                next_index = max(next_index, index + 1)
+            except Exception as e:
+                self.logger.warning(f"체크포인트 로드 실패: {path} - {str(e)}")
+        
+        if not frames:
+            return pd.DataFrame(), next_index
+        
+        return pd.concat(frames, ignore_index=True), next_index
+    
+    def _create_process_pool(self, price_handle: Optional[Dict[str, Any]] = None) -> multiprocessing.pool.Pool:
+        """
+        최적화용 프로세스 풀 생성 (워커당 작업 수 제한으로 주기적 워커 재생성)
+        
+        Args:
+            price_handle: 공유 메모리 주가 데이터 정보 (워커 시작 시 한 번 복원, None이면 워커가 직접 수집)
+        """
+        return multiprocessing.Pool(
+            processes=self.max_workers,
+            initializer=_init_worker,
+            initargs=(price_handle,),
+            maxtasksperchild=_MAX_TASKS_PER_CHILD
+        )
+    
+    def prefetch_ohlcv(self, symbol: str, period: str = "2y") -> Optional[pd.DataFrame]:
+        """
+        백테스트용 주가 데이터 수집 (date + OHLCV)
+        
+        Args:
+            symbol: 종목 코드 (예: '005930.KS')
+            period: 수집 기간
+            
+        Returns:
+            주가 DataFrame (수집 실패 시 None)
+        """
+        data = YahooFinanceCollector().get_stock_data(symbol, period=period)
+        
+        if data is None or data.empty:
+            return None
+        
+        return data[['date', *_OHLCV_COLUMNS]]
+    
+    @contextmanager
+    def _shared_price_data(self, symbol: str, period: str):
+        """
+        주가 데이터를 한 번 수집해 공유 메모리에 적재 (워커가 조합마다 다시 다운로드·파싱하지 않도록 함)
+        
+        블록 구성: [날짜 int64 (UTC ns) x 행 수][OHLCV float64 x 행 수 x 5]
+        
+        Yields:
+            워커 전달용 공유 메모리 정보 (수집 실패 시 None)
+        """
+        data = self.prefetch_ohlcv(symbol, period)
+        
+        if data is None or data.empty:
+            self.logger.warning(f"주가 데이터 사전 수집 실패: {symbol} (워커에서 개별 수집)")
+            yield None
+            return
+        
+        dates = pd.DatetimeIndex(data['date'])
+        tz = str(dates.tz) if dates.tz is not None else None
+        if tz is not None:
+            dates = dates.tz_convert('UTC').tz_localize(None)
+        
+        dates_ns = dates.values.astype('datetime64[ns]').view(np.int64)
+        values = data[list(_OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+        
+        shm = shared_memory.SharedMemory(create=True, size=dates_ns.nbytes + values.nbytes)
+        try:
+            np.ndarray(dates_ns.shape, dtype=np.int64, buffer=shm.buf)[:] = dates_ns
+            np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf, offset=dates_ns.nbytes)[:] = values
+            
+            yield {'name': shm.name, 'rows': len(values), 'tz': tz}
+        finally:
+            shm.close()
+            shm.unlink()
     
     def _evaluate_parameter_combination(self, 
                                       symbol: str,
                                       period: str,
-                                      params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """개별 매개변수 조합 평가"""
+                                      params: Dict[str, Any],
+                                      price_data: Optional[pd.DataFrame] = None) -> Optional[Dict[str, Any]]:
+        """
+        개별 매개변수 조합 평가
+        
+        Args:
+            symbol: 종목 코드
+            period: 백테스팅 기간
+            params: 매개변수 조합
+            price_data: 미리 수집한 주가 데이터 (None이면 직접 수집)
+        """
+        return self._evaluate_parameter_batch(symbol, period, [params], price_data)[0]
+    
+    def _evaluate_parameter_batch(self,
+                                  symbol: str,
+                                  period: str,
+                                  param_batch: List[Dict[str, Any]],
+                                  price_data: Optional[pd.DataFrame] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        매개변수 조합 묶음 평가
+        
+        지표 분석·점수 계산은 매개변수와 무관하므로 주가 데이터당 한 번만 수행하고,
+        조합별 가중 신호 강도는 (T, 지표 수) 점수 행렬과 (조합 수, 지표 수) 가중치 행렬의 곱으로 한 번에 계산
+        
+        Args:
+            symbol: 종목 코드
+            period: 백테스팅 기간
+            param_batch: 매개변수 조합 리스트
+            price_data: 미리 수집한 주가 데이터 (None이면 직접 수집)
+            
+        Returns:
+            조합 순서대로 평가 결과 (평가 실패 시 None)
+        """
+        try:
+            if price_data is None:
+                price_data = self.prefetch_ohlcv(symbol, period)
+                if price_data is None:
+                    return [None] * len(param_batch)
+            
+            # 지표 분석 및 점수 계산 (묶음 공통, 같은 주가 데이터면 이전 묶음 결과 재사용)
+            scored_data, score_columns, warmup = _prepare_scored_data(symbol, price_data)
+            
+            # 조합별 가중치 행렬 → 가중 신호 강도 (T, 조합 수)
+            weight_keys = [column[:-len('_score')] + '_weight' for column in score_columns]
+            weight_matrix = np.array([
+                [params.get(key, _WEIGHT_DEFAULTS[key]) for key in weight_keys]
+                for params in param_batch
+            ], dtype=np.float64)
+            
+            # 기술적 지표 가중치는 (1 - 기관 가중치) 비율로 축소
+            institutional = np.array([
+                params.get('institutional_weight', _WEIGHT_DEFAULTS['institutional_weight'])
+                for params in param_batch
+            ], dtype=np.float64)
+            weight_matrix[:, :len(_TECHNICAL_WEIGHT_KEYS)] *= (1.0 - institutional)[:, None]
+            
+            strengths = scored_data[score_columns].to_numpy(dtype=np.float64) @ weight_matrix.T
+        except Exception:
+            return [None] * len(param_batch)
+        
+        return [
+            self._backtest_parameters(symbol, params, scored_data, strengths[:, i], warmup)
+            for i, params in enumerate(param_batch)
+        ]
+    
+    def _backtest_parameters(self,
+                             symbol: str,
+                             params: Dict[str, Any],
+                             scored_data: pd.DataFrame,
+                             strength: np.ndarray,
+                             warmup: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        점수 계산이 끝난 데이터로 매개변수 조합 하나의 신호 생성·백테스트
+        
+        Args:
+            symbol: 종목 코드
+            params: 매개변수 조합
+            scored_data: 신호 점수 계산·시장 상황 조정이 끝난 데이터
+            strength: 이 조합의 가중 평균 신호 강도
+            warmup: 지표 워밍업 행 수 (조기 중단 판정 구간은 이 뒤부터)
+        """
         try:
             # 신호 통합기 생성
             integrator = EnhancedSignalIntegrator(
                 confidence_threshold=params.get('confidence_threshold', 0.7),
                 min_indicators=params.get('min_indicators', 3),
+                use_market_condition=False,
                 use_institutional_signals=True,
                 institutional_weight=params.get('institutional_weight', 0.25)
             )
             
-            # 지표별 가중치 설정
-            technical_weight = 1.0 - params.get('institutional_weight', 0.25)
-            
-            integrator.indicator_weights = {
-                'ma': params.get('ma_weight', 0.2) * technical_weight,
-                'rsi': params.get('rsi_weight', 0.15) * technical_weight,
-                'macd': params.get('macd_weight', 0.2) * technical_weight,
-                'bb': params.get('bb_weight', 0.15) * technical_weight,
-                'volume': params.get('volume_weight', 0.15) * technical_weight,
-                'stoch': params.get('stoch_weight', 0.15) * technical_weight,
-                'institutional': params.get('institutional_weight', 0.25)
-            }
+            # 백테스팅 엔진 (워커에서는 워커 시작 시 만든 엔진 재사용, 실행마다 상태 초기화됨)
+            backtester = _WORKER_BACKTESTER or _create_backtester()
             
-            # 백테스팅 엔진 초기화
-            backtester = BacktestEngine(
-                initial_capital=10000000,  # 1000만원
-                commission_rate=0.00015,   # 0.015%
-                use_risk_management=True
-            )
+            # 통합 매매 신호 생성
+            integrated_data = integrator.generate_integrated_signals_enhanced(scored_data, strength=strength)
+            filtered_data = integrator.filter_high_confidence_signals(integrated_data)
             
-            # 백테스팅 실행
-            backtest_result = backtester.run_backtest(
-                symbol=symbol,
-                period=period,
-                strategy_type='enhanced_signal_integration',
-                signal_integrator=integrator
-            )
+            # 조기 중단: 지표 워밍업 이후 초기 구간만 먼저 백테스트해 신호가 거의 없거나 손실인 조합은
+            # 전체 구간을 생략하고 초기 구간 성과로 만든 결과(pruned=True)를 반환
+            probe_end = warmup + self.early_stop_days if self.early_stop_days else 0
             
-            if 'error' in backtest_result:
-                return None
+            if 0 < probe_end < len(filtered_data):
+                probe = self._flatten_performance(backtester.run_backtest(filtered_data.iloc[:probe_end]))
+                
+                if (probe.get('total_trades', 0) < _EARLY_STOP_MIN_TRADES
+                        or probe.get('sharpe_ratio', 0) < 0):
+                    return self._performance_result(probe, pruned=True)
+                
+                # 통과한 조합은 초기 구간 백테스트 상태에 이어서 나머지 구간만 실행
+                backtest_result = backtester.continue_backtest(filtered_data.iloc[probe_end:])
+            else:
+                # 백테스팅 실행
+                backtest_result = backtester.run_backtest(filtered_data)
             
-            # 성과 지표 추출
-            performance = backtest_result.get('performance_metrics', {})
+            if not backtest_result:
+                return None
             
-            return {
-                'optimization_score': performance.get(self.optimization_metric, 0),
-                'total_return': performance.get('total_return', 0),
-                'sharpe_ratio': performance.get('sharpe_ratio', 0),
-                'max_drawdown': performance.get('max_drawdown', 0),
-                'win_rate': performance.get('win_rate', 0),
-                'profit_factor': performance.get('profit_factor', 1),
-                'total_trades': performance.get('total_trades', 0),
-                'calmar_ratio': performance.get('calmar_ratio', 0)
-            }
+            return self._performance_result(self._flatten_performance(backtest_result))
             
         except Exception as e:
             # 개별 오류는 조용히 처리 (로그 스팸 방지)
             return None
     
+    def _performance_result(self, performance: Dict[str, Any], pruned: bool = False) -> Dict[str, Any]:
+        """평가 결과 딕셔너리 생성 (pruned: 조기 중단되어 초기 구간 성과만 담긴 결과)"""
+        return {
+            'optimization_score': performance.get(self.optimization_metric, 0),
+            'total_return': performance.get('total_return', 0),
+            'sharpe_ratio': performance.get('sharpe_ratio', 0),
+            'max_drawdown': performance.get('max_drawdown', 0),
+            'win_rate': performance.get('win_rate', 0),
+            'profit_factor': performance.get('profit_factor', 1),
+            'total_trades': performance.get('total_trades', 0),
+            'calmar_ratio': performance.get('calmar_ratio', 0),
+            'pruned': pruned
+        }
+    
+    @staticmethod
+    def _flatten_performance(backtest_result: Dict[str, Any]) -> Dict[str, Any]:
+        """성과 지표 추출 (수익률·위험·거래 구분 없이 지표 이름으로 조회)"""
+        metrics = backtest_result.get('performance_metrics', {}) if backtest_result else {}
+        
+        return {
+            **metrics.get('returns', {}),
+            **metrics.get('risk', {}),
+            **metrics.get('trading', {})
+        }
+    
     def _analyze_optimization_results(self, 
-                                    results: List[Dict[str, Any]],
+                                    results: Any,
                                     parameter_space: Dict[str, List]) -> Dict[str, Any]:
-        """최적화 결과 분석"""
+        """
+        최적화 결과 분석
+        
+        Args:
+            results: 평가 결과 (열 단위 DataFrame 또는 결과 딕셔너리 리스트)
+            parameter_space: 매개변수 공간
+        """
         try:
-            if not results:
+            if len(results) == 0:
                 return {'error': '분석할 결과가 없습니다.'}
             
-            # 결과를 DataFrame으로 변환
-            df_results = pd.DataFrame(results)
+            # 결과를 DataFrame으로 변환 (병렬 그리드 서치는 이미 열 단위로 수집됨)
+            df_results = results if isinstance(results, pd.DataFrame) else pd.DataFrame(results)
+            df_results['optimization_score'] = df_results['optimization_score'].astype(np.float32, copy=False)
+            
+            # 이전 체크포인트처럼 조기 중단 여부가 없는 결과는 전체 구간 평가로 간주
+            if 'pruned' not in df_results:
+                df_results['pruned'] = False
+            df_results['pruned'] = df_results['pruned'].fillna(False).astype(bool)
+            
+            # 조기 중단된 조합은 초기 구간 성과뿐이므로 통계·민감도 분석은 전체 구간 평가 결과로만 계산
+            # (모든 조합이 조기 중단됐으면 초기 구간 성과로 계산하고 all_pruned로 표시)
+            pruned_count = int(df_results['pruned'].sum())
+            all_pruned = pruned_count == len(df_results)
+            if all_pruned:
+                self.logger.warning("모든 매개변수 조합이 조기 중단됨 - 최적 결과는 초기 구간 성과 기준")
+            df_full = df_results if all_pruned else df_results[~df_results['pruned']]
             
-            # 최적화 지표별 정렬 (max_drawdown은 최소화)
+            # 최적화 지표별 정렬 (max_drawdown은 최소화, 조기 중단된 조합은 전체 구간 평가 결과 뒤로)
             ascending = self.optimization_metric == 'max_drawdown'
-            df_sorted = df_results.sort_values('optimization_score', ascending=ascending)
+            df_sorted = df_results.sort_values(['pruned', 'optimization_score'], ascending=[True, ascending])
             
             # 최적 결과
             best_result = df_sorted.iloc[0] if not ascending else df_sorted.iloc[0]
@@ -344,15 +1004,16 @@ class ParameterOptimizer:
             top_results = df_sorted.head(top_n) if not ascending else df_sorted.head(top_n)
             
             # 매개변수 민감도 분석
-            sensitivity_analysis = self._perform_sensitivity_analysis(df_results, parameter_space)
+            sensitivity_analysis = self._perform_sensitivity_analysis(df_full, parameter_space)
             
             # 결과 통계
+            scores = df_full['optimization_score']
             result_stats = {
-                'mean_score': df_results['optimization_score'].mean(),
-                'std_score': df_results['optimization_score'].std(),
-                'median_score': df_results['optimization_score'].median(),
-                'min_score': df_results['optimization_score'].min(),
-                'max_score': df_results['optimization_score'].max()
+                'mean_score': float(scores.mean()),
+                'std_score': float(scores.std()),
+                'median_score': float(scores.median()),
+                'min_score': float(scores.min()),
+                'max_score': float(scores.max())
             }
             
             return {
@@ -371,6 +1032,8 @@ class ParameterOptimizer:
                 'sensitivity_analysis': sensitivity_analysis,
                 'result_statistics': result_stats,
                 'total_combinations_tested': len(results),
+                'pruned_count': pruned_count,
+                'all_pruned': all_pruned,
                 'optimization_metric': self.optimization_metric,
                 'optimization_date': datetime.now().isoformat()
             }
@@ -386,24 +1049,19 @@ class ParameterOptimizer:
         try:
             sensitivity = {}
             
-            for param_name in parameter_space.keys():
-                param_values = []
-                scores = []
-                
-                for _, row in df_results.iterrows():
-                    param_values.append(row['parameters'][param_name])
-                    scores.append(row['optimization_score'])
-                
+            # 매개변수 딕셔너리를 한 번에 열로 펼침 (행 단위 반복 없이 열 단위 집계)
+            param_names = list(parameter_space.keys())
+            params_df = pd.DataFrame(df_results['parameters'].tolist(), index=df_results.index)[param_names]
+            params_df['score'] = df_results['optimization_score']
+            
+            # 매개변수별 점수 상관계수
+            correlations = params_df[param_names].corrwith(params_df['score'])
+            
+            for param_name in param_names:
                 # 매개변수 값별 평균 점수
-                param_df = pd.DataFrame({
-                    'param_value': param_values,
-                    'score': scores
-                })
-                
-                param_grouped = param_df.groupby('param_value')['score'].agg(['mean', 'std', 'count'])
+                param_grouped = params_df.groupby(param_name)['score'].agg(['mean', 'std', 'count'])
                 
-                # 상관계수
-                correlation = param_df['param_value'].corr(param_df['score'])
+                correlation = correlations[param_name]
                 
                 sensitivity[param_name] = {
                     'correlation': float(correlation) if not pd.isna(correlation) else 0.0,
@@ -469,22 +1127,21 @@ class ParameterOptimizer:
             if not all_params:
                 return {}
             
-            consensus = {}
+            # (종목 수, 매개변수 수) 값 행렬
+            param_names = list(all_params[0].keys())
+            values = np.array([[p[name] for name in param_names] for p in all_params], dtype=object)
+            numeric_mask = np.array([isinstance(value, (int, float)) for value in values[0]], dtype=bool)
             
-            # 각 매개변수별 중앙값 또는 최빈값 계산
-            for param_name in all_params[0].keys():
-                values = [p[param_name] for p in all_params]
-                
-                if isinstance(values[0], (int, float)):
-                    # 수치형: 중앙값 사용
-                    consensus[param_name] = float(np.median(values))
-                else:
-                    # 범주형: 최빈값 사용
-                    from collections import Counter
-                    counter = Counter(values)
-                    consensus[param_name] = counter.most_common(1)[0][0]
+            # 수치형: 열 단위 중앙값을 한 번에 계산
+            medians = np.median(values[:, numeric_mask].astype(np.float64), axis=0)
+            consensus = dict(zip([name for name, numeric in zip(param_names, numeric_mask) if numeric], medians.tolist()))
             
-            return consensus
+            # 범주형: 최빈값 사용
+            for j in np.flatnonzero(~numeric_mask):
+                consensus[param_names[j]] = Counter(values[:, j]).most_common(1)[0][0]
+            
+            # 원래 매개변수 순서 유지
+            return {name: consensus[name] for name in param_names}
             
         except Exception as e:
             self.logger.error(f"합의 매개변수 도출 오류: {str(e)}")
@@ -518,7 +1175,153 @@ class ParameterOptimizer:
             return {}
 
 
+def _results_frame(columns: Dict[str, np.ndarray], parameters: List, start: int, stop: int) -> pd.DataFrame:
+    """열 배열의 [start, stop) 구간을 결과 DataFrame으로 변환 (지표 열 + 'parameters' 열)"""
+    frame = pd.DataFrame({name: column[start:stop] for name, column in columns.items()})
+    frame['parameters'] = parameters[start:stop]
+    return frame
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple:
+    """매개변수 조합의 해시 가능한 키 (이미 평가한 조합 식별용)"""
+    return tuple(sorted(params.items()))
+
+
 # 병렬 처리를 위한 독립 함수들
+
+# 워커 프로세스 전역 상태 (_init_worker에서 워커당 한 번 설정)
+_WORKER_PRICES: Optional[pd.DataFrame] = None
+_WORKER_BACKTESTER: Optional[BacktestEngine] = None
+
+# 마지막으로 지표 분석한 (주가 데이터, 종목, 점수 데이터, 점수 컬럼, 워밍업 행 수)
+# 워커는 주가 데이터가 고정이므로 묶음·시행마다 지표 분석을 반복하지 않음
+_SCORED_CACHE: Optional[Tuple[pd.DataFrame, str, pd.DataFrame, List[str], int]] = None
+
+
+def _create_backtester() -> BacktestEngine:
+    """최적화용 백테스팅 엔진 생성"""
+    return BacktestEngine(
+        initial_capital=10000000,  # 1000만원
+        commission_rate=0.00015,   # 0.015%
+        use_risk_management=True
+    )
+
+
+def _init_worker(price_handle: Optional[Dict[str, Any]]):
+    """워커 초기화: 공유 주가 데이터 복원과 백테스팅 엔진 생성을 작업마다 하지 않고 워커당 한 번만 수행"""
+    global _WORKER_PRICES, _WORKER_BACKTESTER
+    
+    _WORKER_PRICES = _attach_price_data(price_handle) if price_handle is not None else None
+    _WORKER_BACKTESTER = _create_backtester()
+
+def _prepare_scored_data(symbol: str, price_data: pd.DataFrame) -> Tuple[pd.DataFrame, List[str], int]:
+    """
+    매개변수와 무관한 지표 분석·점수 계산·시장 상황 조정 (같은 주가 데이터 객체면 캐시 재사용)
+    
+    Returns:
+        (점수 데이터, 점수 컬럼, 지표 워밍업 행 수)
+    """
+    global _SCORED_CACHE
+    
+    if _SCORED_CACHE is not None and _SCORED_CACHE[0] is price_data and _SCORED_CACHE[1] == symbol:
+        return _SCORED_CACHE[2:]
+    
+    base_integrator = EnhancedSignalIntegrator(use_institutional_signals=True)
+    analyzed_data = base_integrator.analyze_all_indicators_enhanced(price_data, symbol=symbol)
+    scored_data = base_integrator.calculate_signal_scores_enhanced(analyzed_data)
+    
+    # 시장 상황별 지표 신호 강도 조정도 매개변수와 무관하므로 여기서 한 번만 수행
+    # (조합별 통합기는 use_market_condition=False로 생성해 같은 조정을 반복하지 않음)
+    if base_integrator.use_market_condition and 'market_condition' in scored_data.columns:
+        scored_data = base_integrator.market_analyzer.adjust_signal_strength(scored_data)
+    
+    score_columns = base_integrator.signal_score_columns(scored_data)
+    
+    # 지표 워밍업 행 수: 지표 열별 선두 결측 구간 중 가장 긴 것 (끝까지 결측인 열은 제외)
+    warmup = int(scored_data.notna().to_numpy().argmax(axis=0).max()) if len(scored_data) else 0
+    
+    _SCORED_CACHE = (price_data, symbol, scored_data, score_columns, warmup)
+    return scored_data, score_columns, warmup
+
+def _attach_price_data(price_handle: Dict[str, Any]) -> pd.DataFrame:
+    """공유 메모리 주가 블록으로 DataFrame 복원 (워커용, 블록 구성은 _shared_price_data 참고)"""
+    shm = shared_memory.SharedMemory(name=price_handle['name'])
+    try:
+        rows = price_handle['rows']
+        dates_ns = np.ndarray((rows,), dtype=np.int64, buffer=shm.buf).copy()
+        values = np.ndarray((rows, len(_OHLCV_COLUMNS)), dtype=np.float64,
+                            buffer=shm.buf, offset=dates_ns.nbytes).copy()
+    finally:
+        shm.close()
+    
+    dates = pd.to_datetime(dates_ns)
+    if price_handle['tz'] is not None:
+        dates = dates.tz_localize('UTC').tz_convert(price_handle['tz'])
+    
+    data = pd.DataFrame(values, columns=list(_OHLCV_COLUMNS))
+    data.insert(0, 'date', dates)
+    return data
+
+
+@functools.lru_cache(maxsize=4096)
+def _weights_valid(ma: float, rsi: float, macd: float, bb: float,
+                   volume: float, stoch: float, institutional: float) -> bool:
+    """가중치 값 튜플의 유효성 판정 (신뢰도·최소 지표 수가 달라도 같은 가중치면 재계산하지 않음)"""
+    # 기술적 지표 가중치 합계
+    technical_sum = sum((ma, rsi, macd, bb, volume, stoch))
+    
+    # 전체 가중치 = 기술적 지표 * (1 - 기관 가중치) + 기관 가중치
+    total_weight = technical_sum * (1 - institutional) + institutional
+    
+    # 0.95 ~ 1.05 범위 허용 (부동소수점 오차 고려)
+    return 0.95 <= total_weight <= 1.05
+
+
+def _bounded_tasks(tasks, slots: threading.Semaphore, stop: threading.Event):
+    """
+    제출 슬롯이 있을 때만 다음 작업을 내보내는 생성기
+    
+    Pool.imap_unordered는 입력 반복자를 별도 스레드에서 끝까지 소비하므로,
+    슬롯(세마포어)으로 미완료 작업 수를 제한함. 소비 측은 결과마다 slots.release() 호출.
+    """
+    for task in tasks:
+        while not slots.acquire(timeout=0.1):
+            if stop.is_set():
+                return
+        yield task
+
+
+def _evaluate_combination_task(task):
+    """
+    프로세스 풀 작업 단위 (최적화기, 종목, 기간, 매개변수 - 주가 데이터는 워커 초기화 시 복원)
+    
+    Returns:
+        (매개변수, 평가 결과, 오류 메시지) - 예외가 풀 반복자를 중단시키지 않도록 오류도 값으로 반환
+    """
+    optimizer, symbol, period, params = task
+    
+    try:
+        return params, optimizer._evaluate_parameter_combination(symbol, period, params, _WORKER_PRICES), None
+    except Exception as e:
+        return params, None, str(e)
+
+
+def _evaluate_batch_task(task):
+    """
+    프로세스 풀 작업 단위 (최적화기, 종목, 기간, 매개변수 묶음 - 주가 데이터는 워커 초기화 시 복원)
+    
+    Returns:
+        조합별 (매개변수, 평가 결과, 오류 메시지) 리스트
+    """
+    optimizer, symbol, period, param_batch = task
+    
+    try:
+        results = optimizer._evaluate_parameter_batch(symbol, period, param_batch, _WORKER_PRICES)
+        return [(params, result, None) for params, result in zip(param_batch, results)]
+    except Exception as e:
+        return [(params, None, str(e)) for params in param_batch]
+
+
 def _evaluate_single_combination(args):
     """단일 매개변수 조합 평가 (병렬 처리용)"""
     symbol, period, params, optimization_metric = args
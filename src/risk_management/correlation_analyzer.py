@@ -6,7 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 import yfinance as yf
 try:
     import matplotlib.pyplot as plt
@@ -17,27 +17,103 @@ except ImportError:
 
 try:
     from scipy.cluster.hierarchy import dendrogram, linkage, fcluster
-    from scipy.spatial.distance import squareform
     SCIPY_AVAILABLE = True
 except ImportError:
     SCIPY_AVAILABLE = False
 
+try:
+    import fastcluster
+    FASTCLUSTER_AVAILABLE = True
+except ImportError:
+    FASTCLUSTER_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401 (pandas parquet 엔진)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터 대체 (순수 파이썬 실행)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 import warnings
 import sys
 import os
+import re
+import itertools
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 warnings.filterwarnings('ignore')
 
+# 대규모 종목 수집 (aiohttp 비동기 경로) 설정
+_ASYNC_FETCH_MIN_SYMBOLS = 50     # 이 종목 수 이상이면 비동기 수집 사용
+_ASYNC_FETCH_CONCURRENCY = 20     # 동시 요청 수 상한
+_ASYNC_FETCH_RETRIES = 3          # 요청 제한(429)/서버 오류 시 재시도 횟수
+_YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+
+@njit(cache=True)
+def _greedy_cluster(corr_values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    순차 그룹핑 (아직 배정되지 않은 종목을 기준으로 |상관계수| >= threshold 종목을 묶음)
+    
+    Args:
+        corr_values: (n, n) 상관관계 행렬
+        threshold: 그룹핑 기준 상관계수
+        
+    Returns:
+        종목별 그룹 번호 (0부터 생성 순서대로)
+    """
+    n = corr_values.shape[0]
+    labels = np.full(n, -1, dtype=np.int64)
+    n_groups = 0
+    
+    for i in range(n):
+        if labels[i] >= 0:
+            continue
+        
+        labels[i] = n_groups
+        for j in range(i + 1, n):
+            if labels[j] < 0 and abs(corr_values[i, j]) >= threshold:
+                labels[j] = n_groups
+        n_groups += 1
+    
+    return labels
+
 class CorrelationAnalyzer:
     """상관관계 분석기"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        초기화
+        
+        Args:
+            cache_dir: 가격 데이터 디스크 캐시 디렉토리 (기본: ~/.cache/correlation_analyzer)
+        """
         self.logger = self._setup_logger()
         
+        # 종가 캐시 ({cache_dir}/{period}/{symbol}.parquet, 당일 저장분만 유효)
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'correlation_analyzer')
+        
         # 리스크 관리 기준
         self.risk_thresholds = {
             'high_correlation': 0.8,      # 높은 상관관계 기준
@@ -80,32 +156,35 @@ class CorrelationAnalyzer:
         try:
             self.logger.info(f"가격 데이터 수집 시작: {len(symbols)}개 종목")
             
-            price_data = {}
+            # 당일 캐시가 있는 종목은 네트워크 요청 생략
+            cached_prices = self._load_cached_prices(symbols, period)
+            fetch_symbols = [symbol for symbol in symbols if symbol not in cached_prices]
+            if cached_prices:
+                self.logger.info(f"캐시 사용: {len(cached_prices)}개 종목")
+            
+            close_data = pd.DataFrame()
+            if fetch_symbols:
+                close_data = self._download_close_prices(fetch_symbols, period)
+                self._store_cached_prices(close_data, period)
+            
+            if cached_prices:
+                cached_data = pd.concat(list(cached_prices.values()), axis=1, keys=list(cached_prices.keys()))
+                close_data = pd.concat([cached_data, close_data], axis=1).sort_index()
             
             for symbol in symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
-                    data = ticker.history(period=period)
-                    
-                    if not data.empty:
-                        price_data[symbol] = data['Close']
-                        self.logger.debug(f"데이터 수집 완료: {symbol}")
-                    else:
-                        self.logger.warning(f"데이터 없음: {symbol}")
-                        
-                except Exception as e:
-                    self.logger.warning(f"데이터 수집 실패 {symbol}: {str(e)}")
-                    continue
+                if symbol not in close_data.columns:
+                    self.logger.warning(f"데이터 없음: {symbol}")
             
-            if not price_data:
+            if close_data.empty:
                 self.logger.error("수집된 가격 데이터가 없습니다.")
                 return pd.DataFrame()
             
-            # DataFrame으로 결합
-            combined_data = pd.DataFrame(price_data)
+            # 요청한 종목 순서로 정렬
+            combined_data = close_data[[symbol for symbol in symbols if symbol in close_data.columns]]
             
             # 결측값 처리 (forward fill 후 backward fill)
-            combined_data = combined_data.fillna(method='ffill').fillna(method='bfill')
+            combined_data.ffill(inplace=True)
+            combined_data.bfill(inplace=True)
             
             self.logger.info(f"가격 데이터 수집 완료: {len(combined_data.columns)}개 종목, {len(combined_data)}일")
             return combined_data
@@ -114,6 +193,189 @@ class CorrelationAnalyzer:
             self.logger.error(f"가격 데이터 수집 오류: {str(e)}")
             return pd.DataFrame()
     
+    def _download_close_prices(self, symbols: List[str], period: str) -> pd.DataFrame:
+        """
+        Yahoo Finance 종가 일괄 수집
+        
+        Returns:
+            종가 DataFrame (날짜 x 종목), 데이터가 없는 종목은 제외
+        """
+        if AIOHTTP_AVAILABLE and len(symbols) >= _ASYNC_FETCH_MIN_SYMBOLS:
+            # 대규모 종목은 비동기 수집, 실패 시(이벤트 루프 실행 중인 환경 포함) yfinance 일괄 수집으로 대체
+            try:
+                close_data = asyncio.run(self._fetch_close_prices_async(symbols, period))
+                if not close_data.empty:
+                    return close_data
+                self.logger.warning("비동기 종가 수집 결과 없음, yfinance로 재시도")
+            except Exception as e:
+                self.logger.warning(f"비동기 종가 수집 불가, yfinance로 재시도: {str(e)}")
+        
+        try:
+            # 전체 종목을 한 번의 요청으로 수집 (yfinance 내부 스레드로 종목별 요청 병렬 처리)
+            # auto_adjust=True: 기존 Ticker.history와 같은 수정주가 종가 사용
+            raw_data = yf.download(
+                tickers=symbols,
+                period=period,
+                group_by='column',
+                auto_adjust=True,
+                actions=False,
+                threads=True,
+                progress=False
+            )
+            
+            if raw_data is None or raw_data.empty:
+                return pd.DataFrame()
+            
+            # 종가만 추출 (날짜 x 종목), 데이터가 없는 종목 제외
+            close_data = raw_data['Close']
+            if isinstance(close_data, pd.Series):
+                close_data = close_data.to_frame(symbols[0])
+            return close_data.dropna(axis=1, how='all')
+            
+        except Exception as e:
+            self.logger.error(f"종가 수집 오류: {str(e)}")
+            return pd.DataFrame()
+    
+    async def _fetch_close_prices_async(self, symbols: List[str], period: str) -> pd.DataFrame:
+        """
+        Yahoo Finance chart API 비동기 종가 수집 (대규모 종목용, 동시 요청 수 제한)
+        
+        Returns:
+            종가 DataFrame (날짜 x 종목), 데이터가 없는 종목은 제외
+        """
+        semaphore = asyncio.Semaphore(_ASYNC_FETCH_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=30)
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        
+        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+            results = await asyncio.gather(*[
+                self._fetch_symbol_close(session, semaphore, symbol, period) for symbol in symbols
+            ])
+        
+        close_series = {symbol: series for symbol, series in zip(symbols, results) if series is not None}
+        if not close_series:
+            return pd.DataFrame()
+        
+        close_data = pd.concat(list(close_series.values()), axis=1, keys=list(close_series.keys()))
+        return close_data.sort_index().dropna(axis=1, how='all')
+    
+    async def _fetch_symbol_close(self,
+                                  session: 'aiohttp.ClientSession',
+                                  semaphore: asyncio.Semaphore,
+                                  symbol: str,
+                                  period: str) -> Optional[pd.Series]:
+        """단일 종목 일봉 수정 종가 수집 (요청 제한 시 지수 백오프 재시도)"""
+        params = {'interval': '1d', 'range': period}
+        
+        for attempt in range(_ASYNC_FETCH_RETRIES):
+            try:
+                async with semaphore:
+                    async with session.get(_YAHOO_CHART_URL.format(symbol=symbol), params=params) as response:
+                        if response.status == 200:
+                            return self._parse_chart_close(await response.json())
+                        
+                        # 요청 제한(429)/서버 오류만 재시도, 그 외(잘못된 종목 등)는 즉시 포기
+                        if response.status != 429 and response.status < 500:
+                            self.logger.debug(f"종가 수집 실패 {symbol}: HTTP {response.status}")
+                            return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.debug(f"종가 수집 실패 {symbol} (시도 {attempt + 1}): {str(e)}")
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                self.logger.debug(f"종가 응답 해석 실패 {symbol}: {str(e)}")
+                return None
+            
+            await asyncio.sleep(2 ** attempt)
+        
+        return None
+    
+    def _parse_chart_close(self, payload: Dict[str, Any]) -> Optional[pd.Series]:
+        """chart API 응답에서 일자별 수정 종가 추출 (auto_adjust=True 종가와 동일)"""
+        result = (payload.get('chart', {}).get('result') or [None])[0]
+        if not result or not result.get('timestamp'):
+            return None
+        
+        indicators = result.get('indicators', {})
+        adjclose = indicators.get('adjclose')
+        if adjclose:
+            close = adjclose[0].get('adjclose')
+        else:
+            close = indicators.get('quote', [{}])[0].get('close')
+        if not close:
+            return None
+        
+        # 거래소 현지 날짜 기준 인덱스 (yfinance 일봉 인덱스와 동일한 형태)
+        timezone = result.get('meta', {}).get('exchangeTimezoneName') or 'UTC'
+        dates = pd.to_datetime(result['timestamp'], unit='s', utc=True).tz_convert(timezone)
+        index = dates.tz_localize(None).normalize()
+        
+        series = pd.Series(np.asarray(close, dtype=np.float64), index=index)
+        return series[~series.index.duplicated(keep='last')]
+    
+    def _price_cache_path(self, symbol: str, period: str) -> str:
+        """종목별 종가 캐시 파일 경로 (pyarrow 설치 시 parquet, 아니면 pickle)"""
+        safe_symbol = re.sub(r'[^A-Za-z0-9_.-]', '_', symbol)
+        extension = 'parquet' if PYARROW_AVAILABLE else 'pkl'
+        return os.path.join(self.cache_dir, period, f"{safe_symbol}.{extension}")
+    
+    def _load_cached_prices(self, symbols: List[str], period: str) -> Dict[str, pd.Series]:
+        """당일 저장된 종가 캐시 로드 {종목: 종가 Series}"""
+        cached_prices = {}
+        today = date.today()
+        
+        for symbol in symbols:
+            path = self._price_cache_path(symbol, period)
+            try:
+                if datetime.fromtimestamp(os.path.getmtime(path)).date() != today:
+                    continue
+            except OSError:
+                # 캐시 없음
+                continue
+            
+            try:
+                if PYARROW_AVAILABLE:
+                    cached = pd.read_parquet(path)
+                else:
+                    cached = pd.read_pickle(path)
+                cached_prices[symbol] = cached.iloc[:, 0].rename(symbol)
+            except Exception as e:
+                # 손상된 캐시(잘린 파일 등)는 삭제하고 해당 종목은 다시 다운로드
+                self.logger.debug(f"캐시 로드 실패 {path}: {str(e)}")
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        
+        return cached_prices
+    
+    def _store_cached_prices(self, close_data: pd.DataFrame, period: str):
+        """종목별 종가 캐시 저장"""
+        if close_data.empty:
+            return
+        
+        try:
+            os.makedirs(os.path.join(self.cache_dir, period), exist_ok=True)
+        except OSError as e:
+            self.logger.debug(f"캐시 디렉토리 생성 실패: {str(e)}")
+            return
+        
+        for symbol in close_data.columns:
+            path = self._price_cache_path(symbol, period)
+            # 같은 디렉토리 임시 파일에 기록 후 교체 (중단·동시 실행 시 잘린 캐시 파일 방지)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                frame = close_data[symbol].dropna().to_frame(symbol)
+                if PYARROW_AVAILABLE:
+                    frame.to_parquet(tmp_path)
+                else:
+                    frame.to_pickle(tmp_path)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                self.logger.debug(f"캐시 저장 실패 {symbol}: {str(e)}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
     def calculate_correlation_matrix(self, 
                                    price_data: pd.DataFrame,
                                    method: str = "pearson",
@@ -133,15 +395,38 @@ class CorrelationAnalyzer:
             if price_data.empty:
                 return pd.DataFrame()
             
-            # 수익률 계산
-            returns = price_data.pct_change(periods=return_period).dropna()
-            
-            if returns.empty:
-                self.logger.warning("수익률 데이터가 없습니다.")
-                return pd.DataFrame()
-            
-            # 상관관계 계산
-            correlation_matrix = returns.corr(method=method)
+            # 수익률/상관관계는 float32로 계산 (유효 자릿수 7자리면 충분, 메모리 대역폭 절반)
+            if method == 'pearson':
+                # 수익률 행렬에 대해 한 번에 계산 (pandas 종목쌍별 계산 경로 우회)
+                prices = price_data.to_numpy(dtype=np.float32)
+                returns = prices[return_period:] / prices[:-return_period] - 1
+                returns = returns[~np.isnan(returns).any(axis=1)]
+                
+                if len(returns) == 0:
+                    self.logger.warning("수익률 데이터가 없습니다.")
+                    return pd.DataFrame()
+                
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr_values = np.atleast_2d(np.corrcoef(returns, rowvar=False, dtype=np.float32))
+                # 정확히 대칭으로 맞추고 자기 상관은 1로 고정 (변동이 없는 종목은 NaN 유지)
+                lower_rows, lower_cols = np.tril_indices(len(corr_values), k=-1)
+                corr_values[lower_rows, lower_cols] = corr_values[lower_cols, lower_rows]
+                diagonal = np.diagonal(corr_values).copy()
+                diagonal[~np.isnan(diagonal)] = 1.0
+                np.fill_diagonal(corr_values, diagonal)
+                
+                correlation_matrix = pd.DataFrame(corr_values, index=price_data.columns, columns=price_data.columns)
+            else:
+                # 수익률 계산
+                # 순위 기반 방법은 float32 반올림으로 생기는 동률을 피하기 위해 float64 수익률 사용
+                returns = price_data.pct_change(periods=return_period).dropna()
+                
+                if returns.empty:
+                    self.logger.warning("수익률 데이터가 없습니다.")
+                    return pd.DataFrame()
+                
+                # 상관관계 계산
+                correlation_matrix = returns.corr(method=method).astype(np.float32)
             
             self.logger.info(f"{method} 상관관계 행렬 계산 완료: {correlation_matrix.shape}")
             return correlation_matrix
@@ -174,20 +459,34 @@ class CorrelationAnalyzer:
             if portfolio_weights is None:
                 portfolio_weights = {symbol: 1.0/n_symbols for symbol in symbols}
             
-            # 1. 높은 상관관계 쌍 식별
-            high_corr_pairs = self._find_high_correlation_pairs(correlation_matrix)
-            
-            # 2. 상관관계 클러스터 분석
-            clusters = self._perform_correlation_clustering(correlation_matrix)
+            # 종목 순서에 맞춘 비중 배열 (수치 계산용, 한 번만 변환)
+            symbol_weights = np.fromiter((portfolio_weights.get(symbol, 0.0) for symbol in symbols),
+                                         dtype=np.float64, count=n_symbols)
+            
+            if n_symbols < 2:
+                # 단일 종목은 종목 쌍이 없으므로 상관관계 쌍/클러스터 분석 생략
+                high_corr_pairs = []
+                clusters = {
+                    'clusters': {},
+                    'linkage_matrix': [],
+                    'total_clusters': 0,
+                    'largest_cluster_size': 0
+                }
+            else:
+                # 1. 높은 상관관계 쌍 식별
+                high_corr_pairs = self._find_high_correlation_pairs(correlation_matrix, symbols)
+                
+                # 2. 상관관계 클러스터 분석
+                clusters = self._perform_correlation_clustering(correlation_matrix, symbols)
             
             # 3. 포트폴리오 집중도 분석
             concentration_analysis = self._analyze_portfolio_concentration(
-                correlation_matrix, portfolio_weights, clusters
+                correlation_matrix, portfolio_weights, clusters, symbol_weights, symbols
             )
             
             # 4. 분산투자 효과 분석
             diversification_analysis = self._analyze_diversification_benefit(
-                correlation_matrix, portfolio_weights
+                correlation_matrix, symbol_weights
             )
             
             # 5. 리스크 경고 생성
@@ -210,46 +509,88 @@ class CorrelationAnalyzer:
             self.logger.error(f"상관관계 리스크 분석 오류: {str(e)}")
             return {'error': str(e)}
     
-    def _find_high_correlation_pairs(self, correlation_matrix: pd.DataFrame) -> List[Dict[str, Any]]:
-        """높은 상관관계 종목 쌍 찾기"""
-        try:
-            high_corr_pairs = []
-            symbols = correlation_matrix.columns.tolist()
-            
-            for i, symbol1 in enumerate(symbols):
-                for j, symbol2 in enumerate(symbols[i+1:], i+1):
-                    correlation = correlation_matrix.loc[symbol1, symbol2]
-                    
-                    if abs(correlation) >= self.risk_thresholds['high_correlation']:
-                        high_corr_pairs.append({
-                            'symbol1': symbol1,
-                            'symbol2': symbol2,
-                            'correlation': float(correlation),
-                            'correlation_type': 'positive' if correlation > 0 else 'negative',
-                            'risk_level': 'high' if abs(correlation) >= 0.9 else 'moderate'
-                        })
-            
-            # 상관관계 크기별 정렬
-            high_corr_pairs.sort(key=lambda x: abs(x['correlation']), reverse=True)
+    def analyze_many(self,
+                     portfolios: List[Tuple[pd.DataFrame, Optional[Dict[str, float]]]],
+                     max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        여러 포트폴리오 상관관계 리스크 일괄 분석 (프로세스 병렬)
+        
+        Args:
+            portfolios: (상관관계 행렬, 포트폴리오 비중) 리스트
+            max_workers: 병렬 처리 워커 수 (None이면 CPU 코어 수)
             
-            return high_corr_pairs
+        Returns:
+            포트폴리오별 analyze_correlation_risks 결과 (입력 순서)
+        """
+        # DataFrame 대신 배열 + 종목 리스트로 전달 (피클링 비용 절감)
+        tasks = [(matrix.to_numpy(), matrix.columns.tolist(), weights) for matrix, weights in portfolios]
+        
+        if len(tasks) <= 1 or max_workers == 1:
+            return [self.analyze_correlation_risks(*_rebuild_portfolio_task(task)) for task in tasks]
+        
+        n_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        chunksize = max(1, len(tasks) // (n_workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_analyzer_worker,
+                                 initargs=(self.risk_thresholds, self.cache_dir)) as executor:
+            return list(executor.map(_analyze_portfolio_task, tasks, chunksize=chunksize))
+    
+    def _find_high_correlation_pairs(self,
+                                     correlation_matrix: pd.DataFrame,
+                                     symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """높은 상관관계 종목 쌍 찾기 (|상관계수| 내림차순, symbols: 행렬 컬럼 리스트)"""
+        try:
+            corr_values = correlation_matrix.to_numpy()
+            if symbols is None:
+                symbols = correlation_matrix.columns.tolist()
+            
+            # 상삼각(대각선 제외) 종목 쌍의 상관계수를 한 번에 추출
+            rows, cols = np.triu_indices(len(symbols), k=1)
+            pair_corr = corr_values[rows, cols]
+            abs_corr = np.abs(pair_corr)
+            
+            # 기준 이상 쌍만 선별 후 상관관계 크기별 정렬 (같은 크기는 기존 순서 유지)
+            selected = np.flatnonzero(abs_corr >= self.risk_thresholds['high_correlation'])
+            selected = selected[np.argsort(-abs_corr[selected], kind='stable')]
+            
+            return [
+                {
+                    'symbol1': symbols[rows[k]],
+                    'symbol2': symbols[cols[k]],
+                    'correlation': float(pair_corr[k]),
+                    'correlation_type': 'positive' if pair_corr[k] > 0 else 'negative',
+                    'risk_level': 'high' if abs_corr[k] >= 0.9 else 'moderate'
+                }
+                for k in selected
+            ]
             
         except Exception as e:
             self.logger.error(f"높은 상관관계 쌍 찾기 오류: {str(e)}")
             return []
     
-    def _perform_correlation_clustering(self, correlation_matrix: pd.DataFrame) -> Dict[str, Any]:
-        """상관관계 기반 클러스터링"""
+    def _perform_correlation_clustering(self,
+                                        correlation_matrix: pd.DataFrame,
+                                        symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """상관관계 기반 클러스터링 (symbols: 행렬 컬럼 리스트)"""
         try:
+            if symbols is None:
+                symbols = correlation_matrix.columns.tolist()
+            
             if not SCIPY_AVAILABLE:
                 # scipy가 없는 경우 간단한 상관관계 기반 그룹핑
-                return self._simple_correlation_grouping(correlation_matrix)
+                return self._simple_correlation_grouping(correlation_matrix, symbols)
             
-            # 거리 행렬 계산 (1 - |correlation|)
-            distance_matrix = 1 - correlation_matrix.abs()
+            # 압축 거리 벡터 계산 (상삼각 1 - |correlation|, 행 우선 순서)
+            corr_values = correlation_matrix.to_numpy()
+            rows, cols = np.triu_indices(corr_values.shape[0], k=1)
+            condensed_distance = 1.0 - np.abs(corr_values[rows, cols])
             
-            # 계층적 클러스터링
-            linkage_matrix = linkage(squareform(distance_matrix), method='ward')
+            # 계층적 클러스터링 (fastcluster 설치 시 같은 API의 C++ 구현 사용)
+            if FASTCLUSTER_AVAILABLE:
+                linkage_matrix = fastcluster.linkage(condensed_distance, method='ward')
+            else:
+                linkage_matrix = linkage(condensed_distance, method='ward')
             
             # 클러스터 할당 (임계값 기반)
             threshold = 1 - self.risk_thresholds['cluster_threshold']
@@ -257,7 +598,6 @@ class CorrelationAnalyzer:
             
             # 클러스터 정보 정리
             clusters = {}
-            symbols = correlation_matrix.columns.tolist()
             
             for i, symbol in enumerate(symbols):
                 cluster_id = cluster_labels[i]
@@ -272,12 +612,11 @@ class CorrelationAnalyzer:
             
             # 클러스터별 평균 상관관계 계산
             for cluster_id, cluster_info in clusters.items():
-                cluster_symbols = cluster_info['symbols']
-                if len(cluster_symbols) > 1:
-                    cluster_corr = correlation_matrix.loc[cluster_symbols, cluster_symbols]
-                    # 대각선 제외한 상관관계 평균
-                    mask = np.triu(np.ones_like(cluster_corr, dtype=bool), k=1)
-                    avg_corr = cluster_corr.where(mask).stack().mean()
+                if cluster_info['size'] > 1:
+                    members = np.flatnonzero(cluster_labels == cluster_id)
+                    cluster_corr = corr_values[np.ix_(members, members)]
+                    # 대각선 제외한 상관관계 평균 (NaN 제외)
+                    avg_corr = np.nanmean(cluster_corr[np.triu_indices(len(members), k=1)])
                     clusters[cluster_id]['avg_correlation'] = float(avg_corr)
             
             return {
@@ -291,48 +630,33 @@ class CorrelationAnalyzer:
             self.logger.error(f"클러스터링 오류: {str(e)}")
             return {}
     
-    def _simple_correlation_grouping(self, correlation_matrix: pd.DataFrame) -> Dict[str, Any]:
-        """간단한 상관관계 기반 그룹핑 (scipy 없을 때)"""
+    def _simple_correlation_grouping(self,
+                                     correlation_matrix: pd.DataFrame,
+                                     symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """간단한 상관관계 기반 그룹핑 (scipy 없을 때, symbols: 행렬 컬럼 리스트)"""
         try:
-            symbols = correlation_matrix.columns.tolist()
-            clusters = {}
-            cluster_id = 1
-            processed = set()
+            if symbols is None:
+                symbols = correlation_matrix.columns.tolist()
+            corr_values = correlation_matrix.to_numpy(dtype=np.float64)
+            labels = _greedy_cluster(corr_values, float(self.risk_thresholds['cluster_threshold']))
             
-            for symbol in symbols:
-                if symbol in processed:
-                    continue
-                    
-                # 새 클러스터 시작
-                cluster = [symbol]
-                processed.add(symbol)
-                
-                # 높은 상관관계 종목들 찾기
-                for other_symbol in symbols:
-                    if other_symbol not in processed:
-                        correlation = abs(correlation_matrix.loc[symbol, other_symbol])
-                        if correlation >= self.risk_thresholds['cluster_threshold']:
-                            cluster.append(other_symbol)
-                            processed.add(other_symbol)
+            clusters = {}
+            n_clusters = int(labels.max()) + 1 if len(labels) else 0
+            for cluster_id in range(1, n_clusters + 1):
+                members = np.flatnonzero(labels == cluster_id - 1)
                 
                 # 클러스터 정보 저장
                 clusters[cluster_id] = {
-                    'symbols': cluster,
+                    'symbols': [symbols[i] for i in members],
                     'avg_correlation': 0.0,
-                    'size': len(cluster)
+                    'size': len(members)
                 }
                 
-                # 평균 상관관계 계산
-                if len(cluster) > 1:
-                    corr_sum = 0
-                    count = 0
-                    for i, sym1 in enumerate(cluster):
-                        for sym2 in cluster[i+1:]:
-                            corr_sum += abs(correlation_matrix.loc[sym1, sym2])
-                            count += 1
-                    clusters[cluster_id]['avg_correlation'] = float(corr_sum / count) if count > 0 else 0.0
-                
-                cluster_id += 1
+                # 평균 상관관계 계산 (대각선 제외 상삼각)
+                if len(members) > 1:
+                    cluster_corr = np.abs(corr_values[np.ix_(members, members)])
+                    avg_corr = cluster_corr[np.triu_indices(len(members), k=1)].mean()
+                    clusters[cluster_id]['avg_correlation'] = float(avg_corr)
             
             return {
                 'clusters': clusters,
@@ -348,25 +672,37 @@ class CorrelationAnalyzer:
     def _analyze_portfolio_concentration(self, 
                                        correlation_matrix: pd.DataFrame,
                                        portfolio_weights: Dict[str, float],
-                                       clusters: Dict[str, Any]) -> Dict[str, Any]:
-        """포트폴리오 집중도 분석"""
+                                       clusters: Dict[str, Any],
+                                       symbol_weights: Optional[np.ndarray] = None,
+                                       symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """포트폴리오 집중도 분석 (symbol_weights: 상관관계 행렬 종목 순서의 비중 배열, symbols: 행렬 컬럼 리스트)"""
         try:
-            symbols = correlation_matrix.columns.tolist()
+            weight_values = np.fromiter(portfolio_weights.values(), dtype=np.float64, count=len(portfolio_weights))
             
             # 1. 개별 종목 집중도
-            max_weight = max(portfolio_weights.values()) if portfolio_weights else 0
-            max_weight_symbol = max(portfolio_weights.items(), key=lambda x: x[1])[0] if portfolio_weights else None
+            max_weight = weight_values.max() if len(weight_values) else 0
+            max_weight_symbol = list(portfolio_weights)[int(weight_values.argmax())] if len(weight_values) else None
             
             # 2. 클러스터별 집중도
             cluster_weights = {}
             if clusters.get('clusters'):
-                for cluster_id, cluster_info in clusters['clusters'].items():
-                    cluster_weight = sum(
-                        portfolio_weights.get(symbol, 0) 
-                        for symbol in cluster_info['symbols']
-                    )
+                if symbols is None:
+                    symbols = correlation_matrix.columns.tolist()
+                if symbol_weights is None:
+                    symbol_weights = np.fromiter((portfolio_weights.get(symbol, 0.0) for symbol in symbols),
+                                                 dtype=np.float64, count=len(symbols))
+                
+                # 종목별 클러스터 순번 → bincount로 클러스터 비중 합계를 한 번에 계산
+                symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+                cluster_items = list(clusters['clusters'].items())
+                labels = np.full(len(symbols), len(cluster_items), dtype=np.int64)
+                for k, (cluster_id, cluster_info) in enumerate(cluster_items):
+                    labels[[symbol_index[symbol] for symbol in cluster_info['symbols']]] = k
+                cluster_weight_sums = np.bincount(labels, weights=symbol_weights, minlength=len(cluster_items) + 1)
+                
+                for k, (cluster_id, cluster_info) in enumerate(cluster_items):
                     cluster_weights[cluster_id] = {
-                        'weight': cluster_weight,
+                        'weight': float(cluster_weight_sums[k]),
                         'symbols': cluster_info['symbols'],
                         'avg_correlation': cluster_info['avg_correlation']
                     }
@@ -391,19 +727,18 @@ class CorrelationAnalyzer:
                 },
                 'cluster_concentration': cluster_weights,
                 'max_cluster_weight': float(max_cluster_weight),
-                'concentration_score': self._calculate_concentration_score(portfolio_weights)
+                'concentration_score': self._calculate_concentration_score(weight_values)
             }
             
         except Exception as e:
             self.logger.error(f"집중도 분석 오류: {str(e)}")
             return {}
     
-    def _calculate_concentration_score(self, portfolio_weights: Dict[str, float]) -> float:
+    def _calculate_concentration_score(self, weights: np.ndarray) -> float:
         """집중도 점수 계산 (HHI 기반)"""
         try:
             # Herfindahl-Hirschman Index 계산
-            weights = list(portfolio_weights.values())
-            hhi = sum(w**2 for w in weights)
+            hhi = float(np.dot(weights, weights))
             
             # 정규화 (0-1 범위, 1이 가장 집중된 상태)
             n = len(weights)
@@ -420,23 +755,14 @@ class CorrelationAnalyzer:
     
     def _analyze_diversification_benefit(self, 
                                        correlation_matrix: pd.DataFrame,
-                                       portfolio_weights: Dict[str, float]) -> Dict[str, Any]:
-        """분산투자 효과 분석"""
+                                       weights: np.ndarray) -> Dict[str, Any]:
+        """분산투자 효과 분석 (weights: 상관관계 행렬 종목 순서의 비중 배열)"""
         try:
-            symbols = correlation_matrix.columns.tolist()
-            weights = np.array([portfolio_weights.get(symbol, 0) for symbol in symbols])
+            corr_values = correlation_matrix.to_numpy(dtype=np.float64)
             
-            # 포트폴리오 평균 상관관계 계산
-            weighted_corr_sum = 0
-            total_weight_pairs = 0
-            
-            for i, symbol1 in enumerate(symbols):
-                for j, symbol2 in enumerate(symbols):
-                    if i != j:
-                        correlation = correlation_matrix.loc[symbol1, symbol2]
-                        weight_product = weights[i] * weights[j]
-                        weighted_corr_sum += correlation * weight_product
-                        total_weight_pairs += weight_product
+            # 포트폴리오 평균 상관관계 계산 (대각선 제외 가중 평균 = (w'Cw - Σwi²·Cii) / ((Σwi)² - Σwi²))
+            weighted_corr_sum = weights @ corr_values @ weights - np.dot(weights * weights, np.diag(corr_values))
+            total_weight_pairs = weights.sum() ** 2 - np.dot(weights, weights)
             
             avg_correlation = weighted_corr_sum / total_weight_pairs if total_weight_pairs > 0 else 0
             
@@ -473,7 +799,8 @@ class CorrelationAnalyzer:
         """유효한 자산 수 계산"""
         try:
             # Effective Number of Assets = 1 / sum(wi^2)
-            return float(1 / np.sum(weights**2)) if np.sum(weights**2) > 0 else 1.0
+            sum_squares = np.dot(weights, weights)
+            return float(1 / sum_squares) if sum_squares > 0 else 1.0
         except Exception:
             return 1.0
     
@@ -486,8 +813,8 @@ class CorrelationAnalyzer:
         try:
             warnings = []
             
-            # 1. 높은 상관관계 경고
-            critical_pairs = [pair for pair in high_corr_pairs if abs(pair['correlation']) > 0.9]
+            # 1. 높은 상관관계 경고 (high_corr_pairs는 |상관계수| 내림차순 정렬 상태)
+            critical_pairs = list(itertools.takewhile(lambda pair: abs(pair['correlation']) > 0.9, high_corr_pairs))
             if critical_pairs:
                 warnings.append(f"극도로 높은 상관관계 감지: {len(critical_pairs)}개 종목 쌍")
                 for pair in critical_pairs[:3]:  # 상위 3개만
@@ -595,16 +922,19 @@ class CorrelationAnalyzer:
             
             plt.figure(figsize=(12, 10))
             
+            # 종목 수가 많으면 셀별 수치 표시 생략 (텍스트 객체 n² 개 생성 방지)
+            annotate = correlation_matrix.shape[0] <= 15
+            
             # 히트맵 생성
             mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
             sns.heatmap(
-                correlation_matrix, 
+                correlation_matrix.astype(np.float32), 
                 mask=mask,
-                annot=True, 
+                annot=annotate, 
                 cmap='RdYlBu_r', 
                 center=0,
                 square=True,
-                fmt='.2f',
+                fmt='.2f' if annotate else '',
                 cbar_kws={"shrink": .8}
             )
             
@@ -623,6 +953,29 @@ class CorrelationAnalyzer:
             return False
 
 
+# 병렬 분석 워커 전역 상태 (_init_analyzer_worker에서 워커당 한 번 설정)
+_WORKER_ANALYZER: Optional[CorrelationAnalyzer] = None
+
+
+def _init_analyzer_worker(risk_thresholds: Dict[str, float], cache_dir: str):
+    """워커 초기화: 분석기 생성을 작업마다 하지 않고 워커당 한 번만 수행"""
+    global _WORKER_ANALYZER
+    
+    _WORKER_ANALYZER = CorrelationAnalyzer(cache_dir=cache_dir)
+    _WORKER_ANALYZER.risk_thresholds = dict(risk_thresholds)
+
+
+def _rebuild_portfolio_task(task: Tuple[np.ndarray, List[str], Optional[Dict[str, float]]]) -> Tuple[pd.DataFrame, Optional[Dict[str, float]]]:
+    """(상관관계 배열, 종목 리스트, 비중) 작업을 (상관관계 행렬, 비중)으로 복원"""
+    corr_values, symbols, weights = task
+    return pd.DataFrame(corr_values, index=symbols, columns=symbols), weights
+
+
+def _analyze_portfolio_task(task: Tuple[np.ndarray, List[str], Optional[Dict[str, float]]]) -> Dict[str, Any]:
+    """워커 작업: 포트폴리오 하나의 상관관계 리스크 분석"""
+    return _WORKER_ANALYZER.analyze_correlation_risks(*_rebuild_portfolio_task(task))
+
+
 def main():
     """테스트 실행"""
     print("=== 상관관계 분석기 테스트 ===")
@@ -667,19 +1020,15 @@ def main():
         if not correlation_matrix.empty:
             print(f"   ✅ 상관관계 계산 완료: {correlation_matrix.shape}")
             
-            # 최고/최저 상관관계 출력
-            corr_values = []
-            symbols = correlation_matrix.columns.tolist()
-            
-            for i, sym1 in enumerate(symbols):
-                for j, sym2 in enumerate(symbols[i+1:], i+1):
-                    corr_values.append((sym1, sym2, correlation_matrix.loc[sym1, sym2]))
-            
-            corr_values.sort(key=lambda x: abs(x[2]), reverse=True)
+            # 최고/최저 상관관계 출력 (상삼각 종목 쌍을 |상관계수| 순으로 정렬)
+            symbols = correlation_matrix.columns.to_numpy()
+            rows, cols = np.triu_indices(len(symbols), k=1)
+            pair_corr = correlation_matrix.to_numpy()[rows, cols]
+            top_pairs = np.argsort(-np.abs(pair_corr), kind='stable')[:3]
             
             print(f"   최고 상관관계:")
-            for i, (s1, s2, corr) in enumerate(corr_values[:3], 1):
-                print(f"     {i}. {s1} ↔ {s2}: {corr:.3f}")
+            for i, k in enumerate(top_pairs, 1):
+                print(f"     {i}. {symbols[rows[k]]} ↔ {symbols[cols[k]]}: {pair_corr[k]:.3f}")
         else:
             print("   ❌ 상관관계 계산 실패")
             return
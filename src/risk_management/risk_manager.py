@@ -8,9 +8,27 @@ from typing import Dict, List, Tuple, Optional, Any
 import logging
 from datetime import datetime
 
+# 포지션 수치 상태 배열 (Struct-of-Arrays, 종목 행 순서 공유)
+_POSITION_ARRAY_FIELDS = (
+    'entry_price',
+    'shares',
+    'stop_loss_price',
+    'take_profit_price',
+    'trailing_stop_price',
+    'highest_price',
+    'signal_confidence',
+)
+_NS_PER_DAY = 86_400_000_000_000
+
+# 포지션 수치 상태 버퍼 최소 용량 (부족하면 2배씩 확장)
+_MIN_POSITION_CAPACITY = 16
+
 class RiskManager:
     """리스크 관리자 - 손절매/익절매 자동 실행"""
     
+    # 매도 사유 코드 (check_exit_conditions_batch 반환값 → 사유, -1은 매도 없음)
+    EXIT_REASONS = ('STOP_LOSS', 'TAKE_PROFIT', 'TRAILING_STOP', 'LONG_HOLD_LOSS')
+    
     def __init__(self, 
                  stop_loss_pct: float = 0.10,      # 손절매 10%
                  take_profit_pct: float = 0.20,    # 익절매 20%
@@ -32,9 +50,17 @@ class RiskManager:
         self.volatility_adjustment = volatility_adjustment
         self.logger = self._setup_logger()
         
-        # 포지션 추적
+        # 포지션 추적 (종목별 상세 정보, 포지션 변경은 set_position_stops/close_position으로만)
         self.active_positions = {}
         
+        # 일괄 매도 조건 확인용 수치 상태 (행 순서 = self._symbols)
+        self._symbols: List[str] = []
+        self._idx: Dict[str, int] = {}
+        # _arrays/_entry_time_ns는 용량 여유가 있는 버퍼(_buffers/_entry_time_buffer)의 활성 행 뷰
+        self._buffers: Dict[str, np.ndarray] = {field: np.empty(0) for field in _POSITION_ARRAY_FIELDS}
+        self._entry_time_buffer = np.empty(0, dtype=np.int64)
+        self._set_row_count(0)
+        
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
         logger = logging.getLogger(__name__)
@@ -152,6 +178,7 @@ class RiskManager:
                 'take_profit_pct': take_profit_pct
             }
             
+            self._store_position_row(position_info)
             self.active_positions[symbol] = position_info
             
             self.logger.info(f"Position stops set for {symbol}: SL={stop_loss_price:.0f} ({stop_loss_pct:.1%}), TP={take_profit_price:.0f} ({take_profit_pct:.1%})")
@@ -184,21 +211,25 @@ class RiskManager:
             (매도여부, 매도사유, 상세정보)
         """
         try:
-            if symbol not in self.active_positions:
+            row = self._idx.get(symbol)
+            if row is None or symbol not in self.active_positions:
                 return False, "", {}
             
             position = self.active_positions[symbol]
+            arrays = self._arrays
             
             # 현재 수익률 계산
             entry_price = position['entry_price']
             current_return = (current_price - entry_price) / entry_price
             
             # 최고가 업데이트 (추적 손절매용)
-            if current_price > position['highest_price']:
-                position['highest_price'] = current_price
+            if current_price > arrays['highest_price'][row]:
+                arrays['highest_price'][row] = current_price
                 # 추적 손절매 가격 업데이트
-                position['trailing_stop_price'] = current_price * (1 - self.trailing_stop_pct)
+                arrays['trailing_stop_price'][row] = current_price * (1 - self.trailing_stop_pct)
+                self._sync_trailing_stop(symbol, row)
             
+            holding_days = (current_date - position['entry_date']).days
             exit_info = {
                 'symbol': symbol,
                 'entry_price': entry_price,
@@ -206,34 +237,34 @@ class RiskManager:
                 'current_return': current_return,
                 'entry_date': position['entry_date'],
                 'current_date': current_date,
-                'holding_days': (current_date - position['entry_date']).days
+                'holding_days': holding_days
             }
             
             # 1. 손절매 확인
-            if current_price <= position['stop_loss_price']:
+            if current_price <= arrays['stop_loss_price'][row]:
                 exit_info['exit_reason'] = 'STOP_LOSS'
                 exit_info['target_price'] = position['stop_loss_price']
                 return True, 'STOP_LOSS', exit_info
             
             # 2. 익절매 확인
-            if current_price >= position['take_profit_price']:
+            if current_price >= arrays['take_profit_price'][row]:
                 exit_info['exit_reason'] = 'TAKE_PROFIT'
                 exit_info['target_price'] = position['take_profit_price']
                 return True, 'TAKE_PROFIT', exit_info
             
             # 3. 추적 손절매 확인
-            if current_price <= position['trailing_stop_price'] and position['highest_price'] > entry_price * 1.05:
+            if (current_price <= arrays['trailing_stop_price'][row]
+                    and arrays['highest_price'][row] > entry_price * 1.05):
                 # 최소 5% 이상 상승했을 때만 추적 손절매 적용
                 exit_info['exit_reason'] = 'TRAILING_STOP'
                 exit_info['target_price'] = position['trailing_stop_price']
                 exit_info['highest_price'] = position['highest_price']
                 return True, 'TRAILING_STOP', exit_info
             
-            # 4. 장기 보유 확인 (90일 이상 + 신뢰도 낮음)
-            holding_days = (current_date - position['entry_date']).days
-            if (holding_days >= 90 and 
-                position['signal_confidence'] < 0.7 and 
-                current_return < -0.05):  # 5% 이상 손실
+            # 4. 장기 보유 확인 (90일 이상 + 신뢰도 낮음 + 5% 이상 손실)
+            if (holding_days >= 90 and
+                    arrays['signal_confidence'][row] < 0.7 and
+                    current_return < -0.05):
                 exit_info['exit_reason'] = 'LONG_HOLD_LOSS'
                 return True, 'LONG_HOLD_LOSS', exit_info
             
@@ -243,6 +274,123 @@ class RiskManager:
             self.logger.error(f"Error checking exit conditions: {str(e)}")
             return False, "", {}
     
+    def check_exit_conditions_batch(self,
+                                    current_prices: np.ndarray,
+                                    current_date: datetime) -> np.ndarray:
+        """
+        전체 활성 포지션 매도 조건 일괄 확인 (포지션 수치 배열에 대한 벡터 연산)
+        
+        Args:
+            current_prices: 현재가 배열 (get_position_symbols() 순서, 시세 없음은 NaN)
+            current_date: 현재일
+            
+        Returns:
+            포지션별 매도 사유 코드 배열 (EXIT_REASONS 인덱스, -1이면 매도 없음)
+        """
+        try:
+            prices = np.asarray(current_prices, dtype=np.float64)
+            if prices.shape != (len(self._symbols),):
+                raise ValueError(f"가격 배열 크기 불일치: {prices.shape} (포지션 {len(self._symbols)}개)")
+            
+            arrays = self._arrays
+            
+            # 최고가/추적 손절가 갱신 (NaN 가격은 갱신하지 않음, 버퍼 뷰이므로 제자리 갱신)
+            raised = prices > arrays['highest_price']
+            np.copyto(arrays['highest_price'], prices, where=raised)
+            np.copyto(arrays['trailing_stop_price'], prices * (1 - self.trailing_stop_pct), where=raised)
+            for row in np.flatnonzero(raised):
+                self._sync_trailing_stop(self._symbols[row], row)
+            
+            holding_days = (pd.Timestamp(current_date).value - self._entry_time_ns) // _NS_PER_DAY
+            
+            return self._exit_reason(prices, holding_days)
+            
+        except Exception as e:
+            self.logger.error(f"Error checking batch exit conditions: {str(e)}")
+            return np.full(len(self._symbols), -1, dtype=np.int8)
+    
+    def _exit_reason(self, prices: np.ndarray, holding_days: np.ndarray) -> np.ndarray:
+        """
+        전체 포지션 매도 사유 코드 계산 (check_exit_conditions와 같은 손절매 → 익절매 → 추적 손절매 → 장기 보유 손실 우선순위)
+        
+        Args:
+            prices: 현재가 배열
+            holding_days: 보유 일수 배열
+        """
+        arrays = self._arrays
+        entry_price = arrays['entry_price']
+        current_return = (prices - entry_price) / entry_price
+        
+        stop_loss = prices <= arrays['stop_loss_price']
+        take_profit = prices >= arrays['take_profit_price']
+        # 최소 5% 이상 상승했을 때만 추적 손절매 적용
+        trailing_stop = (prices <= arrays['trailing_stop_price']) & (arrays['highest_price'] > entry_price * 1.05)
+        # 90일 이상 + 신뢰도 낮음 + 5% 이상 손실
+        long_hold_loss = (holding_days >= 90) & (arrays['signal_confidence'] < 0.7) & (current_return < -0.05)
+        
+        return np.select([stop_loss, take_profit, trailing_stop, long_hold_loss],
+                         [0, 1, 2, 3], default=-1).astype(np.int8)
+    
+    def _store_position_row(self, position_info: Dict[str, Any]):
+        """포지션 수치 상태 배열에 행 추가 (이미 있는 종목은 덮어쓰기)"""
+        symbol = position_info['symbol']
+        row = self._idx.get(symbol)
+        
+        if row is None:
+            row = len(self._symbols)
+            self._symbols.append(symbol)
+            self._idx[symbol] = row
+            self._set_row_count(row + 1)
+        
+        for field in _POSITION_ARRAY_FIELDS:
+            self._arrays[field][row] = position_info[field]
+        self._entry_time_ns[row] = pd.Timestamp(position_info['entry_date']).value
+    
+    def _remove_position_row(self, symbol: str):
+        """포지션 수치 상태 배열에서 행 제거 (마지막 행을 빈자리로 이동)"""
+        row = self._idx.pop(symbol, None)
+        if row is None:
+            return
+        
+        last = len(self._symbols) - 1
+        if row != last:
+            moved_symbol = self._symbols[last]
+            self._symbols[row] = moved_symbol
+            self._idx[moved_symbol] = row
+            for field in _POSITION_ARRAY_FIELDS:
+                self._arrays[field][row] = self._arrays[field][last]
+            self._entry_time_ns[row] = self._entry_time_ns[last]
+        
+        self._symbols.pop()
+        self._set_row_count(last)
+    
+    def _set_row_count(self, count: int):
+        """수치 상태 배열을 버퍼 앞 count행의 뷰로 갱신 (용량 부족 시 버퍼를 2배로 확장해 추가 비용 분할 상환)"""
+        capacity = len(self._entry_time_buffer)
+        if count > capacity:
+            capacity = max(_MIN_POSITION_CAPACITY, 2 * capacity, count)
+            for field in _POSITION_ARRAY_FIELDS:
+                buffer = np.zeros(capacity)
+                buffer[:len(self._buffers[field])] = self._buffers[field]
+                self._buffers[field] = buffer
+            buffer = np.zeros(capacity, dtype=np.int64)
+            buffer[:len(self._entry_time_buffer)] = self._entry_time_buffer
+            self._entry_time_buffer = buffer
+        
+        self._arrays = {field: self._buffers[field][:count] for field in _POSITION_ARRAY_FIELDS}
+        self._entry_time_ns = self._entry_time_buffer[:count]
+    
+    def _sync_trailing_stop(self, symbol: str, row: int):
+        """갱신된 최고가/추적 손절가를 포지션 상세 정보에 반영"""
+        position = self.active_positions.get(symbol)
+        if position is not None:
+            position['highest_price'] = float(self._arrays['highest_price'][row])
+            position['trailing_stop_price'] = float(self._arrays['trailing_stop_price'][row])
+    
+    def get_position_symbols(self) -> List[str]:
+        """일괄 매도 조건 확인용 포지션 종목 순서 (check_exit_conditions_batch 가격 배열 순서)"""
+        return list(self._symbols)
+    
     def close_position(self, symbol: str) -> bool:
         """
         포지션 종료
@@ -256,6 +404,7 @@ class RiskManager:
         try:
             if symbol in self.active_positions:
                 position = self.active_positions.pop(symbol)
+                self._remove_position_row(symbol)
                 self.logger.info(f"Position closed for {symbol}")
                 return True
             return False
@@ -289,39 +438,77 @@ class RiskManager:
             if not positions:
                 return {'total_var': 0, 'max_loss': 0, 'risk_level': 'LOW'}
             
-            total_value = 0
-            total_potential_loss = 0
+            # 시세가 있는 종목만 배열로 한 번에 추출
+            symbols = [symbol for symbol in positions if symbol in current_prices]
+            count = len(symbols)
+            shares = np.fromiter((positions[symbol]['shares'] for symbol in symbols), dtype=np.float64, count=count)
+            stop_loss_prices = np.fromiter((positions[symbol]['stop_loss_price'] for symbol in symbols),
+                                           dtype=np.float64, count=count)
+            prices = np.fromiter((current_prices[symbol] for symbol in symbols), dtype=np.float64, count=count)
             
-            for symbol, position in positions.items():
-                if symbol in current_prices:
-                    current_price = current_prices[symbol]
-                    position_value = position['shares'] * current_price
-                    potential_loss = position['shares'] * (current_price - position['stop_loss_price'])
-                    
-                    total_value += position_value
-                    total_potential_loss += max(0, potential_loss)  # 손실만 계산
+            return self._portfolio_risk_summary(shares, stop_loss_prices, prices, len(positions))
             
-            # 리스크 수준 계산
-            risk_ratio = total_potential_loss / total_value if total_value > 0 else 0
+        except Exception as e:
+            self.logger.error(f"Error calculating portfolio risk: {str(e)}")
+            return {'total_var': 0, 'max_loss': 0, 'risk_level': 'UNKNOWN'}
+    
+    def calculate_portfolio_risk_vec(self, current_prices: np.ndarray) -> Dict[str, Any]:
+        """
+        활성 포지션 전체 리스크 계산 (포지션 수치 배열 기반)
+        
+        Args:
+            current_prices: 현재가 배열 (get_position_symbols() 순서, 시세 없음은 NaN)
             
-            if risk_ratio > 0.15:
-                risk_level = 'HIGH'
-            elif risk_ratio > 0.08:
-                risk_level = 'MEDIUM'
-            else:
-                risk_level = 'LOW'
+        Returns:
+            리스크 지표들 (calculate_portfolio_risk와 동일한 형식)
+        """
+        try:
+            if not self._symbols:
+                return {'total_var': 0, 'max_loss': 0, 'risk_level': 'LOW'}
             
-            return {
-                'total_value': total_value,
-                'total_potential_loss': total_potential_loss,
-                'risk_ratio': risk_ratio,
-                'risk_level': risk_level,
-                'position_count': len(positions)
-            }
+            prices = np.asarray(current_prices, dtype=np.float64)
+            if prices.shape != (len(self._symbols),):
+                raise ValueError(f"가격 배열 크기 불일치: {prices.shape} (포지션 {len(self._symbols)}개)")
+            
+            quoted = ~np.isnan(prices)
+            return self._portfolio_risk_summary(
+                self._arrays['shares'][quoted],
+                self._arrays['stop_loss_price'][quoted],
+                prices[quoted],
+                len(self._symbols)
+            )
             
         except Exception as e:
             self.logger.error(f"Error calculating portfolio risk: {str(e)}")
             return {'total_var': 0, 'max_loss': 0, 'risk_level': 'UNKNOWN'}
+    
+    def _portfolio_risk_summary(self,
+                                shares: np.ndarray,
+                                stop_loss_prices: np.ndarray,
+                                prices: np.ndarray,
+                                position_count: int) -> Dict[str, Any]:
+        """보유 수량/손절가/현재가 배열로 포트폴리오 리스크 지표 계산"""
+        total_value = float(np.dot(shares, prices))
+        # 손실만 계산 (손절가까지 하락 시 손실액)
+        total_potential_loss = float(np.maximum(0.0, shares * (prices - stop_loss_prices)).sum())
+        
+        # 리스크 수준 계산
+        risk_ratio = total_potential_loss / total_value if total_value > 0 else 0
+        
+        if risk_ratio > 0.15:
+            risk_level = 'HIGH'
+        elif risk_ratio > 0.08:
+            risk_level = 'MEDIUM'
+        else:
+            risk_level = 'LOW'
+        
+        return {
+            'total_value': total_value,
+            'total_potential_loss': total_potential_loss,
+            'risk_ratio': risk_ratio,
+            'risk_level': risk_level,
+            'position_count': position_count
+        }
 
 
 def main():
@@ -391,6 +578,26 @@ def main():
         print(f"   손절가: {position['stop_loss_price']:,.0f}원")
         print(f"   익절가: {position['take_profit_price']:,.0f}원")
     
+    # 일괄 매도 조건 테스트
+    print("\n5. 일괄 매도 조건 테스트")
+    risk_manager.set_position_stops(
+        symbol='000660.KS',
+        entry_price=120000,
+        entry_date=datetime.now(),
+        shares=5,
+        signal_confidence=0.6
+    )
+    
+    symbols = risk_manager.get_position_symbols()
+    test_prices = {'005930.KS': 58000, '000660.KS': 125000}  # 손절 / 유지
+    reason_codes = risk_manager.check_exit_conditions_batch(
+        np.array([test_prices[symbol] for symbol in symbols]),
+        datetime.now()
+    )
+    for symbol, code in zip(symbols, reason_codes):
+        reason = risk_manager.EXIT_REASONS[code] if code >= 0 else ''
+        print(f"   {symbol} 가격 {test_prices[symbol]:,}원: 매도={code >= 0}, 사유={reason}")
+    
     print("\n=== 테스트 완료 ===")
 
 if __name__ == "__main__":
@@ -10,12 +10,117 @@ from datetime import datetime
 import sys
 import os
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터 대체 (순수 파이썬 실행)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 from src.trading_signals.signal_integrator import SignalIntegrator
 from src.institutional_data.institutional_signal_analyzer import InstitutionalSignalAnalyzer
 
+# 지표 점수 컬럼과 신호 방향 판정 임계값 (점수 > 임계값: 매수, < -임계값: 매도)
+_SCORE_THRESHOLDS = (
+    ('ma_score', 0.3),
+    ('rsi_score', 0.5),
+    ('macd_score', 0.3),
+    ('bb_score', 0.3),
+    ('volume_score', 0.3),
+    ('stoch_score', 0.3),
+)
+_INSTITUTIONAL_THRESHOLD = 0.2
+
+
+@njit(parallel=True, cache=True)
+def _weighted_strength(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    가중 평균 신호 강도 (지표 순서대로 누적, 행 단위 병렬)
+    
+    Args:
+        scores: (T, k) 지표 점수 배열
+        weights: (k,) 지표 가중치
+    """
+    n, k = scores.shape
+    strength = np.empty(n)
+    
+    for i in prange(n):
+        weighted = scores[i, 0] * weights[0]
+        for j in range(1, k):
+            weighted += scores[i, j] * weights[j]
+        strength[i] = weighted
+    
+    return strength
+
+
+@njit(parallel=True, cache=True)
+def _score_signals(scores: np.ndarray,
+                   strength: np.ndarray,
+                   thresholds: np.ndarray,
+                   institutional_confidence: np.ndarray,
+                   min_indicators: int):
+    """
+    행별 통합 신호 판정 (가중 점수 + 동의 지표 수, 행 단위 병렬)
+    
+    Args:
+        scores: (T, k) 지표 점수 배열
+        strength: (T,) 가중 평균 신호 강도
+        thresholds: (k,) 지표별 신호 방향 임계값
+        institutional_confidence: (T,) 기관 신호 신뢰도 (0.7 초과 시 필요 지표 수 1개 완화)
+        min_indicators: 최소 동의 지표 수
+        
+    Returns:
+        (매수 신호, 매도 신호, 동의 지표 수, 신뢰도) 배열
+    """
+    n, k = scores.shape
+    buy = np.zeros(n, dtype=np.int64)
+    sell = np.zeros(n, dtype=np.int64)
+    agreeing = np.zeros(n, dtype=np.int64)
+    confidence = np.zeros(n)
+    
+    for i in prange(n):
+        weighted = strength[i]
+        
+        # 매수·매도 방향에 동의하는 지표 수
+        buy_signals = 0
+        sell_signals = 0
+        for j in range(k):
+            if scores[i, j] > thresholds[j]:
+                buy_signals += 1
+            elif scores[i, j] < -thresholds[j]:
+                sell_signals += 1
+        
+        # 기관 신호 보너스 (신뢰도가 높으면 필요 지표 수 완화)
+        bonus = 1 if institutional_confidence[i] > 0.7 else 0
+        required = max(2, min_indicators - bonus)
+        
+        if buy_signals >= required and weighted > 0.5:
+            buy[i] = 1
+            agreeing[i] = buy_signals
+        elif sell_signals >= required and weighted < -0.5:
+            sell[i] = 1
+            agreeing[i] = sell_signals
+        else:
+            continue
+        
+        # 신뢰도 계산 (기관 신호 신뢰도 보너스 포함)
+        base_confidence = min(0.95, 0.6 + (agreeing[i] - 2) * 0.1)
+        if bonus > 0:
+            base_confidence = min(0.98, base_confidence + 0.1)
+        confidence[i] = base_confidence
+    
+    return buy, sell, agreeing, confidence
+
+
 class EnhancedSignalIntegrator(SignalIntegrator):
     """향상된 다중 지표 신호 통합기 - 기술적 지표 + 기관·외국인 매매 동향"""
     
@@ -148,12 +253,25 @@ class EnhancedSignalIntegrator(SignalIntegrator):
             self.logger.error(f"Error calculating enhanced signal scores: {str(e)}")
             return data
     
-    def generate_integrated_signals_enhanced(self, data: pd.DataFrame) -> pd.DataFrame:
+    def signal_score_columns(self, data: pd.DataFrame) -> List[str]:
+        """통합 신호에 쓰이는 지표 점수 컬럼 (기관 신호는 점수가 있을 때만 포함, indicator_weights 키 + '_score')"""
+        score_columns = [column for column, _ in _SCORE_THRESHOLDS]
+        
+        if self.use_institutional_signals and 'institutional_score' in data.columns:
+            score_columns.append('institutional_score')
+        
+        return score_columns
+    
+    def generate_integrated_signals_enhanced(self,
+                                           data: pd.DataFrame,
+                                           strength: Optional[np.ndarray] = None) -> pd.DataFrame:
         """
         통합 매매 신호 생성 (기관 신호 포함)
         
         Args:
             data: 신호 점수가 계산된 데이터
+            strength: 미리 계산한 가중 평균 신호 강도 (None이면 indicator_weights로 계산,
+                      여러 가중치 조합을 행렬곱으로 한 번에 계산할 때 사용)
             
         Returns:
             통합 신호가 추가된 DataFrame
@@ -161,95 +279,47 @@ class EnhancedSignalIntegrator(SignalIntegrator):
         try:
             result = data.copy()
             
-            # 통합 신호 초기화
-            result['integrated_buy_signal'] = 0
-            result['integrated_sell_signal'] = 0
-            result['integrated_strength'] = 0.0
-            result['integrated_confidence'] = 0.0
-            result['agreeing_indicators'] = 0
-            result['signal_quality'] = 'NONE'
+            # 지표 점수 행렬과 임계값 (기관 신호는 점수가 있을 때만 포함)
+            score_columns = self.signal_score_columns(result)
+            thresholds = [threshold for _, threshold in _SCORE_THRESHOLDS]
+            thresholds += [_INSTITUTIONAL_THRESHOLD] * (len(score_columns) - len(thresholds))
             
-            # 각 지표의 신호 방향 계산 (1: 매수, -1: 매도, 0: 중립)
-            indicator_signals_dict = {
-                'ma_signal': np.where(result['ma_score'] > 0.3, 1, np.where(result['ma_score'] < -0.3, -1, 0)),
-                'rsi_signal': np.where(result['rsi_score'] > 0.5, 1, np.where(result['rsi_score'] < -0.5, -1, 0)),
-                'macd_signal': np.where(result['macd_score'] > 0.3, 1, np.where(result['macd_score'] < -0.3, -1, 0)),
-                'bb_signal': np.where(result['bb_score'] > 0.3, 1, np.where(result['bb_score'] < -0.3, -1, 0)),
-                'volume_signal': np.where(result['volume_score'] > 0.3, 1, np.where(result['volume_score'] < -0.3, -1, 0)),
-                'stoch_signal': np.where(result['stoch_score'] > 0.3, 1, np.where(result['stoch_score'] < -0.3, -1, 0))
-            }
+            total_indicators = len(score_columns)
+            scores = result[score_columns].to_numpy(dtype=np.float64)
             
-            # 기관 신호 추가
-            if self.use_institutional_signals and 'institutional_score' in result.columns:
-                indicator_signals_dict['institutional_signal'] = np.where(
-                    result['institutional_score'] > 0.2, 1, 
-                    np.where(result['institutional_score'] < -0.2, -1, 0)
-                )
+            # 가중 평균 신호 강도
+            if strength is None:
+                weights = [self.indicator_weights[column[:-len('_score')]] for column in score_columns]
+                strength = _weighted_strength(scores, np.asarray(weights, dtype=np.float64))
             
-            indicator_signals = pd.DataFrame(indicator_signals_dict)
+            # 기관 신호 신뢰도 (보너스 판정용, 없으면 0)
+            if self.use_institutional_signals and 'institutional_confidence' in result.columns:
+                institutional_confidence = result['institutional_confidence'].to_numpy(dtype=np.float64)
+            else:
+                institutional_confidence = np.zeros(len(result))
             
-            # 가중 평균 신호 강도 계산
-            weighted_score = (
-                result['ma_score'] * self.indicator_weights['ma'] +
-                result['rsi_score'] * self.indicator_weights['rsi'] +
-                result['macd_score'] * self.indicator_weights['macd'] +
-                result['bb_score'] * self.indicator_weights['bb'] +
-                result['volume_score'] * self.indicator_weights['volume'] +
-                result['stoch_score'] * self.indicator_weights['stoch']
+            # 행별 신호 판정 (numba 커널, 미설치 시 같은 코드를 파이썬으로 실행)
+            buy, sell, agreeing, confidence = _score_signals(
+                scores,
+                np.asarray(strength, dtype=np.float64),
+                np.asarray(thresholds, dtype=np.float64),
+                institutional_confidence,
+                self.min_indicators
             )
             
-            # 기관 신호 가중치 추가
-            if self.use_institutional_signals and 'institutional_score' in result.columns:
-                weighted_score += result['institutional_score'] * self.indicator_weights['institutional']
-            
-            result['integrated_strength'] = weighted_score
-            
-            # 각 행별로 동의하는 지표 수 계산
-            total_indicators = len(indicator_signals.columns)
+            result['integrated_buy_signal'] = buy
+            result['integrated_sell_signal'] = sell
+            result['integrated_strength'] = strength
+            result['integrated_confidence'] = confidence
+            result['agreeing_indicators'] = agreeing
             
-            for idx in result.index:
-                buy_signals = (indicator_signals.loc[idx] == 1).sum()
-                sell_signals = (indicator_signals.loc[idx] == -1).sum()
-                
-                # 기관 신호 보너스 (신뢰도가 높으면 추가 가중치)
-                institutional_bonus = 0
-                if (self.use_institutional_signals and 
-                    'institutional_confidence' in result.columns):
-                    inst_conf = result.loc[idx, 'institutional_confidence']
-                    if inst_conf > 0.7:
-                        institutional_bonus = 1
-                
-                # 매수 신호 조건 (기관 신호 고려)
-                required_indicators = max(2, self.min_indicators - institutional_bonus)
-                
-                if buy_signals >= required_indicators and weighted_score.loc[idx] > 0.5:
-                    result.loc[idx, 'integrated_buy_signal'] = 1
-                    result.loc[idx, 'agreeing_indicators'] = buy_signals
-                    
-                    # 신뢰도 계산 (기관 신호 신뢰도 보너스 포함)
-                    base_confidence = min(0.95, 0.6 + (buy_signals - 2) * 0.1)
-                    if institutional_bonus > 0:
-                        base_confidence = min(0.98, base_confidence + 0.1)
-                    
-                    result.loc[idx, 'integrated_confidence'] = base_confidence
-                    result.loc[idx, 'signal_quality'] = self._get_signal_quality_enhanced(
-                        buy_signals, weighted_score.loc[idx], total_indicators
-                    )
-                
-                # 매도 신호 조건
-                elif sell_signals >= required_indicators and weighted_score.loc[idx] < -0.5:
-                    result.loc[idx, 'integrated_sell_signal'] = 1
-                    result.loc[idx, 'agreeing_indicators'] = sell_signals
-                    
-                    # 신뢰도 계산
-                    base_confidence = min(0.95, 0.6 + (sell_signals - 2) * 0.1)
-                    if institutional_bonus > 0:
-                        base_confidence = min(0.98, base_confidence + 0.1)
-                    
-                    result.loc[idx, 'integrated_confidence'] = base_confidence
-                    result.loc[idx, 'signal_quality'] = self._get_signal_quality_enhanced(
-                        sell_signals, abs(weighted_score.loc[idx]), total_indicators
-                    )
+            # 신호 품질은 신호가 발생한 행만 분류
+            signal_quality = np.full(len(result), 'NONE', dtype=object)
+            for i in np.flatnonzero(buy | sell):
+                signal_quality[i] = self._get_signal_quality_enhanced(
+                    int(agreeing[i]), abs(strength[i]), total_indicators
+                )
+            result['signal_quality'] = signal_quality
             
             # 시장 상황에 따른 신호 강도 조정
             if self.use_market_condition and 'market_condition' in result.columns: